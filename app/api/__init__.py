@@ -75,3 +75,21 @@ router.include_router(
 )
 router.include_router(files_router, prefix="/files", tags=["files"])
 router.include_router(search_router, prefix="/search", tags=["search"])
+
+
+# Маршруты, которые не принимают файлы (для них действует более строгий лимит тела запроса)
+JSON_ONLY_PREFIXES = (
+    "/auth",
+    "/users",
+    "/subscribers",
+    "/polls",
+    "/email-templates",
+    "/files",
+    "/search",
+)
+
+# Маршруты пакетной загрузки, принимающие несколько файлов в одном запросе
+BATCH_UPLOAD_PATHS = (
+    "/soviet-section/online-conference/participants/batch/",
+    "/soviet-section/competition/documents/batch/",
+)
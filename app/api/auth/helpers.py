@@ -1,12 +1,23 @@
+import time
+import uuid
+from collections import OrderedDict
 from datetime import timedelta
 
+from sqlalchemy import select
+
 from core.config import settings
+from core.db_helper import db_helper
+from core.models import User
 from security import utils as security_utils
 
 
 TOKEN_TYPE_ACCESS = "access"
 TOKEN_TYPE_REFRESH = "refresh"
 
+# Версии токенов пользователей из БД (user_id -> (token_version, срок хранения)).
+# Короткий LRU кэш избавляет от запроса к БД на каждый запрос с access токеном
+_token_versions: OrderedDict[str, tuple[int, float]] = OrderedDict()
+
 
 def create_jwt_without_type(
     payload: dict,
@@ -52,3 +63,54 @@ def check_jwt(
         public_key=public_key,
         algorithm=algorithm,
     )
+
+
+def remember_token_version(user_id: uuid.UUID | str, token_version: int):
+    expires_at = time.monotonic() + settings.auth.token_version_cache_seconds
+    _token_versions[str(user_id)] = (token_version, expires_at)
+    _token_versions.move_to_end(str(user_id))
+    if len(_token_versions) > settings.auth.token_version_cache_size:
+        _token_versions.popitem(last=False)
+
+
+async def get_token_version(user_id: uuid.UUID | str) -> int | None:
+    """Актуальная версия токенов пользователя (None - пользователя нет)"""
+    cached = _token_versions.get(str(user_id))
+    if cached is not None and cached[1] > time.monotonic():
+        _token_versions.move_to_end(str(user_id))
+        return cached[0]
+
+    async with db_helper.session_factory() as session:
+        token_version = await session.scalar(
+            select(User.token_version).where(User.id == uuid.UUID(str(user_id)))
+        )
+
+    if token_version is None:
+        _token_versions.pop(str(user_id), None)
+        return None
+
+    remember_token_version(user_id=user_id, token_version=token_version)
+    return token_version
+
+
+async def is_token_version_actual(
+    user_id: uuid.UUID | str,
+    token_version: int,
+) -> bool:
+    actual_version = await get_token_version(user_id=user_id)
+    return actual_version is not None and token_version == actual_version
+
+
+def create_access_token(user: User) -> str:
+    # Роль и активность пользователя кладем в токен, чтобы не ходить за ними в БД
+    remember_token_version(user_id=user.id, token_version=user.token_version)
+
+    return create_jwt(
+        payload={
+            "sub": str(user.id),
+            "role": user.role,
+            "is_active": user.is_active,
+            "ver": user.token_version,
+        },
+        token_type=TOKEN_TYPE_ACCESS,
+    )
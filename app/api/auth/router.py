@@ -9,16 +9,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from core.config import settings
 from core.db_helper import db_helper
 from core.email.service import email_service
-from core.models import User
 from api.auth.helpers import (
-    create_jwt_without_type,
     create_jwt,
+    create_access_token,
     check_jwt,
-    TOKEN_TYPE_ACCESS,
     TOKEN_TYPE_REFRESH,
 )
 from api.auth import repository
-from api.dependencies import get_current_admin
+from api.dependencies import get_current_admin_claims
 from api.users import repository as users_crud
 from api.users.schemas import UserResponse
 from api.auth.schemas import (
@@ -26,6 +24,7 @@ from api.auth.schemas import (
     UserChangePassword,
     TokenInfo,
     RefreshTokenCreate,
+    AccessTokenClaims,
 )
 from api.auth.dependencies import (
     get_refresh_token_payload,
@@ -68,7 +67,7 @@ async def register_user(
 @router.post("/send-register-invitation/")
 async def send_register_invitation(
     email: str,
-    admin: User = Depends(get_current_admin),
+    admin: AccessTokenClaims = Depends(get_current_admin_claims),
     session: AsyncSession = Depends(db_helper.session_getter),
 ):
     # Проверяем, существует ли активный пользователь
@@ -80,15 +79,13 @@ async def send_register_invitation(
             detail="User already exists and is active",
         )
 
-    # Отправляем приглашение без создания пользователя в базе
-    register_invitation_token = create_jwt_without_type(
-        payload={"email": email},
-    )
-
-    await email_service.send_register_invitation(
+    # Отправляем приглашение без создания пользователя в базе.
+    # Письмо отправит воркер очереди, запрос не ждет почтовый сервер
+    email_service.queue_register_invitation(
+        session=session,
         email=email,
-        token=register_invitation_token,
     )
+    await session.commit()
 
     return {"message": "Invitation sent"}
 
@@ -120,12 +117,7 @@ async def login_user(
         )
 
     # Выпускаем новые access и refresh токены
-    access_token = create_jwt(
-        payload={
-            "sub": str(user.id),
-        },
-        token_type=TOKEN_TYPE_ACCESS,
-    )
+    access_token = create_access_token(user=user)
     refresh_token_jti = uuid.uuid4()
 
     refresh_token = create_jwt(
@@ -207,12 +199,7 @@ async def refresh_tokens(
     await repository.revoke_refresh_token(session=session, jti=jti)
 
     # Выпускаем новые access и refresh токены
-    access_token = create_jwt(
-        payload={
-            "sub": str(user.id),
-        },
-        token_type=TOKEN_TYPE_ACCESS,
-    )
+    access_token = create_access_token(user=user)
     refresh_token_jti = uuid.uuid4()
 
     refresh_token = create_jwt(
@@ -278,18 +265,12 @@ async def change_password(
             detail="User not found or inactive",
         )
 
-    token = create_jwt_without_type(
-        payload={
-            "sub": str(user.id),
-            "email": user.email,
-        },
-        expire_minutes=settings.auth.changing_password_token_expire_minutes,
-    )
-
-    await email_service.send_changing_password_url(
+    email_service.queue_changing_password_url(
+        session=session,
         email=user.email,
-        token=token,
+        user_id=user.id,
     )
+    await session.commit()
 
 
 @router.post("/confirm-changing-password/", response_model=UserResponse)
@@ -22,6 +22,13 @@ class TokenInfo(BaseModel):
     token_type: str = "Bearer"
 
 
+class AccessTokenClaims(BaseModel):
+    sub: uuid.UUID
+    role: str
+    is_active: bool
+    ver: int
+
+
 class RefreshTokenCreate(BaseModel):
     jti: uuid.UUID
     user_agent: str | None = None
@@ -37,6 +37,7 @@ async def create_banner(
     image_url = await file_service.save_file(
         upload_file=image,
         subdirectory=BANNERS_IMAGES_FOLDER,
+        session=session,
     )
 
     banner = await banner_repo.create(
@@ -112,8 +113,10 @@ async def update_banner(
     image_url = None
 
     if image:
-        await file_service.delete_file(current_banner.image_url)
-        image_url = await file_service.save_file(image, BANNERS_IMAGES_FOLDER)
+        await file_service.delete_file(current_banner.image_url, session=session)
+        image_url = await file_service.save_file(
+            image, BANNERS_IMAGES_FOLDER, session=session
+        )
 
     banner = await banner_repo.update(
         obj_id=banner_id,
@@ -141,7 +144,7 @@ async def delete_banner(
             detail="Banner not found",
         )
 
-    await file_service.delete_file(current_banner.image_url)
+    await file_service.delete_file(current_banner.image_url, session=session)
     deleted = await banner_repo.delete(banner_id)
     if not deleted:
         raise HTTPException(
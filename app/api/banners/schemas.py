@@ -31,6 +31,11 @@ class BannerUpdate(BannerBase):
 
 class BannerResponse(BannerBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
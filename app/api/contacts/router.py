@@ -66,6 +66,7 @@ async def create_contact(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     # Создаем запись о контакте
@@ -119,11 +120,12 @@ async def update_contact(
     if image:
         # Удаляем старое изображение
         if current_contact.image_url:
-            await file_service.delete_file(current_contact.image_url)
+            await file_service.delete_file(current_contact.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о контакте
@@ -163,7 +165,7 @@ async def delete_contact(
 
     # Удаляем изображение
     if current_contact.image_url:
-        await file_service.delete_file(current_contact.image_url)
+        await file_service.delete_file(current_contact.image_url, session=session)
 
     # Удаляем запись о контакте
     deleted = await contact_repo.delete(contact_id)
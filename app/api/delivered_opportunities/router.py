@@ -61,6 +61,7 @@ async def create_delivered_opportunity(
         image_url = await file_service.save_file(
             upload_file=image_file,
             subdirectory=DELIVERED_OPPORTUNITIES_FOLDER,
+            session=session,
         )
 
     # Создаем запись о доставляемой возможности
@@ -106,11 +107,14 @@ async def update_delivered_opportunity(
     if image_file:
         # Удаляем старое изображение
         if current_delivered_opportunity.image_url:
-            await file_service.delete_file(current_delivered_opportunity.image_url)
+            await file_service.delete_file(
+                current_delivered_opportunity.image_url, session=session
+            )
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image_file,
             subdirectory=DELIVERED_OPPORTUNITIES_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о доставляемой возможности
@@ -147,7 +151,9 @@ async def delete_delivered_opportunity(
 
     # Удаляем изображение
     if current_delivered_opportunity.image_url:
-        await file_service.delete_file(current_delivered_opportunity.image_url)
+        await file_service.delete_file(
+            current_delivered_opportunity.image_url, session=session
+        )
 
     # Удаляем запись о доставляемой возможности
     deleted = await del_op_repo.delete(delivered_opportunity_id)
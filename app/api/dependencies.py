@@ -6,6 +6,8 @@ from fastapi.security import OAuth2PasswordBearer
 from core.models.user import User, ADMIN_ROLE
 from core.db_helper import db_helper
 from api.users.repository import get_user_by_id
+from api.auth.helpers import TOKEN_TYPE_ACCESS, is_token_version_actual
+from api.auth.schemas import AccessTokenClaims
 from security import utils as security_utils
 
 oauth2_scheme = OAuth2PasswordBearer(
@@ -89,7 +91,68 @@ async def get_current_admin(
     return user
 
 
+async def _parse_access_token_claims(token: str) -> AccessTokenClaims:
+    payload = security_utils.decode_jwt(token=token)
+    if payload.get("type") != TOKEN_TYPE_ACCESS:
+        raise InvalidTokenError("Not an access token")
+
+    claims = AccessTokenClaims.model_validate(payload)
+    if not await is_token_version_actual(user_id=claims.sub, token_version=claims.ver):
+        raise InvalidTokenError("Token version is outdated")
+
+    return claims
+
+
+async def get_token_claims_optional(
+    token: str | None = Depends(oauth2_scheme_optional),
+) -> AccessTokenClaims | None:
+    if not token:
+        return None
+
+    try:
+        return await _parse_access_token_claims(token=token)
+    except (ExpiredSignatureError, InvalidTokenError, ValueError):
+        return None
+
+
+async def get_token_claims(
+    token: str = Depends(oauth2_scheme),
+) -> AccessTokenClaims:
+    try:
+        return await _parse_access_token_claims(token=token)
+
+    except ExpiredSignatureError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Confirmation token expired",
+        )
+    except (InvalidTokenError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid token",
+        )
+
+
+async def get_current_admin_claims(
+    claims: AccessTokenClaims = Depends(get_token_claims),
+) -> AccessTokenClaims:
+    # Проверка прав только по данным токена, без запроса пользователя из БД
+    if not claims.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User not active",
+        )
+
+    if claims.role != ADMIN_ROLE:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Permission denied",
+        )
+
+    return claims
+
+
 async def verify_active_param_access(
-    user: User | None = Depends(get_current_active_user_optional),
+    claims: AccessTokenClaims | None = Depends(get_token_claims_optional),
 ) -> bool:
-    return user is None
+    return claims is None or not claims.is_active
@@ -54,6 +54,7 @@ async def create_document(
     file_url = await file_service.save_file(
         upload_file=file,
         subdirectory=DOCUMENTS_FOLDER,
+        session=session,
     )
 
     # Создаем запись о документе
@@ -86,11 +87,12 @@ async def update_document(
     file_url = None
     if file:
         # Удаляем старый файл
-        await file_service.delete_file(current_document.file_url)
+        await file_service.delete_file(current_document.file_url, session=session)
         # Сохраняем новый файл
         file_url = await file_service.save_file(
             upload_file=file,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о документе
@@ -119,7 +121,7 @@ async def delete_document(
         )
 
     # Удаляем файл
-    await file_service.delete_file(current_document.file_url)
+    await file_service.delete_file(current_document.file_url, session=session)
 
     # Удаляем запись о документе
     deleted = await doc_repo.delete(document_id)
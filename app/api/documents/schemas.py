@@ -22,6 +22,10 @@ class DocumentUpdate(DocumentBase):
 
 class DocumentResponse(DocumentBase):
     id: uuid.UUID
+    # Миниатюра первой страницы, количество страниц и размер файла
+    thumbnail_url: str | None = None
+    page_count: int | None = None
+    file_size: int | None = None
 
     class Config:
         from_attributes = True
@@ -9,6 +9,7 @@ from core.email.template_service import (
     REGISTER_INVITATION_TEMPLATE_NAME,
     CONFIRMATION_SUBSCRIPTION_TEMPLATE_NAME,
     MAILING_TEMPLATE_NAME,
+    DIGEST_TEMPLATE_NAME,
 )
 from api.dependencies import get_current_active_user
 from api.email_templates.schemas import EmailTemplateUpdate
@@ -82,6 +83,17 @@ async def get_mailing_template(
     return template_content
 
 
+@router.get("/digest/")
+async def get_digest_template(
+    user: User = Depends(get_current_active_user),
+):
+    template_content = await email_template_service.get_template_content(
+        DIGEST_TEMPLATE_NAME,
+    )
+
+    return template_content
+
+
 @router.patch("/changing-password/")
 async def update_changing_password_template(
     template_in: EmailTemplateUpdate,
@@ -148,3 +160,15 @@ async def update_mailing_template(
         template_name=MAILING_TEMPLATE_NAME,
     )
     return new_template
+
+
+@router.patch("/digest/")
+async def update_digest_template(
+    template_in: EmailTemplateUpdate,
+    user: User = Depends(get_current_active_user),
+):
+    new_template = await email_template_service.update_template_content(
+        template_in,
+        template_name=DIGEST_TEMPLATE_NAME,
+    )
+    return new_template
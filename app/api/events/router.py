@@ -62,6 +62,7 @@ async def create_event(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=EVENTS_IMAGES_FOLDER,
+            session=session,
         )
 
     # Создаем запись о мероприятии
@@ -103,11 +104,12 @@ async def update_event(
     if image:
         # Удаляем старое изображение
         if current_event.image_url:
-            await file_service.delete_file(current_event.image_url)
+            await file_service.delete_file(current_event.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=EVENTS_IMAGES_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о мероприятии
@@ -141,7 +143,7 @@ async def delete_event(
 
     # Удаляем изображение
     if current_event.image_url:
-        await file_service.delete_file(current_event.image_url)
+        await file_service.delete_file(current_event.image_url, session=session)
 
     # Удаляем запись о мероприятии
     deleted = await event_repo.delete(event_id)
@@ -63,6 +63,7 @@ async def create_feedback(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=FEEDBACKS_IMAGES_FOLDER,
+            session=session,
         )
 
     # Создаем запись об обратной связи
@@ -102,11 +103,12 @@ async def update_feedback(
     if image:
         # Удаляем старое изображение
         if current_feedback.image_url:
-            await file_service.delete_file(current_feedback.image_url)
+            await file_service.delete_file(current_feedback.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=FEEDBACKS_IMAGES_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию об обратной связи
@@ -139,7 +141,7 @@ async def delete_feedback(
 
     # Удаляем изображение
     if current_feedback.image_url:
-        await file_service.delete_file(current_feedback.image_url)
+        await file_service.delete_file(current_feedback.image_url, session=session)
 
     # Удаляем запись об обратной связи
     deleted = await feedback_repo.delete(feedback_id)
@@ -1,50 +1,226 @@
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import FileResponse
+import os
+import stat
+from typing import Annotated
+from urllib.parse import quote
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+
+from fastapi import APIRouter, HTTPException, status, Query, Request
+from fastapi.responses import (
+    FileResponse,
+    JSONResponse,
+    Response,
+    RedirectResponse,
+)
+from starlette.types import Receive, Scope, Send
 
 from core.config import settings
+from core.file.image_variants import image_variant_service
+from core.file.stat_cache import file_stat_cache
+from core.file.storage import storage
+from core.file.mime import get_media_type, is_active_media_type
+from core.file.compression import is_compressible, select_compressed
 
 router = APIRouter()
 
+UPLOADS_DIR = settings.file.uploads_dir.resolve()
 
-@router.get("/{file_path:path}/")
-async def get_file(file_path: str):
-    full_file_path = settings.file.uploads_dir / file_path
+# Имена загруженных файлов уникальны и не меняются, поэтому их можно кешировать навсегда
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Оригинал вместо еще не созданной уменьшенной копии кешируется ненадолго,
+# чтобы после появления копии клиент получил ее по тому же адресу
+VARIANT_FALLBACK_CACHE_CONTROL = "public, max-age=300"
+
+
+class _UploadedFileResponse(FileResponse):
+    """
+    Отдача загруженного файла, метаданные которого могли быть взяты из кеша
+
+    Кеш сбрасывается только в процессе, удалившем файл, поэтому перед
+    отправкой заголовков файл открывается: если его уже нет, клиент
+    получает 404, а не оборванный ответ с ошибкой 500
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            os.close(os.open(self.path, os.O_RDONLY))
+        except OSError:
+            file_stat_cache.invalidate(Path(self.path))
+            response = JSONResponse(
+                {"detail": "File not found"},
+                status_code=status.HTTP_404_NOT_FOUND,
+            )
+            return await response(scope, receive, send)
+
+        await super().__call__(scope, receive, send)
+
+
+def _get_file_stat(full_file_path: Path) -> os.stat_result:
+    stat_result = file_stat_cache.get(full_file_path)
+    if stat_result is not None:
+        return stat_result
 
     try:
-        full_file_path.resolve().relative_to(settings.file.uploads_dir.resolve())
+        full_file_path.resolve().relative_to(UPLOADS_DIR)
     except ValueError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid file path",
         )
 
-    if not full_file_path.exists():
+    try:
+        stat_result = full_file_path.stat()
+    except OSError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="File not found",
         )
 
-    if not full_file_path.is_file():
+    if not stat.S_ISREG(stat_result.st_mode):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Not a file",
         )
 
+    file_stat_cache.put(full_file_path, stat_result)
+    return stat_result
+
+
+def _is_not_modified(request: Request, etag: str, stat_result: os.stat_result) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in etags or etag in etags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            modified_since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(stat_result.st_mtime) <= modified_since
+
+    return False
+
+
+def _offload_response(
+    full_file_path: Path,
+    media_type: str,
+    content_disposition_type: str,
+    headers: dict[str, str],
+) -> Response:
+    """Передача отдачи файла reverse proxy (nginx/apache отдают файл через sendfile)"""
+    # Путь без ".." и ссылок, чтобы proxy не получил путь за пределами загрузок
+    resolved_path = full_file_path.resolve()
+    try:
+        relative_path = resolved_path.relative_to(UPLOADS_DIR)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid file path",
+        )
+
+    if settings.file.offload_mode == "x-accel-redirect":
+        headers["X-Accel-Redirect"] = settings.file.offload_internal_prefix + quote(
+            relative_path.as_posix()
+        )
+    else:
+        headers["X-Sendfile"] = str(resolved_path)
+
+    headers["Content-Disposition"] = (
+        f'{content_disposition_type}; filename="{full_file_path.name}"'
+    )
+    return Response(media_type=media_type, headers=headers)
+
+
+@router.get("/{file_path:path}/")
+async def get_file(
+    file_path: str,
+    request: Request,
+    w: Annotated[int | None, Query(ge=1)] = None,  # Желаемая ширина изображения
+):
+    # Внешнее хранилище отдает файл напрямую по подписанной ссылке
+    file_url = await storage.get_url(file_path)
+    if file_url:
+        return RedirectResponse(
+            file_url,
+            status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+            headers={"Cache-Control": "private, max-age=300"},
+        )
+
+    full_file_path = settings.file.uploads_dir / file_path
+    stat_result = _get_file_stat(full_file_path)
+
+    # Подбираем уменьшенную копию изображения под ширину и форматы клиента
+    headers = {"Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    # Заголовки запроса, от которых зависит ответ
+    vary = []
+    if w:
+        variant_path = image_variant_service.select_variant(
+            full_file_path,
+            width=w,
+            accept=request.headers.get("accept", ""),
+        )
+        variant_stat = (
+            file_stat_cache.stat(variant_path)
+            if variant_path != full_file_path
+            else None
+        )
+        if variant_stat is not None:
+            full_file_path, stat_result = variant_path, variant_stat
+        else:
+            headers["Cache-Control"] = VARIANT_FALLBACK_CACHE_CONTROL
+        vary.append("Accept")
+
+    # Для текстовых форматов отдаем заранее сжатую копию (в режиме offload
+    # это делает сам proxy, например через gzip_static)
+    original_path = full_file_path
+    if is_compressible(full_file_path):
+        vary.append("Accept-Encoding")
+        if settings.file.offload_mode == "none":
+            compressed_path, encoding = select_compressed(
+                full_file_path,
+                accept_encoding=request.headers.get("accept-encoding", ""),
+            )
+            compressed_stat = (
+                file_stat_cache.stat(compressed_path) if encoding else None
+            )
+            if compressed_stat is not None:
+                full_file_path, stat_result = compressed_path, compressed_stat
+                headers["Content-Encoding"] = encoding
+
+    if vary:
+        headers["Vary"] = ", ".join(vary)
+
+    # Файлы не изменяются, поэтому размер и время изменения однозначно определяют содержимое
+    etag = f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+    headers["ETag"] = etag
+    headers["Last-Modified"] = formatdate(stat_result.st_mtime, usegmt=True)
+
+    if _is_not_modified(request, etag, stat_result):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
     # Определяем MIME тип
-    extension = full_file_path.suffix.lower()
-    media_types = {
-        ".jpg": "image/jpeg",
-        ".jpeg": "image/jpeg",
-        ".png": "image/png",
-        ".webp": "image/webp",
-        ".gif": "image/gif",
-        ".svg": "image/svg+xml",
-    }
-
-    media_type = media_types.get(extension, "application/octet-stream")
-
-    return FileResponse(
+    media_type = get_media_type(original_path)
+
+    # PDF и изображения открываются в браузере, а SVG, HTML и текст только
+    # скачиваются, чтобы скрипты из файла не выполнялись на нашем домене
+    content_disposition_type = "inline"
+    if is_active_media_type(media_type):
+        content_disposition_type = "attachment"
+        headers["Content-Security-Policy"] = "sandbox"
+
+    if settings.file.offload_mode != "none":
+        return _offload_response(
+            full_file_path, media_type, content_disposition_type, headers
+        )
+
+    # FileResponse сам обрабатывает заголовок Range (частичная отдача PDF и медиа)
+    return _UploadedFileResponse(
         full_file_path,
         media_type=media_type,
-        filename=full_file_path.name,
+        filename=original_path.name,
+        content_disposition_type=content_disposition_type,
+        headers=headers,
+        stat_result=stat_result,
     )
@@ -59,6 +59,7 @@ async def create_manager(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=MANAGERS_IMAGES_FOLDER,
+            session=session,
         )
 
     # Создаем запись о руководителе
@@ -98,11 +99,12 @@ async def update_manager(
     if image:
         # Удаляем старое изображение
         if current_manager.image_url:
-            await file_service.delete_file(current_manager.image_url)
+            await file_service.delete_file(current_manager.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=MANAGERS_IMAGES_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о руководителе
@@ -135,7 +137,7 @@ async def delete_manager(
 
     # Удаляем изображение
     if current_manager.image_url:
-        await file_service.delete_file(current_manager.image_url)
+        await file_service.delete_file(current_manager.image_url, session=session)
 
     # Удаляем запись о руководителе
     deleted = await manager_repo.delete(manager_id)
@@ -1,7 +1,7 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, Form
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, Form, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.file.service import file_service, NEWS_IMAGES_FOLDER
@@ -9,6 +9,8 @@ from core.models import User
 from core.db_helper import db_helper
 from api.dependencies import get_current_active_user
 from api.news.repository import NewsRepository, NewsTypeRepository
+from api.search.repository import KeywordFacetRepository
+from api.search.schemas import KeywordFacetResponse
 from api.news.schemas import (
     NewsFullResponse,
     NewsPreviewResponse,
@@ -23,13 +25,37 @@ router = APIRouter()
 
 @router.get("/", response_model=list[NewsFullResponse])
 async def get_news(
+    keywords: Annotated[
+        list[str] | None, Query()
+    ] = None,  # Только новости со всеми этими ключевыми словами (опционально)
     session: AsyncSession = Depends(db_helper.session_getter),
 ):
     news_repo = NewsRepository(session)
+    if keywords:
+        return await news_repo.find_by_keywords(keywords)
+
     news = await news_repo.get_all()
     return news
 
 
+@router.get("/keywords/", response_model=list[KeywordFacetResponse])
+async def get_news_keywords(
+    type_id: uuid.UUID | None = None,  # Тип новости (опционально)
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+    session: AsyncSession = Depends(db_helper.session_getter),
+):
+    """Ключевые слова новостей с количеством новостей (для облака тегов)"""
+    facet_repo = KeywordFacetRepository(session)
+    if type_id:
+        return await facet_repo.get_counts(
+            entity_type="news",
+            scope="type_id",
+            scope_value=str(type_id),
+            limit=limit,
+        )
+    return await facet_repo.get_counts(entity_type="news", limit=limit)
+
+
 @router.get("/preview/", response_model=list[NewsPreviewResponse])
 async def get_news_preview(
     skip: int = 0,
@@ -45,6 +71,10 @@ async def get_news_preview(
                 id=news_item.id,
                 image_url=news_item.image_url,
                 min_text=news_item.min_text,
+                image_width=news_item.image_width,
+                image_height=news_item.image_height,
+                image_color=news_item.image_color,
+                image_placeholder=news_item.image_placeholder,
             )
         )
 
@@ -67,6 +97,7 @@ async def create_news(
     image_url = await file_service.save_file(
         upload_file=image,
         subdirectory=NEWS_IMAGES_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+        session=session,
     )
 
     # Создаем запись о новости
@@ -110,11 +141,12 @@ async def update_news(
     image_url = None
     if image:
         # Удаляем старое изображение
-        await file_service.delete_file(current_news.image_url)
+        await file_service.delete_file(current_news.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=NEWS_IMAGES_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     # Обновляем информацию о новости
@@ -148,7 +180,7 @@ async def delete_news(
         )
 
     # Удаляем изображение
-    await file_service.delete_file(current_news.image_url)
+    await file_service.delete_file(current_news.image_url, session=session)
 
     # Удаляем запись о новости
     deleted = await news_repo.delete(news_id)
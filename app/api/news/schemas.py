@@ -24,6 +24,11 @@ class NewsBase(BaseModel):
 
 class NewsFullResponse(NewsBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -33,6 +38,10 @@ class NewsPreviewResponse(BaseModel):
     id: uuid.UUID
     image_url: str
     min_text: str
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
 
 class NewsTypeBase(BaseModel):
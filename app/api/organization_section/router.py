@@ -133,6 +133,7 @@ async def create_support_document(
     file_url = await file_service.save_file(
         upload_file=file,
         subdirectory=DOCUMENTS_FOLDER,
+        session=session,
     )
 
     # Создаем запись о документе
@@ -167,11 +168,12 @@ async def update_support_document(
     file_url = None
     if file:
         # Удаляем старый файл
-        await file_service.delete_file(current_item.file_url)
+        await file_service.delete_file(current_item.file_url, session=session)
         # Сохраняем новый файл
         file_url = await file_service.save_file(
             upload_file=file,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о документе
@@ -200,7 +202,7 @@ async def delete_support_document(
         )
 
     # Удаляем файл
-    await file_service.delete_file(current_item.file_url)
+    await file_service.delete_file(current_item.file_url, session=session)
 
     # Удаляем запись о документе
     deleted = await repo.delete(item_id)
@@ -258,6 +260,7 @@ async def create_support_event(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = OrganizationSupportEventRepository(session)
@@ -300,11 +303,12 @@ async def update_support_event(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о мероприятии
@@ -338,7 +342,7 @@ async def delete_support_event(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о мероприятии
     deleted = await repo.delete(item_id)
@@ -588,6 +592,7 @@ async def create_support_leader(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = OrganizationLeaderRepository(session)
@@ -622,11 +627,12 @@ async def update_support_leader(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о руководителе
@@ -657,7 +663,7 @@ async def delete_support_leader(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о руководителе
     deleted = await repo.delete(item_id)
@@ -709,6 +715,7 @@ async def create_news(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = OrganizationNewsRepository(session)
@@ -745,11 +752,12 @@ async def update_news(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о новости
@@ -781,7 +789,7 @@ async def delete_news(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о новости
     deleted = await repo.delete(item_id)
@@ -945,6 +953,7 @@ async def create_educational_program_document(
     file_url = await file_service.save_file(
         upload_file=file,
         subdirectory=DOCUMENTS_FOLDER,
+        session=session,
     )
 
     # Создаем запись о документе
@@ -980,11 +989,12 @@ async def update_educational_program_document(
     file_url = None
     if file:
         # Удаляем старый файл
-        await file_service.delete_file(current_item.file_url)
+        await file_service.delete_file(current_item.file_url, session=session)
         # Сохраняем новый файл
         file_url = await file_service.save_file(
             upload_file=file,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о документе
@@ -1016,7 +1026,7 @@ async def delete_educational_program_document(
         )
 
     # Удаляем файл
-    await file_service.delete_file(current_item.file_url)
+    await file_service.delete_file(current_item.file_url, session=session)
 
     # Удаляем запись о документе
     deleted = await repo.delete(item_id)
@@ -1179,6 +1189,7 @@ async def create_thematic_meeting_participant(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = OrganizationThematicMeetingParticipantRepository(session)
@@ -1216,11 +1227,12 @@ async def update_thematic_meeting_participant(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию об участнике
@@ -1254,7 +1266,7 @@ async def delete_thematic_meeting_participant(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись об участнике
     deleted = await repo.delete(item_id)
@@ -1319,6 +1331,7 @@ async def create_thematic_meeting_event(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = OrganizationThematicMeetingEventRepository(session)
@@ -1362,11 +1375,12 @@ async def update_thematic_meeting_event(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о мероприятии
@@ -1403,7 +1417,7 @@ async def delete_thematic_meeting_event(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о мероприятии
     deleted = await repo.delete(item_id)
@@ -1465,6 +1479,7 @@ async def create_thematic_meeting_contact(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = OrganizationThematicMeetingContactRepository(session)
@@ -1506,11 +1521,12 @@ async def update_thematic_meeting_contact(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о контакте
@@ -1546,7 +1562,7 @@ async def delete_thematic_meeting_contact(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о контакте
     deleted = await repo.delete(item_id)
@@ -1603,6 +1619,7 @@ async def create_etiquette_in_education_document(
     file_url = await file_service.save_file(
         upload_file=file,
         subdirectory=DOCUMENTS_FOLDER,
+        session=session,
     )
 
     repo = OrganizationEtiquetteInEducationDocumentRepository(session)
@@ -1637,11 +1654,12 @@ async def update_etiquette_in_education_document(
     file_url = None
     if file:
         # Удаляем старый файл
-        await file_service.delete_file(current_item.file_url)
+        await file_service.delete_file(current_item.file_url, session=session)
         # Сохраняем новый файл
         file_url = await file_service.save_file(
             upload_file=file,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о документе
@@ -1673,7 +1691,7 @@ async def delete_etiquette_in_education_document(
         )
 
     # Удаляем файл
-    await file_service.delete_file(current_item.file_url)
+    await file_service.delete_file(current_item.file_url, session=session)
 
     # Удаляем запись о документе
     deleted = await repo.delete(item_id)
@@ -1738,6 +1756,7 @@ async def create_etiquette_in_education_event(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = OrganizationEtiquetteInEducationEventRepository(session)
@@ -1781,11 +1800,12 @@ async def update_etiquette_in_education_event(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о мероприятии
@@ -1822,7 +1842,7 @@ async def delete_etiquette_in_education_event(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о мероприятии
     deleted = await repo.delete(item_id)
@@ -1884,6 +1904,7 @@ async def create_etiquette_in_education_contact(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = OrganizationEtiquetteInEducationContactRepository(session)
@@ -1925,11 +1946,12 @@ async def update_etiquette_in_education_contact(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о контакте
@@ -1965,7 +1987,7 @@ async def delete_etiquette_in_education_contact(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о контакте
     deleted = await repo.delete(item_id)
@@ -2022,6 +2044,7 @@ async def create_professional_learning_trajectory_document(
     file_url = await file_service.save_file(
         upload_file=file,
         subdirectory=DOCUMENTS_FOLDER,
+        session=session,
     )
 
     repo = OrganizationProfessionalLearningTrajectoryDocumentRepository(session)
@@ -2056,11 +2079,12 @@ async def update_professional_learning_trajectory_document(
     file_url = None
     if file:
         # Удаляем старый файл
-        await file_service.delete_file(current_item.file_url)
+        await file_service.delete_file(current_item.file_url, session=session)
         # Сохраняем новый файл
         file_url = await file_service.save_file(
             upload_file=file,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о документе
@@ -2092,7 +2116,7 @@ async def delete_professional_learning_trajectory_document(
         )
 
     # Удаляем файл
-    await file_service.delete_file(current_item.file_url)
+    await file_service.delete_file(current_item.file_url, session=session)
 
     # Удаляем запись о документе
     deleted = await repo.delete(item_id)
@@ -2154,6 +2178,7 @@ async def create_professional_learning_trajectory_participant(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = OrganizationProfessionalLearningTrajectoryParticipantRepository(session)
@@ -2191,11 +2216,12 @@ async def update_professional_learning_trajectory_participant(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию об участнике
@@ -2229,7 +2255,7 @@ async def delete_professional_learning_trajectory_participant(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись об участнике
     deleted = await repo.delete(item_id)
@@ -2296,6 +2322,7 @@ async def create_professional_learning_trajectory_event(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = OrganizationProfessionalLearningTrajectoryEventRepository(session)
@@ -2339,11 +2366,12 @@ async def update_professional_learning_trajectory_event(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о мероприятии
@@ -2380,7 +2408,7 @@ async def delete_professional_learning_trajectory_event(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о мероприятии
     deleted = await repo.delete(item_id)
@@ -23,6 +23,10 @@ class OrganizationSupportDocumentUpdate(OrganizationSupportDocumentBase):
 
 class OrganizationSupportDocumentResponse(OrganizationSupportDocumentBase):
     id: uuid.UUID
+    # Миниатюра первой страницы, количество страниц и размер файла
+    thumbnail_url: str | None = None
+    page_count: int | None = None
+    file_size: int | None = None
 
     class Config:
         from_attributes = True
@@ -58,6 +62,11 @@ class OrganizationSupportEventUpdate(OrganizationSupportEventBase):
 
 class OrganizationSupportEventResponse(OrganizationSupportEventBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -116,6 +125,11 @@ class OrganizationLeaderUpdate(OrganizationLeaderBase):
 
 class OrganizationLeaderResponse(OrganizationLeaderBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -145,6 +159,11 @@ class OrganizationNewsUpdate(OrganizationNewsBase):
 
 class OrganizationNewsResponse(OrganizationNewsBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -235,6 +254,10 @@ class OrganizationEducationalProgramDocumentResponse(
     OrganizationEducationalProgramDocumentBase
 ):
     id: uuid.UUID
+    # Миниатюра первой страницы, количество страниц и размер файла
+    thumbnail_url: str | None = None
+    page_count: int | None = None
+    file_size: int | None = None
 
     class Config:
         from_attributes = True
@@ -302,6 +325,11 @@ class OrganizationThematicMeetingParticipantResponse(
     OrganizationThematicMeetingParticipantBase
 ):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -337,6 +365,11 @@ class OrganizationThematicMeetingEventUpdate(OrganizationThematicMeetingEventBas
 
 class OrganizationThematicMeetingEventResponse(OrganizationThematicMeetingEventBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -371,6 +404,11 @@ class OrganizationThematicMeetingContactResponse(
     OrganizationThematicMeetingContactBase
 ):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -400,6 +438,10 @@ class OrganizationEtiquetteInEducationDocumentResponse(
     OrganizationEtiquetteInEducationDocumentBase
 ):
     id: uuid.UUID
+    # Миниатюра первой страницы, количество страниц и размер файла
+    thumbnail_url: str | None = None
+    page_count: int | None = None
+    file_size: int | None = None
 
     class Config:
         from_attributes = True
@@ -441,6 +483,11 @@ class OrganizationEtiquetteInEducationEventResponse(
     OrganizationEtiquetteInEducationEventBase
 ):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -479,6 +526,11 @@ class OrganizationEtiquetteInEducationContactResponse(
     OrganizationEtiquetteInEducationContactBase
 ):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -508,6 +560,10 @@ class OrganizationProfessionalLearningTrajectoryDocumentResponse(
     OrganizationProfessionalLearningTrajectoryDocumentBase
 ):
     id: uuid.UUID
+    # Миниатюра первой страницы, количество страниц и размер файла
+    thumbnail_url: str | None = None
+    page_count: int | None = None
+    file_size: int | None = None
 
     class Config:
         from_attributes = True
@@ -540,6 +596,11 @@ class OrganizationProfessionalLearningTrajectoryParticipantResponse(
     OrganizationProfessionalLearningTrajectoryParticipantBase
 ):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -581,6 +642,11 @@ class OrganizationProfessionalLearningTrajectoryEventResponse(
     OrganizationProfessionalLearningTrajectoryEventBase
 ):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
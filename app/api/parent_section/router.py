@@ -79,6 +79,7 @@ async def create_parent_document(
     file_url = await file_service.save_file(
         upload_file=file,
         subdirectory=DOCUMENTS_FOLDER,
+        session=session,
     )
 
     # Создаем запись о документе
@@ -113,11 +114,12 @@ async def update_parent_document(
     file_url = None
     if file:
         # Удаляем старый файл
-        await file_service.delete_file(current_item.file_url)
+        await file_service.delete_file(current_item.file_url, session=session)
         # Сохраняем новый файл
         file_url = await file_service.save_file(
             upload_file=file,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о документе
@@ -148,7 +150,7 @@ async def delete_parent_document(
         )
 
     # Удаляем файл
-    await file_service.delete_file(current_item.file_url)
+    await file_service.delete_file(current_item.file_url, session=session)
 
     # Удаляем запись о документе
     deleted = await repo.delete(item_id)
@@ -300,6 +302,7 @@ async def create_thematic_meeting_participant(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=PARENT_SECTION_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = ThematicMeetingParticipantRepository(session)
@@ -337,11 +340,12 @@ async def update_thematic_meeting_participant(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=PARENT_SECTION_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию об участнике
@@ -374,7 +378,7 @@ async def delete_thematic_meeting_participant(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись об участнике
     deleted = await repo.delete(item_id)
@@ -434,6 +438,7 @@ async def create_thematic_meeting_event(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=PARENT_SECTION_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = ThematicMeetingEventRepository(session)
@@ -476,11 +481,12 @@ async def update_thematic_meeting_event(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=PARENT_SECTION_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о мероприятии
@@ -516,7 +522,7 @@ async def delete_thematic_meeting_event(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о мероприятии
     deleted = await repo.delete(item_id)
@@ -576,6 +582,7 @@ async def create_thematic_meeting_contact(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=PARENT_SECTION_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = ThematicMeetingContactRepository(session)
@@ -617,11 +624,12 @@ async def update_thematic_meeting_contact(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=PARENT_SECTION_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о контакте
@@ -656,7 +664,7 @@ async def delete_thematic_meeting_contact(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о контакте
     deleted = await repo.delete(item_id)
@@ -713,6 +721,7 @@ async def create_etiquette_in_education_document(
     file_url = await file_service.save_file(
         upload_file=file,
         subdirectory=DOCUMENTS_FOLDER,
+        session=session,
     )
 
     repo = EtiquetteInEducationDocumentRepository(session)
@@ -747,11 +756,12 @@ async def update_etiquette_in_education_document(
     file_url = None
     if file:
         # Удаляем старый файл
-        await file_service.delete_file(current_item.file_url)
+        await file_service.delete_file(current_item.file_url, session=session)
         # Сохраняем новый файл
         file_url = await file_service.save_file(
             upload_file=file,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о документе
@@ -783,7 +793,7 @@ async def delete_etiquette_in_education_document(
         )
 
     # Удаляем файл
-    await file_service.delete_file(current_item.file_url)
+    await file_service.delete_file(current_item.file_url, session=session)
 
     # Удаляем запись о документе
     deleted = await repo.delete(item_id)
@@ -847,6 +857,7 @@ async def create_etiquette_in_education_event(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=PARENT_SECTION_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = EtiquetteInEducationEventRepository(session)
@@ -890,11 +901,12 @@ async def update_etiquette_in_education_event(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=PARENT_SECTION_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о мероприятии
@@ -930,7 +942,7 @@ async def delete_etiquette_in_education_event(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о мероприятии
     deleted = await repo.delete(item_id)
@@ -992,6 +1004,7 @@ async def create_etiquette_in_education_contact(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=PARENT_SECTION_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = EtiquetteInEducationContactRepository(session)
@@ -1033,11 +1046,12 @@ async def update_etiquette_in_education_contact(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=PARENT_SECTION_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о контакте
@@ -1073,7 +1087,7 @@ async def delete_etiquette_in_education_contact(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о контакте
     deleted = await repo.delete(item_id)
@@ -1130,6 +1144,7 @@ async def create_professional_learning_trajectory_document(
     file_url = await file_service.save_file(
         upload_file=file,
         subdirectory=DOCUMENTS_FOLDER,
+        session=session,
     )
 
     repo = ProfessionalLearningTrajectoryDocumentRepository(session)
@@ -1164,11 +1179,12 @@ async def update_professional_learning_trajectory_document(
     file_url = None
     if file:
         # Удаляем старый файл
-        await file_service.delete_file(current_item.file_url)
+        await file_service.delete_file(current_item.file_url, session=session)
         # Сохраняем новый файл
         file_url = await file_service.save_file(
             upload_file=file,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о документе
@@ -1200,7 +1216,7 @@ async def delete_professional_learning_trajectory_document(
         )
 
     # Удаляем файл
-    await file_service.delete_file(current_item.file_url)
+    await file_service.delete_file(current_item.file_url, session=session)
 
     # Удаляем запись о документе
     deleted = await repo.delete(item_id)
@@ -1260,6 +1276,7 @@ async def create_professional_learning_trajectory_participant(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=PARENT_SECTION_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = ProfessionalLearningTrajectoryParticipantRepository(session)
@@ -1297,11 +1314,12 @@ async def update_professional_learning_trajectory_participant(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=PARENT_SECTION_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию об участнике
@@ -1335,7 +1353,7 @@ async def delete_professional_learning_trajectory_participant(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись об участнике
     deleted = await repo.delete(item_id)
@@ -1400,6 +1418,7 @@ async def create_professional_learning_trajectory_event(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=PARENT_SECTION_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = ProfessionalLearningTrajectoryEventRepository(session)
@@ -1443,11 +1462,12 @@ async def update_professional_learning_trajectory_event(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=PARENT_SECTION_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о мероприятии
@@ -1484,7 +1504,7 @@ async def delete_professional_learning_trajectory_event(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о мероприятии
     deleted = await repo.delete(item_id)
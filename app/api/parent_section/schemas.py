@@ -23,6 +23,10 @@ class ParentDocumentUpdate(ParentDocumentBase):
 
 class ParentDocumentResponse(ParentDocumentBase):
     id: uuid.UUID
+    # Миниатюра первой страницы, количество страниц и размер файла
+    thumbnail_url: str | None = None
+    page_count: int | None = None
+    file_size: int | None = None
 
     class Config:
         from_attributes = True
@@ -78,6 +82,11 @@ class ThematicMeetingParticipantUpdate(ThematicMeetingParticipantBase):
 
 class ThematicMeetingParticipantResponse(ThematicMeetingParticipantBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -113,6 +122,11 @@ class ThematicMeetingEventUpdate(ThematicMeetingEventBase):
 
 class ThematicMeetingEventResponse(ThematicMeetingEventBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -145,6 +159,11 @@ class ThematicMeetingContactUpdate(ThematicMeetingContactBase):
 
 class ThematicMeetingContactResponse(ThematicMeetingContactBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -168,6 +187,10 @@ class EtiquetteInEducationDocumentUpdate(EtiquetteInEducationDocumentBase):
 
 class EtiquetteInEducationDocumentResponse(EtiquetteInEducationDocumentBase):
     id: uuid.UUID
+    # Миниатюра первой страницы, количество страниц и размер файла
+    thumbnail_url: str | None = None
+    page_count: int | None = None
+    file_size: int | None = None
 
     class Config:
         from_attributes = True
@@ -203,6 +226,11 @@ class EtiquetteInEducationEventUpdate(EtiquetteInEducationEventBase):
 
 class EtiquetteInEducationEventResponse(EtiquetteInEducationEventBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -235,6 +263,11 @@ class EtiquetteInEducationContactUpdate(EtiquetteInEducationContactBase):
 
 class EtiquetteInEducationContactResponse(EtiquetteInEducationContactBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -264,6 +297,10 @@ class ProfessionalLearningTrajectoryDocumentResponse(
     ProfessionalLearningTrajectoryDocumentBase
 ):
     id: uuid.UUID
+    # Миниатюра первой страницы, количество страниц и размер файла
+    thumbnail_url: str | None = None
+    page_count: int | None = None
+    file_size: int | None = None
 
     class Config:
         from_attributes = True
@@ -296,6 +333,11 @@ class ProfessionalLearningTrajectoryParticipantResponse(
     ProfessionalLearningTrajectoryParticipantBase
 ):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -337,6 +379,11 @@ class ProfessionalLearningTrajectoryEventResponse(
     ProfessionalLearningTrajectoryEventBase
 ):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
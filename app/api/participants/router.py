@@ -57,6 +57,7 @@ async def create_participant(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=PARTICIPANTS_IMAGES_FOLDER,
+            session=session,
         )
 
     participant_repo = ParticipantRepository(session)
@@ -91,11 +92,14 @@ async def update_participant(
     if image:
         # Удаляем старое изображение
         if current_participant.image_url:
-            await file_service.delete_file(current_participant.image_url)
+            await file_service.delete_file(
+                current_participant.image_url, session=session
+            )
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=PARTICIPANTS_IMAGES_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию об участнике
@@ -126,7 +130,7 @@ async def delete_participant(
 
     # Удаляем изображение
     if current_participant.image_url:
-        await file_service.delete_file(current_participant.image_url)
+        await file_service.delete_file(current_participant.image_url, session=session)
 
     # Удаляем запись об участнике
     deleted = await participant_repo.delete(participant_id)
@@ -66,6 +66,7 @@ async def create_partner(
     logo_url = await file_service.save_file(
         upload_file=logo,
         subdirectory=PARTNERS_LOGOS_FOLDER,
+        session=session,
     )
 
     partner = await partner_repo.create(
@@ -115,11 +116,12 @@ async def update_partner(
     logo_url = None
     if logo:
         # Удаляем старый логотип
-        await file_service.delete_file(current_partner.logo_url)
+        await file_service.delete_file(current_partner.logo_url, session=session)
         # Сохраняем новый логотип
         logo_url = await file_service.save_file(
             upload_file=logo,
             subdirectory=PARTNERS_LOGOS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о партнере
@@ -150,7 +152,7 @@ async def delete_partner(
         )
 
     # Удаляем логотип
-    await file_service.delete_file(current_partner.logo_url)
+    await file_service.delete_file(current_partner.logo_url, session=session)
 
     # Удаляем запись о партнере
     deleted = await partner_repo.delete(partner_id)
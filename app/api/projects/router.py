@@ -1,7 +1,7 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, Form
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, Form, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.file.service import file_service, PROJECTS_IMAGES_FOLDER
@@ -9,6 +9,8 @@ from core.models import User
 from core.db_helper import db_helper
 from api.dependencies import get_current_active_user, verify_active_param_access
 from api.projects.repository import ProjectRepository
+from api.search.repository import KeywordFacetRepository
+from api.search.schemas import KeywordFacetResponse
 from api.projects.schemas import (
     ProjectCreate,
     ProjectResponse,
@@ -21,14 +23,46 @@ router = APIRouter()
 
 @router.get("/", response_model=list[ProjectResponse])
 async def get_projects(
+    keywords: Annotated[
+        list[str] | None, Query()
+    ] = None,  # Только проекты со всеми этими ключевыми словами (опционально)
     session: AsyncSession = Depends(db_helper.session_getter),
     is_active: bool = Depends(verify_active_param_access),
 ):
     project_repo = ProjectRepository(session)
+    if keywords:
+        return await project_repo.find_by_keywords(keywords, is_active=is_active)
+
     projects = await project_repo.find_all(is_active=is_active)
     return projects
 
 
+@router.get("/keywords/", response_model=list[KeywordFacetResponse])
+async def get_projects_keywords(
+    theme: str | None = None,  # Тема проекта (опционально)
+    category: str | None = None,  # Категория проекта (опционально)
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+    session: AsyncSession = Depends(db_helper.session_getter),
+):
+    """Ключевые слова проектов с количеством проектов (для облака тегов)"""
+    if theme and category:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Укажите только тему или только категорию",
+        )
+
+    facet_repo = KeywordFacetRepository(session)
+    if theme:
+        return await facet_repo.get_counts(
+            entity_type="project", scope="theme", scope_value=theme, limit=limit
+        )
+    if category:
+        return await facet_repo.get_counts(
+            entity_type="project", scope="category", scope_value=category, limit=limit
+        )
+    return await facet_repo.get_counts(entity_type="project", limit=limit)
+
+
 @router.get("/{project_id}/", response_model=ProjectResponse)
 async def get_project_by_id(
     project_id: uuid.UUID,
@@ -64,6 +98,7 @@ async def create_project(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=PROJECTS_IMAGES_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     # Создаем запись о проекте
@@ -109,11 +144,12 @@ async def update_project(
     if image:
         # Удаляем старое изображение
         if current_project.image_url:
-            await file_service.delete_file(current_project.image_url)
+            await file_service.delete_file(current_project.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=PROJECTS_IMAGES_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     # Обновляем информацию о проекте
@@ -149,7 +185,7 @@ async def delete_project(
 
     # Удаляем изображение
     if current_project.image_url:
-        await file_service.delete_file(current_project.image_url)
+        await file_service.delete_file(current_project.image_url, session=session)
 
     # Удаляем запись о проекте
     deleted = await project_repo.delete(project_id)
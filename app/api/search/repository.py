@@ -1,34 +1,170 @@
-from sqlalchemy import select, or_, desc
-from sqlalchemy.orm import joinedload
+import asyncio
+import heapq
+
+from sqlalchemy import select, func, literal, cast, union_all, null, Text, Date
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.models import News
+from core.config import settings
+from core.db_helper import db_helper
+from core.models import News, Project, SearchKeyword, KeywordFacet
+from core.models.mixins.search import SEARCH_CONFIG
+from core.search.normalize import normalize_search_text
+from core.search.prefix_index import prefix_index
+from core.search.cache import search_cache
+from core.search.registry import SEARCHABLE_ENTITIES, SearchableEntity
+from api.search.schemas import SearchResult
 from repository.base import BaseRepository
 
 
+class KeywordFacetRepository(BaseRepository):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session=session, model=KeywordFacet)
+
+    async def get_counts(
+        self,
+        entity_type: str,
+        scope: str = "",
+        scope_value: str = "",
+        limit: int = 50,
+    ) -> list[KeywordFacet]:
+        """
+        Самые частые ключевые слова материалов с количеством материалов
+
+        :param entity_type: Тип материала (news или project)
+        :param scope: Поле, в пределах которого считать (пусто - по всем материалам)
+        :param scope_value: Значение этого поля
+        :param limit: Количество ключевых слов
+        """
+        stmt = (
+            select(KeywordFacet)
+            .where(
+                KeywordFacet.entity_type == entity_type,
+                KeywordFacet.scope == scope,
+                KeywordFacet.scope_value == scope_value,
+            )
+            .order_by(KeywordFacet.count.desc(), KeywordFacet.keyword)
+            .limit(limit)
+        )
+        result = await self.session.scalars(stmt)
+        return list(result.all())
+
+
 class SearchRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    async def search(
+        self, query: str, entity_type: str | None, skip: int, limit: int
+    ) -> list[SearchResult]:
+        """Поиск с кешированием по нормализованному запросу"""
+        normalized_query = normalize_search_text(query)
+        if not normalized_query:
+            return []
+
+        async def find() -> list[SearchResult]:
+            # Если указан тип сущности, ищем только по этому типу
+            if entity_type:
+                return await self.search_by_entity_type(
+                    normalized_query, entity_type, skip, limit
+                )
+            return await self.search_all(normalized_query, skip, limit)
+
+        return await search_cache.get_or_compute(
+            "search", (normalized_query, entity_type, skip, limit), find
+        )
+
+    async def suggest(
+        self, query: str, entity_type: str | None, limit: int
+    ) -> list[str]:
+        """Подсказки с кешированием по нормализованному запросу"""
+        normalized_query = normalize_search_text(query)
+        if not normalized_query:
+            return []
+
+        async def find() -> list[str]:
+            # Если указан тип сущности, получаем подсказки только по этому типу
+            if entity_type:
+                return await self.get_suggestions_by_entity_type(
+                    normalized_query, entity_type, limit
+                )
+            return await self.get_all_suggestions(normalized_query, limit)
+
+        return await search_cache.get_or_compute(
+            "suggestions", (normalized_query, entity_type, limit), find
+        )
+
     async def search_by_entity_type(
         self, query: str, entity_type: str, skip: int, limit: int
-    ):
-        # Для упрощения возвращаем пустой список, т.к. в проекте нет других сущностей
-        return []
+    ) -> list[SearchResult]:
+        entity = SEARCHABLE_ENTITIES[entity_type]
+        result = await self.session.execute(
+            build_entity_search_stmt(entity, query, limit=limit, skip=skip)
+        )
+        return [_to_search_result(entity, row) for row in result]
+
+    async def search_all(self, query: str, skip: int, limit: int) -> list[SearchResult]:
+        """
+        Федеративный поиск: запросы к каждой сущности выполняются одновременно
+        в отдельных сессиях, затем лучшие результаты объединяются по рангу
+        """
+        semaphore = asyncio.Semaphore(settings.search.federated_concurrency)
 
-    async def search_all(self, query: str, skip: int, limit: int):
-        # Используем существующую функцию для поиска новостей
-        return await search_news(self.session, query, limit, skip)
+        async def search_entity(entity: SearchableEntity) -> list[tuple]:
+            # Каждая сущность может дать все skip + limit лучших результатов
+            stmt = build_entity_search_stmt(entity, query, limit=skip + limit)
+            async with semaphore, db_helper.session_factory() as session:
+                result = await session.execute(stmt)
+                return [(row.rank, entity, row) for row in result]
+
+        entity_rows = await asyncio.gather(
+            *(search_entity(entity) for entity in SEARCHABLE_ENTITIES.values())
+        )
+
+        top_rows = heapq.nlargest(
+            skip + limit,
+            (row for rows in entity_rows for row in rows),
+            key=lambda row: row[0],
+        )
+        return [_to_search_result(entity, row) for _, entity, row in top_rows[skip:]]
 
     async def get_suggestions_by_entity_type(
         self, query: str, entity_type: str, limit: int
-    ):
-        # Для упрощения возвращаем пустой список
-        return []
+    ) -> list[str]:
+        entity = SEARCHABLE_ENTITIES[entity_type]
+        normalized_query = normalize_search_text(query)
+        if not normalized_query:
+            return []
+
+        # Подсказки по заголовкам сущности через триграммный индекс
+        search_query = literal(normalized_query, Text())
+        title = getattr(entity.model, entity.title_field)
+        stmt = (
+            select(title)
+            .where(search_query.bool_op("<%")(title))
+            .group_by(title)
+            .order_by(func.max(func.word_similarity(search_query, title)).desc())
+            .limit(limit)
+        )
+        # Заголовки неактивных материалов в подсказках не показываем
+        if hasattr(entity.model, "is_active"):
+            stmt = stmt.where(entity.model.is_active.is_(True))
+
+        result = await self.session.scalars(stmt)
+        return list(result.all())
 
     async def get_all_suggestions(self, query: str, limit: int):
-        # Используем существующую функцию для получения подсказок
-        return await get_suggestions(self.session, query, limit)
+        # Сначала отвечаем из индекса в памяти по префиксу
+        suggestions = (
+            prefix_index.suggest(query, limit) if prefix_index.is_ready else []
+        )
+        if len(suggestions) >= limit:
+            return suggestions
+
+        # Если совпадений по префиксу мало, дополняем нечеткими подсказками из базы
+        for suggestion in await get_suggestions(self.session, query, limit):
+            if suggestion not in suggestions:
+                suggestions.append(suggestion)
+        return suggestions[:limit]
 
 
 async def get_suggestions(
@@ -36,59 +172,109 @@ async def get_suggestions(
     query: str,
     limit: int = 5,
 ) -> list[str]:
+    """
+    Подсказки из заголовков и ключевых слов одним запросом по триграммным индексам
+
+    Оператор <% (word_similarity) находит запрос как часть заголовка и допускает
+    опечатки. Подсказки ранжируются по похожести, затем по свежести материала
+    """
+    normalized_query = normalize_search_text(query)
+    if not normalized_query:
+        return []
+
+    search_query = literal(normalized_query, Text())
+    candidates = union_all(
+        select(
+            News.title.label("value"),
+            func.word_similarity(search_query, News.title).label("score"),
+            News.news_date.label("used_on"),
+        ).where(search_query.bool_op("<%")(News.title)),
+        select(
+            Project.title.label("value"),
+            func.word_similarity(search_query, Project.title).label("score"),
+            cast(Project.created_at, Date).label("used_on"),
+        ).where(
+            search_query.bool_op("<%")(Project.title),
+            Project.is_active.is_(True),
+        ),
+        select(
+            SearchKeyword.value.label("value"),
+            func.word_similarity(search_query, SearchKeyword.keyword).label("score"),
+            SearchKeyword.last_used_on.label("used_on"),
+        ).where(search_query.bool_op("<%")(SearchKeyword.keyword)),
+    ).subquery()
+
     stmt = (
-        select(News)
-        .where(
-            or_(
-                News.title.ilike(f"%{query}%"),
-                News.keywords.any(query),
-            )
+        select(candidates.c.value)
+        .group_by(candidates.c.value)
+        .order_by(
+            func.max(candidates.c.score).desc(),
+            func.max(candidates.c.used_on).desc(),
         )
-        .limit(limit * 3)
-        .order_by(desc(News.news_date))
+        .limit(limit)
     )
 
     result = await session.scalars(stmt)
-    news_items = result.all()
-    suggestions = set()
-
-    for news in news_items:
-        # Добавляем заголовок если совпадает
-        if query.lower() in news.title.lower():
-            suggestions.add(news.title)
+    return list(result.all())
 
-        # Добавляем подходящие keywords
-        for keyword in news.keywords:
-            if query.lower() in keyword.lower():
-                suggestions.add(keyword)
 
-        # Ограничиваем количество
-        if len(suggestions) >= limit:
-            break
+async def prewarm_search_cache(
+    queries: list[str],
+    search_limit: int = 10,
+    suggestions_limit: int = 5,
+):
+    """Прогрев кеша популярными запросами (параметры по умолчанию как у API)"""
+    async with db_helper.session_factory() as session:
+        search_repo = SearchRepository(session)
+        for query in queries:
+            await search_repo.search(query, None, 0, search_limit)
+            await search_repo.suggest(query, None, suggestions_limit)
 
-    return list(suggestions)[:limit]
 
-
-async def search_news(
-    session: AsyncSession,
+def build_entity_search_stmt(
+    entity: SearchableEntity,
     query: str,
-    limit: int = 10,
+    limit: int,
     skip: int = 0,
-) -> list[News]:
+):
+    """Полнотекстовый поиск по одной сущности с ранжированием по ts_rank_cd"""
+    model = entity.model
+    ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+    rank = func.ts_rank_cd(model.search_vector, ts_query)
+
+    description = (
+        func.coalesce(getattr(model, entity.description_field), "")
+        if entity.description_field
+        else literal("")
+    )
+    url = getattr(model, entity.url_field) if entity.url_field else null()
+
     stmt = (
-        select(News)
-        .options(joinedload(News.type))
-        .where(
-            or_(
-                News.title.ilike(f"%{query}%"),
-                News.keywords.any(query),
-                News.min_text.ilike(f"%{query}%"),
-            )
+        select(
+            model.id.label("id"),
+            getattr(model, entity.title_field).label("title"),
+            description.label("description"),
+            url.label("url"),
+            rank.label("rank"),
         )
+        .where(model.search_vector.bool_op("@@")(ts_query))
+        .order_by(rank.desc())
         .limit(limit)
         .offset(skip)
-        .order_by(desc(News.news_date))
     )
 
-    result = await session.scalars(stmt)
-    return list(result.all())
+    # Неактивные материалы в поиске не показываем
+    if hasattr(model, "is_active"):
+        stmt = stmt.where(model.is_active.is_(True))
+
+    return stmt
+
+
+def _to_search_result(entity: SearchableEntity, row) -> SearchResult:
+    return SearchResult(
+        id=row.id,
+        title=row.title,
+        description=row.description,
+        entity_type=entity.entity_type,
+        url=row.url,
+    )
@@ -6,14 +6,25 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.models import User
 from core.db_helper import db_helper
-from api.dependencies import get_current_active_user
+from api.dependencies import get_current_active_user, get_current_admin_claims
+from api.auth.schemas import AccessTokenClaims
 from api.search.repository import SearchRepository
-from api.search.schemas import SearchResult
+from core.search.registry import SEARCHABLE_ENTITIES
+from api.search.schemas import SearchResult, SearchCacheStats
+from core.search.cache import search_cache
 
 
 router = APIRouter()
 
 
+def _check_entity_type(entity_type: str | None):
+    if entity_type and entity_type not in SEARCHABLE_ENTITIES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Неизвестный тип сущности",
+        )
+
+
 @router.get("/", response_model=list[SearchResult])
 async def search_entities(
     query: Annotated[str, Query(min_length=1)],
@@ -35,25 +46,16 @@ async def search_entities(
     :param user: Текущий активный пользователь
     :return: Список результатов поиска
     """
+    _check_entity_type(entity_type)
     search_repo = SearchRepository(session)
 
-    # Если указан тип сущности, ищем только по этому типу
-    if entity_type:
-        results = await search_repo.search_by_entity_type(
-            query=query,
-            entity_type=entity_type,
-            skip=skip,
-            limit=limit,
-        )
-    else:
-        # Иначе ищем по всем сущностям
-        results = await search_repo.search_all(
-            query=query,
-            skip=skip,
-            limit=limit,
-        )
-
-    return results
+    # Одинаковые запросы (с точностью до регистра, пробелов и "ё") берутся из кеша
+    return await search_repo.search(
+        query=query,
+        entity_type=entity_type,
+        skip=skip,
+        limit=limit,
+    )
 
 
 @router.get("/suggestions/", response_model=list[str])
@@ -75,20 +77,24 @@ async def get_search_suggestions(
     :param user: Текущий активный пользователь
     :return: Список подсказок для поиска
     """
+    _check_entity_type(entity_type)
     search_repo = SearchRepository(session)
 
-    # Если указан тип сущности, получаем подсказки только по этому типу
-    if entity_type:
-        suggestions = await search_repo.get_suggestions_by_entity_type(
-            query=query,
-            entity_type=entity_type,
-            limit=limit,
-        )
-    else:
-        # Иначе получаем подсказки по всем сущностям
-        suggestions = await search_repo.get_all_suggestions(
-            query=query,
-            limit=limit,
-        )
+    return await search_repo.suggest(
+        query=query,
+        entity_type=entity_type,
+        limit=limit,
+    )
+
+
+@router.get("/stats/", response_model=SearchCacheStats)
+async def get_search_stats(
+    admin: AccessTokenClaims = Depends(get_current_admin_claims),
+):
+    """
+    Статистика кеша поиска: доля попаданий и популярные запросы
 
-    return suggestions
+    :param admin: Текущий администратор
+    :return: Статистика кеша поиска
+    """
+    return search_cache.get_stats()
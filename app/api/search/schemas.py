@@ -17,3 +17,27 @@ class SearchResult(BaseModel):
     description: str
     entity_type: str
     url: str | None = None
+
+
+class SearchCacheKindStats(BaseModel):
+    hits: int
+    misses: int
+    hit_rate: float
+
+
+class SearchCacheStats(BaseModel):
+    # Количество записей в кеше
+    size: int
+    search: SearchCacheKindStats
+    suggestions: SearchCacheKindStats
+    # Популярные запросы (используются для прогрева кеша после перезапуска)
+    top_queries: list[str]
+
+
+class KeywordFacetResponse(BaseModel):
+    keyword: str
+    # Количество материалов с этим ключевым словом
+    count: int
+
+    class Config:
+        from_attributes = True
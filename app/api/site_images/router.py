@@ -55,6 +55,7 @@ async def create_site_image(
     image_url = await file_service.save_file(
         upload_file=image,
         subdirectory=SITE_IMAGES_FOLDER,
+        session=session,
     )
 
     # Создаем запись об изображении
@@ -87,11 +88,12 @@ async def update_site_image(
     image_url = None
     if image:
         # Удаляем старое изображение
-        await file_service.delete_file(current_site_image.image_url)
+        await file_service.delete_file(current_site_image.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=SITE_IMAGES_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию об изображении
@@ -120,7 +122,7 @@ async def delete_site_image(
         )
 
     # Удаляем изображение
-    await file_service.delete_file(current_site_image.image_url)
+    await file_service.delete_file(current_site_image.image_url, session=session)
 
     # Удаляем запись об изображении
     deleted = await site_image_repo.delete(site_image_id)
@@ -4,7 +4,12 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, Form
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.file.service import file_service, DOCUMENTS_FOLDER
+from core.config import settings
+from core.file.service import (
+    file_service,
+    DOCUMENTS_FOLDER,
+    PARTICIPANTS_IMAGES_FOLDER,
+)
 from core.models import User
 from core.db_helper import db_helper
 from api.dependencies import get_current_active_user, verify_active_param_access
@@ -54,6 +59,7 @@ from api.soviet_section.schemas import (
     LearningContactResponse,
     OnlineConferenceRegulationResponse,
     OnlineConferenceParticipantResponse,
+    OnlineConferenceParticipantBatchItem,
     OnlineConferenceNewsResponse,
     OnlineConferenceQuestionResponse,
     OnlineConferenceContactResponse,
@@ -64,6 +70,7 @@ from api.soviet_section.schemas import (
     ProjectNewsResponse,
     ProjectReportResponse,
     CompetitionDocumentResponse,
+    CompetitionDocumentBatchItem,
     CompetitionContactResponse,
     JournalNewsResponse,
     JournalContactResponse,
@@ -73,6 +80,22 @@ from api.soviet_section.schemas import (
 router = APIRouter()
 
 
+def _check_batch(files_count: int, *fields: list):
+    """Проверка размера пакета и соответствия файлов их данным"""
+    if files_count == 0 or files_count > settings.file.max_batch_files:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"Количество файлов должно быть от 1 до {settings.file.max_batch_files}"
+            ),
+        )
+    if any(len(field) != files_count for field in fields):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Количество файлов не совпадает с количеством записей",
+        )
+
+
 # Soviet Support Documents
 @router.get("/support/documents/", response_model=list[SovietSupportDocumentResponse])
 async def get_soviet_support_documents(
@@ -111,6 +134,7 @@ async def create_soviet_support_document(
     file_url = await file_service.save_file(
         upload_file=file,
         subdirectory=DOCUMENTS_FOLDER,
+        session=session,
     )
 
     # Создаем запись о документе
@@ -145,11 +169,12 @@ async def update_soviet_support_document(
     file_url = None
     if file:
         # Удаляем старый файл
-        await file_service.delete_file(current_item.file_url)
+        await file_service.delete_file(current_item.file_url, session=session)
         # Сохраняем новый файл
         file_url = await file_service.save_file(
             upload_file=file,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о документе
@@ -178,7 +203,7 @@ async def delete_soviet_support_document(
         )
 
     # Удаляем файл
-    await file_service.delete_file(current_item.file_url)
+    await file_service.delete_file(current_item.file_url, session=session)
 
     # Удаляем запись о документе
     deleted = await repo.delete(item_id)
@@ -234,6 +259,7 @@ async def create_soviet_support_event(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = SovietSupportEventRepository(session)
@@ -274,11 +300,12 @@ async def update_soviet_support_event(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о мероприятии
@@ -312,7 +339,7 @@ async def delete_soviet_support_event(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о мероприятии
     deleted = await repo.delete(item_id)
@@ -468,6 +495,7 @@ async def create_soviet_leader(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = SovietLeaderRepository(session)
@@ -502,11 +530,12 @@ async def update_soviet_leader(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о руководителе
@@ -537,7 +566,7 @@ async def delete_soviet_leader(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о руководителе
     deleted = await repo.delete(item_id)
@@ -589,6 +618,7 @@ async def create_soviet_news(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = SovietNewsRepository(session)
@@ -625,11 +655,12 @@ async def update_soviet_news(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о новости
@@ -661,7 +692,7 @@ async def delete_soviet_news(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о новости
     deleted = await repo.delete(item_id)
@@ -900,6 +931,7 @@ async def create_learning_document(
     file_url = await file_service.save_file(
         upload_file=file,
         subdirectory=DOCUMENTS_FOLDER,
+        session=session,
     )
 
     # Создаем запись о документе
@@ -932,11 +964,12 @@ async def update_learning_document(
     file_url = None
     if file:
         # Удаляем старый файл
-        await file_service.delete_file(current_item.file_url)
+        await file_service.delete_file(current_item.file_url, session=session)
         # Сохраняем новый файл
         file_url = await file_service.save_file(
             upload_file=file,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о документе
@@ -965,7 +998,7 @@ async def delete_learning_document(
         )
 
     # Удаляем файл
-    await file_service.delete_file(current_item.file_url)
+    await file_service.delete_file(current_item.file_url, session=session)
 
     # Удаляем запись о документе
     deleted = await repo.delete(item_id)
@@ -1021,6 +1054,7 @@ async def create_learning_event(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = LearningEventRepository(session)
@@ -1061,11 +1095,12 @@ async def update_learning_event(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о мероприятии
@@ -1099,7 +1134,7 @@ async def delete_learning_event(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о мероприятии
     deleted = await repo.delete(item_id)
@@ -1252,6 +1287,7 @@ async def create_learning_news(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = LearningNewsRepository(session)
@@ -1288,11 +1324,12 @@ async def update_learning_news(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о новости
@@ -1324,7 +1361,7 @@ async def delete_learning_news(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о новости
     deleted = await repo.delete(item_id)
@@ -1480,6 +1517,7 @@ async def create_learning_contact(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = LearningContactRepository(session)
@@ -1518,11 +1556,12 @@ async def update_learning_contact(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о контакте
@@ -1555,7 +1594,7 @@ async def delete_learning_contact(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о контакте
     deleted = await repo.delete(item_id)
@@ -1612,6 +1651,7 @@ async def create_online_conference_regulation(
     file_url = await file_service.save_file(
         upload_file=file,
         subdirectory=DOCUMENTS_FOLDER,
+        session=session,
     )
 
     # Создаем запись о регламенте
@@ -1647,11 +1687,12 @@ async def update_online_conference_regulation(
     file_url = None
     if file:
         # Удаляем старый файл
-        await file_service.delete_file(current_item.file_url)
+        await file_service.delete_file(current_item.file_url, session=session)
         # Сохраняем новый файл
         file_url = await file_service.save_file(
             upload_file=file,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о регламенте
@@ -1682,7 +1723,7 @@ async def delete_online_conference_regulation(
         )
 
     # Удаляем файл
-    await file_service.delete_file(current_item.file_url)
+    await file_service.delete_file(current_item.file_url, session=session)
 
     # Удаляем запись о регламенте
     deleted = await repo.delete(item_id)
@@ -1741,7 +1782,8 @@ async def create_online_conference_participant(
     if image:
         image_url = await file_service.save_file(
             upload_file=image,
-            subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            subdirectory=PARTICIPANTS_IMAGES_FOLDER,
+            session=session,
         )
 
     repo = OnlineConferenceParticipantRepository(session)
@@ -1753,6 +1795,58 @@ async def create_online_conference_participant(
     return item
 
 
+@router.post(
+    "/online-conference/participants/batch/",
+    response_model=list[OnlineConferenceParticipantBatchItem],
+)
+async def create_online_conference_participants_batch(
+    first_names: Annotated[list[str], Form()],
+    last_names: Annotated[list[str], Form()],
+    images: list[UploadFile],  # Фотографии участников (по одной на участника)
+    session: AsyncSession = Depends(db_helper.session_getter),
+    user: User = Depends(get_current_active_user),
+):
+    _check_batch(len(images), first_names, last_names)
+
+    # Файлы сохраняются параллельно, ошибка одного файла не прерывает остальные
+    image_urls = await file_service.save_files(
+        upload_files=images,
+        subdirectory=PARTICIPANTS_IMAGES_FOLDER,
+        session=session,
+    )
+
+    results = []
+    items_data = []
+    for index, image_url in enumerate(image_urls):
+        if isinstance(image_url, HTTPException):
+            results.append(
+                OnlineConferenceParticipantBatchItem(
+                    index=index,
+                    error=image_url.detail,
+                )
+            )
+            continue
+        results.append(OnlineConferenceParticipantBatchItem(index=index))
+        items_data.append(
+            dict(
+                first_name=first_names[index],
+                last_name=last_names[index],
+                image_url=image_url,
+            )
+        )
+
+    # Все записи создаются в одной транзакции со счетчиками ссылок на файлы:
+    # при ошибке откатываются и они, а сами файлы удалит очистка загрузок
+    repo = OnlineConferenceParticipantRepository(session)
+    items = await repo.create_many(items_data)
+
+    created_results = (result for result in results if result.error is None)
+    for result, item in zip(created_results, items):
+        result.item = OnlineConferenceParticipantResponse.model_validate(item)
+
+    return results
+
+
 @router.put(
     "/online-conference/participants/{item_id}/",
     response_model=OnlineConferenceParticipantResponse,
@@ -1779,11 +1873,12 @@ async def update_online_conference_participant(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
-            subdirectory=DOCUMENTS_FOLDER,
+            subdirectory=PARTICIPANTS_IMAGES_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию об участнике
@@ -1816,7 +1911,7 @@ async def delete_online_conference_participant(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись об участнике
     deleted = await repo.delete(item_id)
@@ -1872,6 +1967,7 @@ async def create_online_conference_news(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = OnlineConferenceNewsRepository(session)
@@ -1910,11 +2006,12 @@ async def update_online_conference_news(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о новости
@@ -1948,7 +2045,7 @@ async def delete_online_conference_news(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о новости
     deleted = await repo.delete(item_id)
@@ -2124,6 +2221,7 @@ async def create_online_conference_contact(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = OnlineConferenceContactRepository(session)
@@ -2165,11 +2263,12 @@ async def update_online_conference_contact(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о контакте
@@ -2204,7 +2303,7 @@ async def delete_online_conference_contact(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о контакте
     deleted = await repo.delete(item_id)
@@ -2445,6 +2544,7 @@ async def create_podcast_news(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = PodcastNewsRepository(session)
@@ -2481,11 +2581,12 @@ async def update_podcast_news(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о новости
@@ -2517,7 +2618,7 @@ async def delete_podcast_news(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о новости
     deleted = await repo.delete(item_id)
@@ -2570,6 +2671,7 @@ async def create_podcast_contact(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = PodcastContactRepository(session)
@@ -2608,11 +2710,12 @@ async def update_podcast_contact(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о контакте
@@ -2645,7 +2748,7 @@ async def delete_podcast_contact(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о контакте
     deleted = await repo.delete(item_id)
@@ -2697,6 +2800,7 @@ async def create_project_news(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = ProjectNewsRepository(session)
@@ -2733,11 +2837,12 @@ async def update_project_news(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о новости
@@ -2769,7 +2874,7 @@ async def delete_project_news(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о новости
     deleted = await repo.delete(item_id)
@@ -2899,6 +3004,7 @@ async def create_competition_document(
     file_url = await file_service.save_file(
         upload_file=file,
         subdirectory=DOCUMENTS_FOLDER,
+        session=session,
     )
 
     # Создаем запись о документе
@@ -2910,6 +3016,48 @@ async def create_competition_document(
     return item
 
 
+@router.post(
+    "/competition/documents/batch/",
+    response_model=list[CompetitionDocumentBatchItem],
+)
+async def create_competition_documents_batch(
+    titles: Annotated[list[str], Form()],
+    files: list[UploadFile],  # Файлы документов (по одному на документ)
+    session: AsyncSession = Depends(db_helper.session_getter),
+    user: User = Depends(get_current_active_user),
+):
+    _check_batch(len(files), titles)
+
+    # Файлы сохраняются параллельно, ошибка одного файла не прерывает остальные
+    file_urls = await file_service.save_files(
+        upload_files=files,
+        subdirectory=DOCUMENTS_FOLDER,
+        session=session,
+    )
+
+    results = []
+    items_data = []
+    for index, file_url in enumerate(file_urls):
+        if isinstance(file_url, HTTPException):
+            results.append(
+                CompetitionDocumentBatchItem(index=index, error=file_url.detail)
+            )
+            continue
+        results.append(CompetitionDocumentBatchItem(index=index))
+        items_data.append(dict(title=titles[index], file_url=file_url))
+
+    # Все записи создаются в одной транзакции со счетчиками ссылок на файлы:
+    # при ошибке откатываются и они, а сами файлы удалит очистка загрузок
+    repo = CompetitionDocumentRepository(session)
+    items = await repo.create_many(items_data)
+
+    created_results = (result for result in results if result.error is None)
+    for result, item in zip(created_results, items):
+        result.item = CompetitionDocumentResponse.model_validate(item)
+
+    return results
+
+
 @router.put(
     "/competition/documents/{item_id}/", response_model=CompetitionDocumentResponse
 )
@@ -2933,11 +3081,12 @@ async def update_competition_document(
     file_url = None
     if file:
         # Удаляем старый файл
-        await file_service.delete_file(current_item.file_url)
+        await file_service.delete_file(current_item.file_url, session=session)
         # Сохраняем новый файл
         file_url = await file_service.save_file(
             upload_file=file,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о документе
@@ -2968,7 +3117,7 @@ async def delete_competition_document(
         )
 
     # Удаляем файл
-    await file_service.delete_file(current_item.file_url)
+    await file_service.delete_file(current_item.file_url, session=session)
 
     # Удаляем запись о документе
     deleted = await repo.delete(item_id)
@@ -3110,6 +3259,7 @@ async def create_journal_news(
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,  # Используем DOCUMENTS_FOLDER для изображений тоже
+            session=session,
         )
 
     repo = JournalNewsRepository(session)
@@ -3146,11 +3296,12 @@ async def update_journal_news(
     if image:
         # Удаляем старое изображение
         if current_item.image_url:
-            await file_service.delete_file(current_item.image_url)
+            await file_service.delete_file(current_item.image_url, session=session)
         # Сохраняем новое изображение
         image_url = await file_service.save_file(
             upload_file=image,
             subdirectory=DOCUMENTS_FOLDER,
+            session=session,
         )
 
     # Обновляем информацию о новости
@@ -3182,7 +3333,7 @@ async def delete_journal_news(
 
     # Удаляем изображение
     if current_item.image_url:
-        await file_service.delete_file(current_item.image_url)
+        await file_service.delete_file(current_item.image_url, session=session)
 
     # Удаляем запись о новости
     deleted = await repo.delete(item_id)
@@ -23,6 +23,10 @@ class SovietSupportDocumentUpdate(SovietSupportDocumentBase):
 
 class SovietSupportDocumentResponse(SovietSupportDocumentBase):
     id: uuid.UUID
+    # Миниатюра первой страницы, количество страниц и размер файла
+    thumbnail_url: str | None = None
+    page_count: int | None = None
+    file_size: int | None = None
 
     class Config:
         from_attributes = True
@@ -58,6 +62,11 @@ class SovietSupportEventUpdate(SovietSupportEventBase):
 
 class SovietSupportEventResponse(SovietSupportEventBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -116,6 +125,11 @@ class SovietLeaderUpdate(SovietLeaderBase):
 
 class SovietLeaderResponse(SovietLeaderBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -145,6 +159,11 @@ class SovietNewsUpdate(SovietNewsBase):
 
 class SovietNewsResponse(SovietNewsBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -229,6 +248,10 @@ class LearningDocumentUpdate(LearningDocumentBase):
 
 class LearningDocumentResponse(LearningDocumentBase):
     id: uuid.UUID
+    # Миниатюра первой страницы, количество страниц и размер файла
+    thumbnail_url: str | None = None
+    page_count: int | None = None
+    file_size: int | None = None
 
     class Config:
         from_attributes = True
@@ -264,6 +287,11 @@ class LearningEventUpdate(LearningEventBase):
 
 class LearningEventResponse(LearningEventBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -325,6 +353,11 @@ class LearningNewsUpdate(LearningNewsBase):
 
 class LearningNewsResponse(LearningNewsBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -389,6 +422,11 @@ class LearningContactUpdate(LearningContactBase):
 
 class LearningContactResponse(LearningContactBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -412,6 +450,10 @@ class OnlineConferenceRegulationUpdate(OnlineConferenceRegulationBase):
 
 class OnlineConferenceRegulationResponse(OnlineConferenceRegulationBase):
     id: uuid.UUID
+    # Миниатюра первой страницы, количество страниц и размер файла
+    thumbnail_url: str | None = None
+    page_count: int | None = None
+    file_size: int | None = None
 
     class Config:
         from_attributes = True
@@ -438,11 +480,25 @@ class OnlineConferenceParticipantUpdate(OnlineConferenceParticipantBase):
 
 class OnlineConferenceParticipantResponse(OnlineConferenceParticipantBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
 
 
+class OnlineConferenceParticipantBatchItem(BaseModel):
+    # Порядковый номер элемента в запросе
+    index: int
+    # Созданный участник (если файл сохранен)
+    item: OnlineConferenceParticipantResponse | None = None
+    # Причина, по которой элемент не был создан
+    error: str | None = None
+
+
 class OnlineConferenceNewsBase(BaseModel):
     # Заголовок
     title: Annotated[str, Field(max_length=200)]
@@ -467,6 +523,11 @@ class OnlineConferenceNewsUpdate(OnlineConferenceNewsBase):
 
 class OnlineConferenceNewsResponse(OnlineConferenceNewsBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -531,6 +592,11 @@ class OnlineConferenceContactUpdate(OnlineConferenceContactBase):
 
 class OnlineConferenceContactResponse(OnlineConferenceContactBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -615,6 +681,11 @@ class PodcastNewsUpdate(PodcastNewsBase):
 
 class PodcastNewsResponse(PodcastNewsBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -647,6 +718,11 @@ class PodcastContactUpdate(PodcastContactBase):
 
 class PodcastContactResponse(PodcastContactBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -676,6 +752,11 @@ class ProjectNewsUpdate(ProjectNewsBase):
 
 class ProjectNewsResponse(ProjectNewsBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
@@ -722,11 +803,24 @@ class CompetitionDocumentUpdate(CompetitionDocumentBase):
 
 class CompetitionDocumentResponse(CompetitionDocumentBase):
     id: uuid.UUID
+    # Миниатюра первой страницы, количество страниц и размер файла
+    thumbnail_url: str | None = None
+    page_count: int | None = None
+    file_size: int | None = None
 
     class Config:
         from_attributes = True
 
 
+class CompetitionDocumentBatchItem(BaseModel):
+    # Порядковый номер элемента в запросе
+    index: int
+    # Созданный документ (если файл сохранен)
+    item: CompetitionDocumentResponse | None = None
+    # Причина, по которой элемент не был создан
+    error: str | None = None
+
+
 class CompetitionContactBase(BaseModel):
     # Название ответственной организации
     organization_name: Annotated[str, Field(max_length=200)]
@@ -777,6 +871,11 @@ class JournalNewsUpdate(JournalNewsBase):
 
 class JournalNewsResponse(JournalNewsBase):
     id: uuid.UUID
+    # Размеры, основной цвет и размытая миниатюра изображения
+    image_width: int | None = None
+    image_height: int | None = None
+    image_color: str | None = None
+    image_placeholder: str | None = None
 
     class Config:
         from_attributes = True
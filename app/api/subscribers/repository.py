@@ -4,7 +4,7 @@ from sqlalchemy import select, desc
 from sqlalchemy.orm import joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.models import Subscriber
+from core.models import Subscriber, NewsletterMailing
 from api.subscribers.schemas import SubscriberCreate
 from api.news.repository import get_news_type_by_id
 from repository.base import BaseRepository
@@ -15,6 +15,20 @@ class SubscriberRepository(BaseRepository):
         super().__init__(session=session, model=Subscriber)
 
 
+class NewsletterMailingRepository(BaseRepository):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session=session, model=NewsletterMailing)
+
+    async def get_recent(self, limit: int) -> list[NewsletterMailing]:
+        stmt = (
+            select(NewsletterMailing)
+            .order_by(desc(NewsletterMailing.created_at))
+            .limit(limit)
+        )
+        result = await self.session.scalars(stmt)
+        return list(result.all())
+
+
 async def get_subscribers(
     session: AsyncSession,
 ) -> list[Subscriber]:
@@ -1,18 +1,22 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, Form
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, Form, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.file.service import file_service
 from core.models import User
 from core.db_helper import db_helper
 from api.dependencies import get_current_active_user
-from api.subscribers.repository import SubscriberRepository
+from api.subscribers.repository import (
+    SubscriberRepository,
+    NewsletterMailingRepository,
+)
 from api.subscribers.schemas import (
     SubscriberCreate,
     SubscriberResponse,
     SubscriberUpdate,
+    NewsletterMailingResponse,
 )
 
 
@@ -29,6 +33,17 @@ async def get_subscribers(
     return subscribers
 
 
+@router.get("/mailings/", response_model=list[NewsletterMailingResponse])
+async def get_newsletter_mailings(
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    session: AsyncSession = Depends(db_helper.session_getter),
+    user: User = Depends(get_current_active_user),
+):
+    """Последние рассылки новостей с количеством отправленных писем и скоростью"""
+    mailing_repo = NewsletterMailingRepository(session)
+    return await mailing_repo.get_recent(limit)
+
+
 @router.get("/{subscriber_id}/", response_model=SubscriberResponse)
 async def get_subscriber_by_id(
     subscriber_id: uuid.UUID,
@@ -1,8 +1,8 @@
 from typing import Annotated
-from datetime import date
+from datetime import date, datetime
 import uuid
 
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, Field, EmailStr, computed_field
 
 
 class SubscriberBase(BaseModel):
@@ -30,3 +30,24 @@ class NewsLetter(BaseModel):
     title: str
     text: str
     news_url: str
+
+
+class NewsletterMailingResponse(BaseModel):
+    id: uuid.UUID
+    type_id: uuid.UUID
+    subject: str
+    status: str
+    sent_count: int
+    failed_count: int
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
+
+    @computed_field
+    @property
+    def emails_per_second(self) -> float | None:
+        """Скорость отправки завершенной рассылки"""
+        if not self.started_at or not self.finished_at:
+            return None
+        elapsed = (self.finished_at - self.started_at).total_seconds()
+        return round(self.sent_count / elapsed, 1) if elapsed > 0 else None
@@ -7,6 +7,13 @@ from core.models import User
 from api.auth.schemas import UserRegister
 from api.users.schemas import UserUpdate
 from api.users.helpers import is_valid_email
+from api.auth.helpers import remember_token_version
+
+
+def _bump_token_version(user: User):
+    # Все выданные ранее access токены пользователя становятся недействительными
+    user.token_version += 1
+    remember_token_version(user_id=user.id, token_version=user.token_version)
 
 
 async def create_user(session: AsyncSession, user_in: UserRegister) -> User:
@@ -97,6 +104,7 @@ async def deactivate_user(
         return False
 
     user.is_active = False
+    _bump_token_version(user)
     await session.commit()
     return True
 
@@ -110,6 +118,7 @@ async def activate_user(
         return False
 
     user.is_active = True
+    _bump_token_version(user)
     await session.commit()
     return True
 
@@ -144,6 +153,7 @@ async def delete_user(
     if not user:
         return False
 
+    _bump_token_version(user)
     await session.delete(user)
     await session.commit()
 
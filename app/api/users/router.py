@@ -6,10 +6,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.models import User
 from core.db_helper import db_helper
-from api.dependencies import get_current_active_user, get_current_admin
+from api.dependencies import get_current_active_user, get_current_admin_claims
 from api.users import repository
 from api.users.schemas import UserResponse, UserUpdate
-from api.auth.schemas import UserChangePassword
+from api.auth.schemas import UserChangePassword, AccessTokenClaims
 from api.auth import repository as auth_crud
 
 
@@ -46,7 +46,7 @@ async def update_user(
 @router.get("/{user_id}/", response_model=UserResponse)
 async def get_user_by_id(
     user_id: uuid.UUID,
-    admin: User = Depends(get_current_admin),
+    admin: AccessTokenClaims = Depends(get_current_admin_claims),
     session: AsyncSession = Depends(db_helper.session_getter),
 ):
     user = await repository.get_user_by_id(session=session, user_id=user_id)
@@ -64,7 +64,7 @@ async def get_users(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=0),
     is_active: bool | None = None,
-    admin: User = Depends(get_current_admin),
+    admin: AccessTokenClaims = Depends(get_current_admin_claims),
     session: AsyncSession = Depends(db_helper.session_getter),
 ):
     users = await repository.get_users(
@@ -76,7 +76,7 @@ async def get_users(
 @router.delete("/{user_id}/deactivate/")
 async def deactivate_user(
     user_id: uuid.UUID,
-    admin: User = Depends(get_current_admin),
+    admin: AccessTokenClaims = Depends(get_current_admin_claims),
     session: AsyncSession = Depends(db_helper.session_getter),
 ):
     is_deactivated = await repository.deactivate_user(session=session, user_id=user_id)
@@ -92,7 +92,7 @@ async def deactivate_user(
 @router.patch("/{user_id}/activate/")
 async def activate_user(
     user_id: uuid.UUID,
-    admin: User = Depends(get_current_admin),
+    admin: AccessTokenClaims = Depends(get_current_admin_claims),
     session: AsyncSession = Depends(db_helper.session_getter),
 ):
     is_activated = await repository.activate_user(session=session, user_id=user_id)
@@ -129,7 +129,7 @@ async def change_user_password(
 @router.delete("/{user_id}/delete/")
 async def delete_user(
     user_id: uuid.UUID,
-    admin: User = Depends(get_current_admin),
+    admin: AccessTokenClaims = Depends(get_current_admin_claims),
     session: AsyncSession = Depends(db_helper.session_getter),
 ):
     is_deleted = await repository.delete_user(session=session, user_id=user_id)
@@ -0,0 +1,50 @@
+import asyncio
+
+from sqlalchemy import select
+
+from core.db_helper import db_helper
+from core.file.document_preview import (
+    DOCUMENT_PREVIEW_CONTENT_TYPES,
+    document_preview_service,
+)
+from core.file.process_pool import shutdown_process_pool
+from core.file.storage import storage
+from core.models import StoredFile
+
+
+async def backfill_document_text() -> int:
+    """Извлечение текста для поиска из уже загруженных документов"""
+    async with db_helper.session_factory() as session:
+        files = (
+            await session.execute(
+                select(StoredFile.path, StoredFile.content_type).where(
+                    StoredFile.content_type.in_(DOCUMENT_PREVIEW_CONTENT_TYPES),
+                    StoredFile.content_text.is_(None),
+                )
+            )
+        ).all()
+
+    documents = [
+        (path, local_path, content_type)
+        for path, content_type in files
+        if (local_path := storage.get_local_path(path)) is not None
+        and local_path.is_file()
+    ]
+
+    await asyncio.gather(
+        *(document_preview_service.generate(*document) for document in documents)
+    )
+    return len(documents)
+
+
+async def main():
+    try:
+        documents_count = await backfill_document_text()
+        print(f"Обработано документов: {documents_count}")
+    finally:
+        shutdown_process_pool()
+        await db_helper.engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,44 @@
+import asyncio
+import re
+
+from core.config import settings
+from core.file.image_variants import image_variant_service
+from core.file.process_pool import shutdown_process_pool
+
+# Расширения изображений, для которых создаются уменьшенные копии
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+# Имена уже созданных копий (<имя>_<ширина>w.<формат>)
+VARIANT_NAME_PATTERN = re.compile(r"_\d+w$")
+
+
+async def backfill_image_variants() -> int:
+    """Создание уменьшенных копий для уже загруженных изображений"""
+    uploads_dir = settings.file.uploads_dir
+    images = [
+        path
+        for path in uploads_dir.rglob("*")
+        if path.is_file()
+        and not path.name.startswith(".")
+        and path.suffix.lower() in IMAGE_EXTENSIONS
+        and not VARIANT_NAME_PATTERN.search(path.stem)
+    ]
+
+    created_count = 0
+    for created_paths in asyncio.as_completed(
+        [image_variant_service.generate(path) for path in images]
+    ):
+        created_count += len(await created_paths)
+
+    return created_count
+
+
+async def main():
+    try:
+        created_count = await backfill_image_variants()
+        print(f"Создано уменьшенных копий изображений: {created_count}")
+    finally:
+        shutdown_process_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+import os
+import time
+import tempfile
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+
+
+TEMPLATES_PATH = Path(__file__).parent / "core" / "email" / "templates"
+
+CONTEXT = dict(
+    title="Итоги конкурса управляющих советов",
+    text="Подведены итоги ежегодного конкурса управляющих советов школ. " * 5,
+    redirect_url="https://example.com/news/1",
+    email="subscriber@example.com",
+)
+
+
+def create_environment(
+    auto_reload: bool,
+    cache_dir: str | None = None,
+) -> Environment:
+    return Environment(
+        loader=FileSystemLoader(TEMPLATES_PATH),
+        autoescape=True,
+        auto_reload=auto_reload,
+        bytecode_cache=FileSystemBytecodeCache(cache_dir) if cache_dir else None,
+    )
+
+
+def count_stat_calls(render) -> int:
+    # Проверка актуальности шаблона в FileSystemLoader вызывает os.path.getmtime
+    calls = 0
+    getmtime = os.path.getmtime
+
+    def counting_getmtime(path):
+        nonlocal calls
+        calls += 1
+        return getmtime(path)
+
+    os.path.getmtime = counting_getmtime
+    try:
+        render()
+    finally:
+        os.path.getmtime = getmtime
+    return calls
+
+
+def benchmark_render(name: str, env: Environment, renders_count: int):
+    def render_all():
+        for _ in range(renders_count):
+            env.get_template("mailing.html").render(**CONTEXT)
+
+    # Первый рендеринг компилирует шаблон, его не учитываем
+    env.get_template("mailing.html").render(**CONTEXT)
+
+    started = time.perf_counter()
+    render_all()
+    elapsed = time.perf_counter() - started
+    stat_calls = count_stat_calls(render_all)
+
+    print(
+        f"{name:<32} | {elapsed / renders_count * 1_000_000:8.1f} мкс/письмо | "
+        f"проверок файлов: {stat_calls / renders_count:.1f} на письмо"
+    )
+
+
+def benchmark_compile(name: str, cache_dir: str | None):
+    env = create_environment(auto_reload=False, cache_dir=cache_dir)
+    started = time.perf_counter()
+    for template_name in env.list_templates(extensions=["html"]):
+        env.get_template(template_name)
+    elapsed = time.perf_counter() - started
+    print(f"{name:<32} | {elapsed * 1000:8.1f} мс на все шаблоны")
+
+
+if __name__ == "__main__":
+    # python benchmark_email_templates.py
+    renders_count = 10_000
+    for name, auto_reload in (
+        ("auto_reload=True (было)", True),
+        ("auto_reload=False (стало)", False),
+    ):
+        benchmark_render(name, create_environment(auto_reload), renders_count)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        benchmark_compile("Компиляция без кеша байткода", None)
+        benchmark_compile("Компиляция, пустой кеш", cache_dir)
+        benchmark_compile("Компиляция, кеш байткода", cache_dir)
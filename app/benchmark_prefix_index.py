@@ -0,0 +1,91 @@
+import random
+import time
+import tracemalloc
+import uuid
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+from core.models import News
+from core.search.prefix_index import PrefixIndex
+
+
+# Словарь для генерации заголовков, похожих на заголовки новостей сайта
+WORDS = [
+    "управляющий",
+    "совет",
+    "школа",
+    "образование",
+    "родители",
+    "конкурс",
+    "проект",
+    "обучение",
+    "встреча",
+    "конференция",
+    "подкаст",
+    "журнал",
+    "наставник",
+    "этикет",
+    "траектория",
+    "ребенок",
+    "программа",
+    "итоги",
+    "ёлка",
+    "олимпиада",
+    "семинар",
+    "педагог",
+    "директор",
+    "молодежь",
+]
+
+
+def make_news(count: int) -> list[SimpleNamespace]:
+    today = date.today()
+    return [
+        SimpleNamespace(
+            id=uuid.uuid4(),
+            title=" ".join(random.choices(WORDS, k=random.randint(3, 10))).capitalize(),
+            keywords=random.sample(WORDS, k=3),
+            news_date=today - timedelta(days=random.randint(0, 3650)),
+        )
+        for _ in range(count)
+    ]
+
+
+def percentile(values: list[float], percent: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+def benchmark(items_count: int, queries_count: int = 10_000):
+    news = make_news(items_count)
+    index = PrefixIndex(max_entries=1_000_000, max_title_words=8, scan_limit=200)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    index.load({News: news})
+    build_time = time.perf_counter() - started
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    queries = [
+        random.choice(WORDS)[: random.randint(1, 6)] for _ in range(queries_count)
+    ]
+    latencies = []
+    for query in queries:
+        started = time.perf_counter()
+        index.suggest(query, limit=5)
+        latencies.append(time.perf_counter() - started)
+
+    print(
+        f"Материалов: {items_count:>7} | записей: {len(index):>8} | "
+        f"построение: {build_time:6.2f} с | память: {memory / 1024 / 1024:7.1f} МБ | "
+        f"p50: {percentile(latencies, 50) * 1000:.3f} мс | "
+        f"p99: {percentile(latencies, 99) * 1000:.3f} мс"
+    )
+
+
+if __name__ == "__main__":
+    # python benchmark_prefix_index.py
+    random.seed(0)
+    for items_count in (1_000, 10_000, 50_000):
+        benchmark(items_count)
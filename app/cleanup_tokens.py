@@ -1,11 +1,16 @@
-import datetime
+import asyncio
+from datetime import datetime
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from sqlalchemy import delete, and_
 
+from core.config import settings
 from core.db_helper import db_helper
 from core.models import RefreshToken
+from core.email.worker import cleanup_email_outbox
+from core.email.digest import create_news_digests
+from cleanup_uploads import scheduled_cleanup_uploads
 
 
 async def cleanup_tokens():
@@ -42,6 +47,33 @@ async def setup_cleanup_tokens():
             replace_existing=True,
         )
 
+        # Удаление давно отправленных и неотправленных писем из очереди
+        scheduler.add_job(
+            cleanup_email_outbox,
+            trigger=CronTrigger(hour=3, minute=30),
+            id="email_outbox_cleanup",
+            replace_existing=True,
+        )
+
+        # Дайджест новостей подписчикам (в режиме рассылки digest)
+        scheduler.add_job(
+            create_news_digests,
+            trigger=CronTrigger(
+                hour=settings.newsletter.digest_hour,
+                minute=settings.newsletter.digest_minute,
+            ),
+            id="news_digest",
+            replace_existing=True,
+        )
+
+        # Сверка папки загрузок со ссылками на файлы в БД
+        scheduler.add_job(
+            scheduled_cleanup_uploads,
+            trigger=CronTrigger(hour=4, minute=0),
+            id="uploads_cleanup",
+            replace_existing=True,
+        )
+
         scheduler.start()
 
         while True:
@@ -0,0 +1,239 @@
+import os
+import re
+import sys
+import time
+import asyncio
+import logging
+from pathlib import Path
+from typing import Iterator
+from dataclasses import dataclass
+
+from sqlalchemy import select, union_all, delete
+
+from core.config import settings
+from core.db_helper import db_helper
+from core.models import Base, StoredFile
+from core.file.compression import COMPRESSED_ENCODINGS
+
+logger = logging.getLogger(__name__)
+
+# Колонки моделей, в которых хранятся пути к загруженным файлам
+FILE_URL_COLUMNS = {"image_url", "file_url", "logo_url", "document_url"}
+# Сколько путей проверяется в БД за один запрос
+BATCH_SIZE = 500
+# Папка, куда переносятся файлы без ссылок (внутри папки загрузок)
+QUARANTINE_FOLDER = ".quarantine"
+
+# Уменьшенные копии изображений и миниатюры документов: <имя>_<ширина>w.<формат>, <имя>_thumb.webp
+VARIANT_NAME_PATTERN = re.compile(r"^(?P<stem>.+)_(?:\d+w|thumb)\.[a-z0-9]+$")
+COMPRESSED_SUFFIXES = tuple(COMPRESSED_ENCODINGS.values())
+
+
+@dataclass
+class UploadsCleanupReport:
+    scanned_files: int = 0
+    scanned_bytes: int = 0
+    orphaned_files: int = 0
+    orphaned_bytes: int = 0
+    quarantined_files: int = 0
+    duration_seconds: float = 0.0
+
+
+def get_file_url_columns() -> list:
+    columns = []
+    for mapper in Base.registry.mappers:
+        for column in mapper.columns:
+            if column.key in FILE_URL_COLUMNS:
+                columns.append(column)
+    return columns
+
+
+def iter_upload_dirs(root: Path) -> Iterator[tuple[Path, list[os.DirEntry]]]:
+    """Обход папки загрузок через os.scandir (файлы отдаются по папкам)"""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        files = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != QUARANTINE_FOLDER:
+                        stack.append(Path(entry.path))
+                elif entry.is_file(follow_symlinks=False):
+                    files.append(entry)
+        yield directory, files
+
+
+def is_copy_name(name: str) -> bool:
+    return name.endswith(COMPRESSED_SUFFIXES) or bool(VARIANT_NAME_PATTERN.match(name))
+
+
+def get_original_name(name: str, originals_by_stem: dict[str, str]) -> str | None:
+    """Имя оригинала для сжатой или уменьшенной копии"""
+    if name.endswith(COMPRESSED_SUFFIXES):
+        return name.rsplit(".", 1)[0]
+
+    match = VARIANT_NAME_PATTERN.match(name)
+    return originals_by_stem.get(match.group("stem")) if match else None
+
+
+async def find_referenced_paths(session, columns: list, paths: list[str]) -> set[str]:
+    stmt = union_all(
+        *[select(column.label("path")).where(column.in_(paths)) for column in columns]
+    )
+    result = await session.scalars(stmt)
+    return set(result.all())
+
+
+def classify_upload_dir(
+    entries: list[os.DirEntry],
+    uploads_dir: Path,
+    min_age: int,
+    report: UploadsCleanupReport,
+) -> tuple[dict[str, os.DirEntry], dict[str, list[os.DirEntry]], list[os.DirEntry]]:
+    """
+    Разбор файлов папки на оригиналы, их копии и файлы без оригинала
+
+    Вызывает stat для каждого файла, поэтому выполняется в отдельном потоке
+    """
+    now = time.time()
+    names = {entry.name for entry in entries}
+    originals_by_stem = {
+        name.rsplit(".", 1)[0]: name for name in names if not is_copy_name(name)
+    }
+    originals: dict[str, os.DirEntry] = {}
+    copies: dict[str, list[os.DirEntry]] = {}
+    orphans: list[os.DirEntry] = []
+
+    for entry in entries:
+        entry_stat = entry.stat(follow_symlinks=False)
+        report.scanned_files += 1
+        report.scanned_bytes += entry_stat.st_size
+
+        # Недавние файлы могут еще не иметь записи в БД
+        if now - entry_stat.st_mtime < min_age or entry.name == ".keep":
+            continue
+
+        # Недописанные временные файлы
+        if entry.name.startswith("."):
+            orphans.append(entry)
+            continue
+
+        if not is_copy_name(entry.name):
+            relative_path = Path(entry.path).relative_to(uploads_dir)
+            originals[relative_path.as_posix()] = entry
+            continue
+
+        # Копии удаляются вместе с оригиналом или если оригинала уже нет
+        original_name = get_original_name(entry.name, originals_by_stem)
+        if original_name in names:
+            copies.setdefault(original_name, []).append(entry)
+        else:
+            orphans.append(entry)
+
+    return originals, copies, orphans
+
+
+def quarantine_file(source_path: str, target_path: Path) -> bool:
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.replace(source_path, target_path)
+    except OSError:
+        return False
+    return True
+
+
+async def cleanup_uploads(dry_run: bool = True) -> UploadsCleanupReport:
+    """
+    Поиск загруженных файлов, на которые не ссылается ни одна запись
+
+    В режиме dry_run файлы только подсчитываются, иначе переносятся в карантин.
+    Обход папок, stat и перенос файлов выполняются в отдельном потоке,
+    чтобы не блокировать цикл событий приложения
+    """
+    # Импорт здесь: сервис тянет за собой api, который импортирует этот модуль
+    from core.file.about_organization_service import about_organization_service
+
+    started_at = time.monotonic()
+    report = UploadsCleanupReport()
+    uploads_dir = settings.file.uploads_dir
+    quarantine_dir = uploads_dir / QUARANTINE_FOLDER
+    min_age = settings.file.orphan_grace_hours * 3600
+    columns = get_file_url_columns()
+
+    # Пути из JSON-хранилища информации об организации
+    about_organization = await about_organization_service.get_about_organization()
+    json_paths = {about_organization.document_url} if about_organization else set()
+
+    upload_dirs = iter_upload_dirs(uploads_dir)
+    async with db_helper.session_factory() as session:
+        while upload_dir := await asyncio.to_thread(next, upload_dirs, None):
+            _, entries = upload_dir
+            originals, copies, orphans = await asyncio.to_thread(
+                classify_upload_dir, entries, uploads_dir, min_age, report
+            )
+
+            paths = list(originals)
+            for start in range(0, len(paths), BATCH_SIZE):
+                batch = paths[start : start + BATCH_SIZE]
+                referenced = json_paths | await find_referenced_paths(
+                    session, columns, batch
+                )
+                for path in batch:
+                    if path not in referenced:
+                        entry = originals[path]
+                        orphans.append(entry)
+                        orphans.extend(copies.get(entry.name, []))
+
+            for entry in orphans:
+                # Результат stat уже сохранен в DirEntry при разборе папки
+                report.orphaned_files += 1
+                report.orphaned_bytes += entry.stat(follow_symlinks=False).st_size
+                relative_path = Path(entry.path).relative_to(uploads_dir)
+                logger.info("Orphaned upload: %s", relative_path)
+
+                if dry_run:
+                    continue
+
+                if not await asyncio.to_thread(
+                    quarantine_file, entry.path, quarantine_dir / relative_path
+                ):
+                    continue
+                report.quarantined_files += 1
+
+                # Файл больше не хранится - убираем его из индекса
+                await session.execute(
+                    delete(StoredFile).where(
+                        StoredFile.path == relative_path.as_posix()
+                    )
+                )
+
+            await session.commit()
+
+    report.duration_seconds = time.monotonic() - started_at
+    logger.info(
+        "Uploads cleanup (dry_run=%s): scanned %s files (%s bytes), "
+        "orphaned %s files (%s bytes), quarantined %s files in %.1fs",
+        dry_run,
+        report.scanned_files,
+        report.scanned_bytes,
+        report.orphaned_files,
+        report.orphaned_bytes,
+        report.quarantined_files,
+        report.duration_seconds,
+    )
+    return report
+
+
+async def scheduled_cleanup_uploads():
+    try:
+        return await cleanup_uploads(dry_run=settings.file.orphan_cleanup_dry_run)
+    except Exception:
+        logger.exception("Uploads cleanup failed")
+        return None
+
+
+if __name__ == "__main__":
+    # python cleanup_uploads.py [--apply]
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(cleanup_uploads(dry_run="--apply" not in sys.argv))
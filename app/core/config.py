@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 from pydantic import BaseModel, PostgresDsn, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -24,6 +25,10 @@ class AuthorizationConfig(BaseModel):
     refresh_token_expire_days: int
     registration_token_expire_minutes: int
     changing_password_token_expire_minutes: int
+    # Сколько секунд версия токенов пользователя берется из кэша без запроса к БД
+    token_version_cache_seconds: int = 5
+    # Сколько пользователей хранится в этом кэше
+    token_version_cache_size: int = 10000
 
 
 class DatabaseConfig(BaseModel):
@@ -48,6 +53,22 @@ class EmailConfig(BaseModel):
     starttls: bool
     ssl_tls: bool
     use_credentials: bool
+    # Сколько писем из очереди воркер берет за раз и сколько отправляет одновременно
+    outbox_batch_size: int = 20
+    outbox_concurrency: int = 4
+    # Как часто (в секундах) воркер проверяет очередь, если его не разбудили
+    outbox_poll_interval: float = 5
+    # На сколько секунд письмо закрепляется за воркером на время отправки
+    outbox_lease_seconds: int = 300
+    # Попытки отправки и задержка между ними (удваивается после каждой неудачи)
+    outbox_max_attempts: int = 8
+    outbox_retry_base_delay: float = 30
+    outbox_retry_max_delay: float = 3600
+    # Сколько дней хранить отправленные письма и письма, которые не удалось отправить
+    outbox_sent_retention_days: int = 7
+    outbox_dead_retention_days: int = 30
+    # Папка кеша байткода скомпилированных шаблонов писем
+    templates_cache_dir: Path = BASE_DIR / ".jinja_cache"
 
 
 class FrontendConfig(BaseModel):
@@ -68,6 +89,95 @@ class FileConfig(BaseModel):
     allowed_image_types: set[str]
     allowed_document_types: set[str]
     max_file_size: int
+    # Лимит тела запроса для маршрутов без загрузки файлов
+    max_json_body_size: int = 1024 * 1024
+    # Запас на служебные части multipart запроса (границы, поля формы)
+    multipart_overhead_size: int = 64 * 1024
+    # Размер и время жизни (в секундах) кеша метаданных файлов при отдаче
+    stat_cache_size: int = 4096
+    stat_cache_ttl: float = 300
+    # Отдача файлов через reverse proxy: "none", "x-accel-redirect" (nginx) или "x-sendfile"
+    offload_mode: Literal["none", "x-accel-redirect", "x-sendfile"] = "none"
+    # Внутренний location nginx, указывающий на папку загрузок
+    offload_internal_prefix: str = "/protected-uploads/"
+    # Файлы моложе этого срока (в часах) не считаются потерянными
+    orphan_grace_hours: int = 24
+    # Плановая очистка только сообщает о потерянных файлах, не перемещая их
+    orphan_cleanup_dry_run: bool = True
+    # Количество процессов для обработки загруженных файлов
+    processing_workers: int = 2
+    # Ширины уменьшенных копий изображений
+    image_variant_widths: list[int] = [320, 640, 1280]
+    # Форматы уменьшенных копий в порядке приоритета
+    image_variant_formats: list[str] = ["avif", "webp"]
+    # Ширина миниатюры первой страницы документа
+    document_thumbnail_width: int = 480
+    # Максимальная длина текста документа, сохраняемого для поиска
+    document_text_max_length: int = 200_000
+    # Максимальное количество файлов в пакетной загрузке
+    max_batch_files: int = 50
+    # Количество файлов пакета, сохраняемых одновременно
+    batch_upload_concurrency: int = 4
+
+
+class StorageConfig(BaseModel):
+    # Хранилище загруженных файлов: локальный диск или S3-совместимое хранилище
+    backend: Literal["local", "s3"] = "local"
+    s3_endpoint_url: str | None = None  # Например, http://minio:9000 для MinIO
+    s3_region: str = "us-east-1"
+    s3_bucket: str = ""
+    s3_access_key: str = ""
+    s3_secret_key: str = ""
+    # Размер части multipart загрузки и количество частей, отправляемых параллельно
+    s3_part_size: int = 8 * 1024 * 1024
+    s3_max_concurrency: int = 4
+    # Время жизни подписанных ссылок на файлы (в секундах)
+    s3_presigned_url_expire_seconds: int = 3600
+
+
+class SearchConfig(BaseModel):
+    # Максимальное количество записей в индексе подсказок в памяти
+    prefix_index_max_entries: int = 200_000
+    # По скольким словам заголовка (от начала каждого) ищутся подсказки
+    prefix_index_max_title_words: int = 8
+    # Сколько совпадений по префиксу просматривается для ранжирования по свежести
+    prefix_index_scan_limit: int = 200
+    # Сколько запросов федеративного поиска выполняется одновременно
+    federated_concurrency: int = 8
+    # Размер и время жизни (в секундах) кеша результатов поиска и подсказок.
+    # Кеш сбрасывается при изменении данных только в том процессе, где они
+    # изменены, другие процессы видят изменения не позже чем через cache_ttl
+    cache_size: int = 2048
+    cache_ttl: float = 30
+    # Сколько популярных запросов хранить для прогрева кеша после перезапуска
+    top_queries_size: int = 100
+    top_queries_path: Path = BASE_DIR / "search_top_queries.json"
+
+
+class NewsletterConfig(BaseModel):
+    # Рассылать ли подписчикам новые новости их типа
+    enabled: bool = True
+    # instant - письмо о каждой новости, digest - одно письмо со всеми новостями
+    # типа за период
+    mode: Literal["instant", "digest"] = "instant"
+    # Время ежедневной рассылки дайджеста и максимум новостей в одном письме
+    digest_hour: int = 9
+    digest_minute: int = 0
+    digest_max_news: int = 50
+    # Сколько подписчиков читается из базы и отмечается за раз
+    chunk_size: int = 500
+    # Количество одновременно открытых SMTP соединений
+    smtp_pool_size: int = 4
+    # После скольких писем соединение переоткрывается (ограничения почтовых сервисов)
+    max_messages_per_connection: int = 100
+    # Максимальное количество писем в секунду (0 - без ограничения)
+    rate_limit: float = 10
+    # На сколько секунд рассылка закрепляется за процессом и через сколько
+    # она возобновляется после сбоя почтового сервера
+    lease_seconds: int = 300
+    retry_delay: float = 60
+    # Как часто (в секундах) проверяется появление новых рассылок
+    poll_interval: float = 10
 
 
 class HeaderConfig(BaseModel):
@@ -94,6 +204,9 @@ class Settings(BaseSettings):
     frontend: FrontendConfig
     admin: AdminConfig
     file: FileConfig
+    storage: StorageConfig = StorageConfig()
+    search: SearchConfig = SearchConfig()
+    newsletter: NewsletterConfig = NewsletterConfig()
     header: HeaderConfig
     ssl: SSLConfig
 
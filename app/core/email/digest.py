@@ -0,0 +1,86 @@
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, func, text
+
+from core.config import settings
+from core.db_helper import db_helper
+from core.models import News, NewsType, Subscriber, NewsletterMailing
+
+
+logger = logging.getLogger(__name__)
+
+DIGEST_TEMPLATE_NAME = "digest.html"
+
+
+async def create_news_digests() -> int:
+    """
+    Создание рассылок дайджеста новостей, появившихся с прошлого запуска
+
+    Для каждого типа новостей с подтвержденными подписчиками создается одна
+    рассылка со всеми его новостями за период, ее отправляет NewsletterEngine
+    """
+    if not settings.newsletter.enabled or settings.newsletter.mode != "digest":
+        return 0
+
+    period_end = datetime.now(timezone.utc)
+    async with db_helper.session_factory() as session:
+        # Задача запускается в каждом процессе приложения, дайджест создает один из них
+        await session.execute(
+            text("SELECT pg_advisory_xact_lock(hashtext('newsletter_digest'))")
+        )
+
+        period_start = await session.scalar(
+            select(func.max(NewsletterMailing.period_end))
+        ) or period_end - timedelta(days=1)
+
+        # Новости периода только тех типов, на которые кто-то подписан
+        subscribed_type_ids = (
+            select(Subscriber.type_id)
+            .where(Subscriber.is_confirmed.is_(True))
+            .distinct()
+        )
+        rows = await session.execute(
+            select(News, NewsType.type)
+            .join(NewsType, News.type_id == NewsType.id)
+            .where(
+                News.created_at > period_start,
+                News.created_at <= period_end,
+                News.type_id.in_(subscribed_type_ids),
+            )
+            .order_by(News.created_at.desc())
+        )
+
+        news_by_type: dict = {}
+        for news, type_name in rows:
+            _, items = news_by_type.setdefault(news.type_id, (type_name, []))
+            if len(items) < settings.newsletter.digest_max_news:
+                items.append(
+                    dict(
+                        title=news.title,
+                        text=news.min_text,
+                        redirect_url=news.news_url,
+                    )
+                )
+
+        session.add_all(
+            NewsletterMailing(
+                type_id=type_id,
+                subject=f"Новости ЭКСРО: {type_name}",
+                template_name=DIGEST_TEMPLATE_NAME,
+                context=dict(type=type_name, news=items),
+                period_end=period_end,
+            )
+            for type_id, (type_name, items) in news_by_type.items()
+        )
+        await session.commit()
+
+    if news_by_type:
+        logger.info(
+            "Created news digests for %d news types (%s - %s)",
+            len(news_by_type),
+            period_start,
+            period_end,
+        )
+
+    return len(news_by_type)
@@ -0,0 +1,415 @@
+import time
+import uuid
+import asyncio
+import logging
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+from email.message import EmailMessage
+from email.utils import formataddr
+
+import aiosmtplib
+from markupsafe import escape
+from typing import NamedTuple
+
+from sqlalchemy import select, update, delete, func, or_
+from sqlalchemy.dialects.postgresql import insert
+
+from core.config import settings
+from core.db_helper import db_helper
+from core.models import Subscriber, NewsletterMailing, NewsletterDelivery
+from core.models.newsletter import (
+    MAILING_PENDING,
+    MAILING_RUNNING,
+    MAILING_DONE,
+    DELIVERY_CLAIMED,
+    DELIVERY_SENT,
+    DELIVERY_FAILED,
+    DELIVERY_UNKNOWN,
+)
+from core.email.service import email_service
+from core.email.smtp_pool import SMTPConnectionPool, RateLimiter
+
+
+logger = logging.getLogger(__name__)
+
+# Шаблон рендерится один раз с этой меткой вместо адреса получателя,
+# а для каждого письма метка заменяется на адрес
+RECIPIENT_EMAIL_PLACEHOLDER = "%%recipient_email%%"
+
+
+class MailingInterrupted(Exception):
+    """Почтовый сервер недоступен, рассылка будет продолжена позже"""
+
+
+class MailingReport(NamedTuple):
+    """Итоги запуска рассылки (до завершения или прерывания)"""
+
+    sent_count: int
+    failed_count: int
+    elapsed: float
+
+    @property
+    def emails_per_second(self) -> float:
+        return self.sent_count / self.elapsed if self.elapsed else 0
+
+
+class NewsletterEngine:
+    """
+    Рассылка писем подписчикам типа новостей
+
+    Подписчики читаются страницами по индексу (type_id, id), каждая страница
+    в своей короткой транзакции. Каждый подписчик отмечается
+    в newsletter_deliveries до отправки, а после каждой пачки сохраняется
+    последний обработанный подписчик. После сбоя рассылка продолжается
+    с этого места и не отправляет письма повторно.
+
+    Если процесс прервался между отметкой подписчика и сохранением результата,
+    неизвестно, ушло ли письмо. Такие отметки при продолжении получают статус
+    unknown, и письмо по ним повторно не отправляется
+    """
+
+    def __init__(self):
+        config = settings.newsletter
+        self.chunk_size: int = config.chunk_size
+        self.smtp_pool_size: int = config.smtp_pool_size
+        self.max_messages_per_connection: int = config.max_messages_per_connection
+        self.rate_limit: float = config.rate_limit
+        self.lease: timedelta = timedelta(seconds=config.lease_seconds)
+        self.retry_delay: timedelta = timedelta(seconds=config.retry_delay)
+        self.poll_interval: float = config.poll_interval
+        self.sender: str = formataddr(
+            (settings.email.mail_from_name, settings.email.mail_from)
+        )
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self):
+        while True:
+            mailing = None
+            try:
+                mailing = await self._claim_mailing()
+                if mailing is not None:
+                    await self.run_mailing(mailing)
+            except MailingInterrupted as e:
+                logger.warning("Mailing %s interrupted: %s", mailing.id, e)
+            except Exception:
+                logger.exception("Newsletter mailing failed")
+
+            if mailing is None:
+                await asyncio.sleep(self.poll_interval)
+
+    async def _claim_mailing(self) -> NewsletterMailing | None:
+        now = datetime.now(timezone.utc)
+        async with db_helper.session_factory() as session:
+            # Новые рассылки и рассылки, процесс которых перестал продлевать закрепление
+            ready_id = (
+                select(NewsletterMailing.id)
+                .where(
+                    NewsletterMailing.status.in_((MAILING_PENDING, MAILING_RUNNING)),
+                    or_(
+                        NewsletterMailing.lease_until.is_(None),
+                        NewsletterMailing.lease_until <= now,
+                    ),
+                )
+                .order_by(NewsletterMailing.created_at)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
+            )
+            mailing = await session.scalar(
+                update(NewsletterMailing)
+                .where(NewsletterMailing.id == ready_id)
+                .values(
+                    status=MAILING_RUNNING,
+                    lease_until=now + self.lease,
+                    started_at=func.coalesce(NewsletterMailing.started_at, now),
+                )
+                .returning(NewsletterMailing),
+                execution_options={"synchronize_session": False},
+            )
+            await session.commit()
+
+        return mailing
+
+    async def run_mailing(self, mailing: NewsletterMailing) -> MailingReport:
+        started = time.monotonic()
+        html = email_service.render(
+            mailing.template_name,
+            {**mailing.context, "email": RECIPIENT_EMAIL_PLACEHOLDER},
+        )
+        pool = SMTPConnectionPool(
+            size=self.smtp_pool_size,
+            max_messages_per_connection=self.max_messages_per_connection,
+        )
+        limiter = RateLimiter(self.rate_limit)
+
+        # Отметки, сделанные до закрепления рассылки за этим процессом,
+        # остались от прерванного запуска
+        unknown_count = await self._mark_unknown_deliveries(
+            mailing, datetime.now(timezone.utc)
+        )
+        if unknown_count:
+            logger.warning(
+                "Mailing %s: %d emails of the interrupted run have unknown "
+                "delivery status and are not resent",
+                mailing.id,
+                unknown_count,
+            )
+
+        sent_count = failed_count = 0
+        last_subscriber_id = mailing.checkpoint_subscriber_id
+        try:
+            while chunk := await self._read_chunk(mailing, last_subscriber_id):
+                sent, failed = await self._send_chunk(
+                    mailing, chunk, html, pool, limiter
+                )
+                sent_count += sent
+                failed_count += failed
+                last_subscriber_id = chunk[-1][0]
+        except MailingInterrupted:
+            await self._postpone(mailing)
+            raise
+        finally:
+            await pool.close()
+
+        await self._finish(mailing)
+
+        report = MailingReport(sent_count, failed_count, time.monotonic() - started)
+        logger.info(
+            "Mailing %s: sent %d, failed %d in %.1fs (%.1f emails/s)",
+            mailing.id,
+            report.sent_count,
+            report.failed_count,
+            report.elapsed,
+            report.emails_per_second,
+        )
+        return report
+
+    async def _mark_unknown_deliveries(
+        self,
+        mailing: NewsletterMailing,
+        claimed_before: datetime,
+    ) -> int:
+        async with db_helper.session_factory() as session:
+            result = await session.execute(
+                update(NewsletterDelivery)
+                .where(
+                    NewsletterDelivery.mailing_id == mailing.id,
+                    NewsletterDelivery.status == DELIVERY_CLAIMED,
+                    NewsletterDelivery.claimed_at < claimed_before,
+                )
+                .values(status=DELIVERY_UNKNOWN)
+            )
+            await session.commit()
+        return result.rowcount
+
+    async def _read_chunk(
+        self,
+        mailing: NewsletterMailing,
+        last_subscriber_id: uuid.UUID | None,
+    ) -> list:
+        # Транзакция не держится открытой, пока отправляются письма
+        stmt = (
+            select(Subscriber.id, Subscriber.email)
+            .where(
+                Subscriber.type_id == mailing.type_id,
+                Subscriber.is_confirmed.is_(True),
+            )
+            .order_by(Subscriber.id)
+            .limit(self.chunk_size)
+        )
+        if last_subscriber_id is not None:
+            stmt = stmt.where(Subscriber.id > last_subscriber_id)
+
+        async with db_helper.session_factory() as session:
+            return list(await session.execute(stmt))
+
+    async def _send_chunk(
+        self,
+        mailing: NewsletterMailing,
+        chunk,
+        html: str,
+        pool: SMTPConnectionPool,
+        limiter: RateLimiter,
+    ) -> tuple[int, int]:
+        claimed = await self._claim_deliveries(
+            mailing, [subscriber_id for subscriber_id, _ in chunk]
+        )
+
+        # После первой ошибки соединения остальные письма пачки не отправляем
+        interrupted = False
+
+        async def send(subscriber_id, email: str):
+            nonlocal interrupted
+            await limiter.wait()
+            if interrupted:
+                return subscriber_id, None
+            try:
+                await pool.send(self._build_message(mailing.subject, html, email))
+            except aiosmtplib.SMTPRecipientsRefused:
+                return subscriber_id, DELIVERY_FAILED
+            except aiosmtplib.SMTPResponseException as e:
+                # Постоянную ошибку (5xx) повторная отправка не исправит
+                if e.code >= 500:
+                    return subscriber_id, DELIVERY_FAILED
+                interrupted = True
+                return subscriber_id, None
+            except Exception:
+                interrupted = True
+                return subscriber_id, None
+            return subscriber_id, DELIVERY_SENT
+
+        results = await asyncio.gather(
+            *(
+                send(subscriber_id, email)
+                for subscriber_id, email in chunk
+                if subscriber_id in claimed
+            )
+        )
+
+        by_status = {DELIVERY_SENT: [], DELIVERY_FAILED: [], None: []}
+        for subscriber_id, status in results:
+            by_status[status].append(subscriber_id)
+        retry_ids = by_status.pop(None)
+
+        await self._save_chunk_results(
+            mailing,
+            by_status,
+            retry_ids,
+            # Точка продолжения сдвигается, только если отправлена вся пачка
+            checkpoint_subscriber_id=None if retry_ids else chunk[-1][0],
+        )
+
+        if retry_ids:
+            raise MailingInterrupted(f"{len(retry_ids)} emails were not sent")
+
+        return len(by_status[DELIVERY_SENT]), len(by_status[DELIVERY_FAILED])
+
+    async def _claim_deliveries(
+        self,
+        mailing: NewsletterMailing,
+        subscriber_ids: list[uuid.UUID],
+    ) -> set[uuid.UUID]:
+        """Отметка подписчиков перед отправкой (возвращаются отмеченные сейчас)"""
+        async with db_helper.session_factory() as session:
+            # Подписчики, уже отмеченные раньше, повторно письмо не получают
+            claimed = set(
+                await session.scalars(
+                    insert(NewsletterDelivery)
+                    .values(
+                        [
+                            dict(
+                                mailing_id=mailing.id,
+                                subscriber_id=subscriber_id,
+                                claimed_at=datetime.now(timezone.utc),
+                            )
+                            for subscriber_id in subscriber_ids
+                        ]
+                    )
+                    .on_conflict_do_nothing()
+                    .returning(NewsletterDelivery.subscriber_id)
+                )
+            )
+            await session.commit()
+        return claimed
+
+    async def _save_chunk_results(
+        self,
+        mailing: NewsletterMailing,
+        by_status: dict[str, list[uuid.UUID]],
+        retry_ids: list[uuid.UUID],
+        checkpoint_subscriber_id: uuid.UUID | None,
+    ):
+        async with db_helper.session_factory() as session:
+            for status, subscriber_ids in by_status.items():
+                if subscriber_ids:
+                    await session.execute(
+                        update(NewsletterDelivery)
+                        .where(
+                            NewsletterDelivery.mailing_id == mailing.id,
+                            NewsletterDelivery.subscriber_id.in_(subscriber_ids),
+                        )
+                        .values(status=status)
+                    )
+
+            values = dict(
+                sent_count=NewsletterMailing.sent_count + len(by_status[DELIVERY_SENT]),
+                failed_count=NewsletterMailing.failed_count
+                + len(by_status[DELIVERY_FAILED]),
+                lease_until=datetime.now(timezone.utc) + self.lease,
+            )
+            if retry_ids:
+                # Неотправленные письма снимаются с отметки, а точка продолжения
+                # не сдвигается, чтобы при возобновлении они были отправлены
+                await session.execute(
+                    delete(NewsletterDelivery).where(
+                        NewsletterDelivery.mailing_id == mailing.id,
+                        NewsletterDelivery.subscriber_id.in_(retry_ids),
+                    )
+                )
+            if checkpoint_subscriber_id is not None:
+                values["checkpoint_subscriber_id"] = checkpoint_subscriber_id
+
+            await session.execute(
+                update(NewsletterMailing)
+                .where(NewsletterMailing.id == mailing.id)
+                .values(**values)
+            )
+            await session.commit()
+
+    def _build_message(
+        self,
+        subject: str,
+        html: str,
+        recipient: str,
+    ) -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = recipient
+        message["Subject"] = subject
+        message.set_content(
+            html.replace(RECIPIENT_EMAIL_PLACEHOLDER, escape(recipient)),
+            subtype="html",
+        )
+        return message
+
+    async def _postpone(self, mailing: NewsletterMailing):
+        async with db_helper.session_factory() as session:
+            await session.execute(
+                update(NewsletterMailing)
+                .where(NewsletterMailing.id == mailing.id)
+                .values(lease_until=datetime.now(timezone.utc) + self.retry_delay)
+            )
+            await session.commit()
+
+    async def _finish(self, mailing: NewsletterMailing):
+        async with db_helper.session_factory() as session:
+            # Отметки нужны только для продолжения после сбоя, итоги хранятся в рассылке
+            await session.execute(
+                delete(NewsletterDelivery).where(
+                    NewsletterDelivery.mailing_id == mailing.id
+                )
+            )
+            await session.execute(
+                update(NewsletterMailing)
+                .where(NewsletterMailing.id == mailing.id)
+                .values(
+                    status=MAILING_DONE,
+                    lease_until=None,
+                    finished_at=datetime.now(timezone.utc),
+                )
+            )
+            await session.commit()
+
+
+newsletter_engine = NewsletterEngine()
@@ -0,0 +1,71 @@
+import asyncio
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import EmailOutbox
+from security.utils import encode_jwt
+
+
+# Сигнал воркеру о новых письмах, чтобы не ждать следующей проверки очереди
+outbox_wakeup = asyncio.Event()
+
+# Ключ контекста письма со ссылками, токены которых создаются при отправке
+TOKEN_LINKS_KEY = "token_links"
+
+
+def enqueue_email(
+    session: AsyncSession,
+    recipient: str,
+    subject: str,
+    template_name: str,
+    context: dict,
+    token_links: dict[str, dict] | None = None,
+) -> EmailOutbox:
+    """
+    Постановка письма в очередь в текущей транзакции сессии
+
+    Письмо сохраняется вместе с остальными изменениями и будет отправлено
+    воркером только после коммита, при откате транзакции оно пропадает.
+    Токены в очереди не хранятся: для ссылок с токеном сохраняются только
+    данные токена, а сам он подписывается при отправке письма
+
+    :param token_links: Переменная шаблона -> ссылка с токеном
+        (url, payload и expire_minutes токена)
+    """
+    if token_links:
+        context = {**context, TOKEN_LINKS_KEY: token_links}
+
+    email = EmailOutbox(
+        recipient=recipient,
+        subject=subject,
+        template_name=template_name,
+        context=context,
+    )
+    session.add(email)
+    session.info["email_outbox_pending"] = True
+    return email
+
+
+def build_email_context(context: dict) -> dict:
+    """Контекст шаблона письма с подписанными токенами в ссылках"""
+    context = dict(context)
+    for name, link in context.pop(TOKEN_LINKS_KEY, {}).items():
+        token = encode_jwt(
+            payload=link["payload"],
+            expire_minutes=link["expire_minutes"],
+        )
+        context[name] = f"{link['url']}/?token={token}"
+    return context
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_outbox_worker(session: Session):
+    if session.info.pop("email_outbox_pending", False):
+        outbox_wakeup.set()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_outbox_emails(session: Session):
+    session.info.pop("email_outbox_pending", None)
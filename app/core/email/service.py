@@ -1,7 +1,34 @@
-from jinja2 import Environment, FileSystemLoader
+import uuid
+
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
 from fastapi_mail import FastMail, ConnectionConfig, MessageSchema
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.config import settings, BASE_DIR
+from core.models import EmailOutbox
+from core.email.outbox import enqueue_email, build_email_context
+
+
+TEMPLATES_PATH = BASE_DIR / "app" / "core" / "email" / "templates"
+
+
+def create_templates_environment(auto_reload: bool = False) -> Environment:
+    """
+    Окружение Jinja для шаблонов писем
+
+    Без auto_reload скомпилированный шаблон берется из памяти без проверки
+    файла на каждом рендеринге, поэтому после изменения файлов шаблонов
+    нужно вызвать EmailService.invalidate_templates. Байткод шаблонов
+    кешируется на диске, чтобы не компилировать их заново после перезапуска
+    """
+    cache_dir = settings.email.templates_cache_dir
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(TEMPLATES_PATH),
+        autoescape=True,
+        auto_reload=auto_reload,
+        bytecode_cache=FileSystemBytecodeCache(str(cache_dir)),
+    )
 
 
 class EmailService:
@@ -17,24 +44,44 @@ class EmailService:
         USE_CREDENTIALS=settings.email.use_credentials,
     )
     fast_mail = FastMail(config)
-    templates_path = BASE_DIR / "app" / "core" / "email" / "templates"
-    env = Environment(
-        loader=FileSystemLoader(templates_path),
-        autoescape=True,
-        auto_reload=True,  # False для prod'а, True для dev'а
-    )
+    templates_path = TEMPLATES_PATH
+    env = create_templates_environment()
 
     @classmethod
-    async def send_register_invitation(cls, email: str, token: str):
-        template = cls.env.get_template("register_invitation.html")
+    def compile_templates(cls) -> int:
+        """Компиляция всех шаблонов заранее, чтобы первые письма ее не ждали"""
+        template_names = cls.env.list_templates(extensions=["html"])
+        for template_name in template_names:
+            cls.env.get_template(template_name)
+        return len(template_names)
 
-        html_content = template.render(
-            invitation_url=f"{settings.frontend.register_invitation_url}/?token={token}"
-        )
+    @classmethod
+    def invalidate_templates(cls):
+        """Сброс скомпилированных шаблонов после изменения их файлов"""
+        # Шаблоны наследуют base.html, поэтому сбрасываем все, а не только измененный
+        cls.env.cache.clear()
+        cls.env.bytecode_cache.clear()
+        cls.compile_templates()
+
+    @classmethod
+    def render(cls, template_name: str, context: dict) -> str:
+        template = cls.env.get_template(template_name)
+        return template.render(**context)
+
+    @classmethod
+    async def send(
+        cls,
+        recipient: str,
+        subject: str,
+        template_name: str,
+        context: dict,
+    ):
+        """Рендеринг шаблона и отправка письма (вызывается воркером очереди)"""
+        html_content = cls.render(template_name, build_email_context(context))
 
         message = MessageSchema(
-            subject="Приглашение на регистрацию",
-            recipients=[email],
+            subject=subject,
+            recipients=[recipient],
             body=html_content,
             subtype="html",
         )
@@ -42,89 +89,91 @@ class EmailService:
         await cls.fast_mail.send_message(message)
 
     @classmethod
-    async def send_changing_password_url(cls, email: str, token: str):
-        template = cls.env.get_template("changing_password.html")
-
-        html_content = template.render(
-            changing_password_url=f"{settings.frontend.changing_password_url}/?token={token}"
+    def queue_register_invitation(
+        cls,
+        session: AsyncSession,
+        email: str,
+    ) -> EmailOutbox:
+        return enqueue_email(
+            session,
+            recipient=email,
+            subject="Приглашение на регистрацию",
+            template_name="register_invitation.html",
+            context={},
+            token_links=dict(
+                invitation_url=dict(
+                    url=settings.frontend.register_invitation_url,
+                    payload={"email": email},
+                    expire_minutes=settings.auth.registration_token_expire_minutes,
+                ),
+            ),
         )
 
-        message = MessageSchema(
+    @classmethod
+    def queue_changing_password_url(
+        cls,
+        session: AsyncSession,
+        email: str,
+        user_id: uuid.UUID,
+    ) -> EmailOutbox:
+        return enqueue_email(
+            session,
+            recipient=email,
             subject="Изменение пароля",
-            recipients=[email],
-            body=html_content,
-            subtype="html",
+            template_name="changing_password.html",
+            context={},
+            token_links=dict(
+                changing_password_url=dict(
+                    url=settings.frontend.changing_password_url,
+                    payload={"sub": str(user_id), "email": email},
+                    expire_minutes=settings.auth.changing_password_token_expire_minutes,
+                ),
+            ),
         )
 
-        await cls.fast_mail.send_message(message)
-
     @classmethod
-    async def send_response_to_feedback(
+    def queue_response_to_feedback(
         cls,
+        session: AsyncSession,
         email: str,
         name: str,
         question: str,
         response: str,
-    ):
-        template = cls.env.get_template("feedback_response.html")
-
-        html_content = template.render(
-            name=name,
-            question=question,
-            response=response,
-        )
-
-        message = MessageSchema(
+    ) -> EmailOutbox:
+        return enqueue_email(
+            session,
+            recipient=email,
             subject="Ответ на вопрос",
-            recipients=[email],
-            body=html_content,
-            subtype="html",
+            template_name="feedback_response.html",
+            context=dict(
+                name=name,
+                question=question,
+                response=response,
+            ),
         )
 
-        await cls.fast_mail.send_message(message)
-
     @classmethod
-    async def send_confirmation_subscription(cls, email: str, token: str):
-        template = cls.env.get_template("confirmation_subscription.html")
-
-        html_content = template.render(
-            confirmation_url=f"{settings.frontend.subscription_confirmation_url}/?token={token}",
-        )
-
-        message = MessageSchema(
-            subject="Подтверждение рассылки",
-            recipients=[email],
-            body=html_content,
-            subtype="html",
-        )
-
-        await cls.fast_mail.send_message(message)
-
-    @classmethod
-    async def mailing_to_subscribed(
+    def queue_confirmation_subscription(
         cls,
-        news_title: str,
-        news_text: str,
-        news_url: str,
-        *emails: str,
-    ):
-        template = cls.env.get_template("mailing.html")
-
-        html_content = template.render(
-            title=news_title,
-            text=news_text,
-            redirect_url=news_url,
-        )
-
-        message = MessageSchema(
-            subject="Новая новость",
-            recipients=[*emails],
-            body=html_content,
-            subtype="html",
+        session: AsyncSession,
+        email: str,
+        token_payload: dict,
+    ) -> EmailOutbox:
+        return enqueue_email(
+            session,
+            recipient=email,
+            subject="Подтверждение рассылки",
+            template_name="confirmation_subscription.html",
+            context={},
+            token_links=dict(
+                confirmation_url=dict(
+                    url=settings.frontend.subscription_confirmation_url,
+                    payload=token_payload,
+                    expire_minutes=settings.auth.registration_token_expire_minutes,
+                ),
+            ),
         )
 
-        await cls.fast_mail.send_message(message)
-
 
 # Создаем экземпляр сервиса
 email_service = EmailService()
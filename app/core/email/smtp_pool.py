@@ -0,0 +1,103 @@
+import asyncio
+from contextlib import suppress
+from email.message import EmailMessage
+
+import aiosmtplib
+
+from core.config import settings
+
+
+class SMTPConnectionPool:
+    """
+    Пул открытых SMTP соединений для массовых рассылок
+
+    Подключение, TLS рукопожатие и авторизация выполняются один раз на много
+    писем, а не для каждого письма, как при отправке через FastMail
+    """
+
+    def __init__(self, size: int, max_messages_per_connection: int):
+        self.max_messages = max_messages_per_connection
+        # Свободные соединения и количество уже отправленных через них писем
+        self._idle: list[tuple[aiosmtplib.SMTP, int]] = []
+        self._semaphore = asyncio.Semaphore(size)
+
+    async def send(self, message: EmailMessage):
+        async with self._semaphore:
+            if self._idle:
+                client, sent = self._idle.pop()
+                try:
+                    await self._send(client, sent, message)
+                    return
+                except aiosmtplib.SMTPServerDisconnected:
+                    # Сервер мог закрыть простаивавшее соединение, пробуем новое
+                    pass
+
+            await self._send(await self._connect(), 0, message)
+
+    async def close(self):
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(self._quit(client) for client, _ in idle))
+
+    @staticmethod
+    async def _connect() -> aiosmtplib.SMTP:
+        config = settings.email
+        client = aiosmtplib.SMTP(
+            hostname=config.server,
+            port=config.port,
+            use_tls=config.ssl_tls,
+            start_tls=config.starttls,
+        )
+        await client.connect()
+        if config.use_credentials:
+            try:
+                await client.login(config.username, config.password)
+            except Exception:
+                client.close()
+                raise
+        return client
+
+    async def _send(
+        self,
+        client: aiosmtplib.SMTP,
+        sent: int,
+        message: EmailMessage,
+    ):
+        try:
+            await client.send_message(message)
+        except (aiosmtplib.SMTPRecipientsRefused, aiosmtplib.SMTPResponseException):
+            # Сервер отклонил письмо, но соединение осталось рабочим
+            self._idle.append((client, sent))
+            raise
+        except Exception:
+            client.close()
+            raise
+
+        sent += 1
+        if sent >= self.max_messages:
+            await self._quit(client)
+        else:
+            self._idle.append((client, sent))
+
+    @staticmethod
+    async def _quit(client: aiosmtplib.SMTP):
+        with suppress(Exception):
+            await client.quit()
+        client.close()
+
+
+class RateLimiter:
+    """Равномерное ограничение количества операций в секунду"""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate > 0 else 0
+        self._next_slot = 0.0
+
+    async def wait(self):
+        if not self.interval:
+            return
+
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
@@ -3,9 +3,10 @@ from pathlib import Path
 import aiofiles
 
 from fastapi import HTTPException, status
-from fastapi.templating import Jinja2Templates
+from jinja2 import TemplateSyntaxError
 
 from core.config import BASE_DIR
+from core.email.service import email_service
 from api.email_templates.schemas import EmailTemplateResponse, EmailTemplateUpdate
 
 
@@ -17,12 +18,12 @@ FEEDBACK_RESPONSE_TEMPLATE_NAME = "feedback_response.html"
 REGISTER_INVITATION_TEMPLATE_NAME = "register_invitation.html"
 CONFIRMATION_SUBSCRIPTION_TEMPLATE_NAME = "confirmation_register.html"
 MAILING_TEMPLATE_NAME = "mailing.html"
+DIGEST_TEMPLATE_NAME = "digest.html"
 
 
 class EmailTemplateService:
     def __init__(self, templates_dir: Path):
         self.templates_dir = templates_dir
-        self.jinja_env = Jinja2Templates(directory=self.templates_dir)
 
     async def get_template_content(self, template_name: str) -> EmailTemplateResponse:
         template_path = self.templates_dir / template_name
@@ -78,10 +79,22 @@ class EmailTemplateService:
             template_in.styles,
         )
 
+        # Шаблон с ошибкой не сохраняем, иначе сломается отправка писем
+        try:
+            email_service.env.from_string(updated_content)
+        except TemplateSyntaxError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Template syntax error at line {e.lineno}: {e.message}",
+            )
+
         # Сохраняем обновленный шаблон
         async with aiofiles.open(template_path, "w", encoding="utf-8") as f:
             await f.write(updated_content)
 
+        # Отправка писем берет шаблоны из памяти, поэтому сбрасываем их явно
+        email_service.invalidate_templates()
+
         # Возвращаем обновленный шаблон
         return EmailTemplateResponse(
             body=template_in.body or self._extract_body(current_content),
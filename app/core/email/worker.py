@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import random
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, update, delete, or_, and_
+
+from core.config import settings
+from core.db_helper import db_helper
+from core.models import EmailOutbox
+from core.models.email_outbox import EMAIL_PENDING, EMAIL_SENT, EMAIL_DEAD
+from core.email.outbox import outbox_wakeup
+from core.email.service import email_service
+
+
+logger = logging.getLogger(__name__)
+
+
+class EmailOutboxWorker:
+    """
+    Фоновая отправка писем из очереди email_outbox
+
+    Письма забираются с блокировкой SKIP LOCKED и закрепляются за воркером
+    на время отправки, поэтому несколько процессов приложения не отправят
+    одно письмо дважды, а письма упавшего процесса будут взяты повторно
+    """
+
+    def __init__(self):
+        self.batch_size: int = settings.email.outbox_batch_size
+        self.concurrency: int = settings.email.outbox_concurrency
+        self.poll_interval: float = settings.email.outbox_poll_interval
+        self.lease: timedelta = timedelta(seconds=settings.email.outbox_lease_seconds)
+        self.max_attempts: int = settings.email.outbox_max_attempts
+        self.retry_base_delay: float = settings.email.outbox_retry_base_delay
+        self.retry_max_delay: float = settings.email.outbox_retry_max_delay
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self):
+        while True:
+            outbox_wakeup.clear()
+            try:
+                processed = await self.process_batch()
+            except Exception:
+                logger.exception("Email outbox processing failed")
+                processed = 0
+
+            # Очередь разобрана, ждем новых писем или следующей проверки
+            if processed < self.batch_size:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(outbox_wakeup.wait(), self.poll_interval)
+
+    async def process_batch(self) -> int:
+        """Отправка одной пачки готовых писем, возвращает их количество"""
+        emails = await self._claim_batch()
+        if not emails:
+            return 0
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def send(email: EmailOutbox) -> str | None:
+            async with semaphore:
+                try:
+                    await email_service.send(
+                        recipient=email.recipient,
+                        subject=email.subject,
+                        template_name=email.template_name,
+                        context=email.context,
+                    )
+                except Exception as e:
+                    return f"{type(e).__name__}: {e}"
+                return None
+
+        errors = await asyncio.gather(*(send(email) for email in emails))
+        await self._save_results(zip(emails, errors))
+
+        return len(emails)
+
+    async def _claim_batch(self) -> list[EmailOutbox]:
+        now = datetime.now(timezone.utc)
+        async with db_helper.session_factory() as session:
+            ready_ids = (
+                select(EmailOutbox.id)
+                .where(
+                    EmailOutbox.status == EMAIL_PENDING,
+                    EmailOutbox.next_attempt_at <= now,
+                )
+                .order_by(EmailOutbox.next_attempt_at)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            # Попытка засчитывается сразу, чтобы письмо, на котором падает
+            # процесс, не отправлялось бесконечно
+            emails = await session.scalars(
+                update(EmailOutbox)
+                .where(EmailOutbox.id.in_(ready_ids.scalar_subquery()))
+                .values(
+                    attempts=EmailOutbox.attempts + 1,
+                    next_attempt_at=now + self.lease,
+                )
+                .returning(EmailOutbox),
+                execution_options={"synchronize_session": False},
+            )
+            emails = list(emails)
+            await session.commit()
+
+        return emails
+
+    async def _save_results(self, results):
+        now = datetime.now(timezone.utc)
+        async with db_helper.session_factory() as session:
+            for email, error in results:
+                if error is None:
+                    values = dict(status=EMAIL_SENT, sent_at=now, last_error=None)
+                elif email.attempts >= self.max_attempts:
+                    logger.error(
+                        "Email %s to %s moved to dead letters after %d attempts: %s",
+                        email.id,
+                        email.recipient,
+                        email.attempts,
+                        error,
+                    )
+                    values = dict(status=EMAIL_DEAD, last_error=error)
+                else:
+                    values = dict(
+                        next_attempt_at=now + self._get_retry_delay(email.attempts),
+                        last_error=error,
+                    )
+
+                await session.execute(
+                    update(EmailOutbox)
+                    .where(EmailOutbox.id == email.id)
+                    .values(**values)
+                )
+
+            await session.commit()
+
+    def _get_retry_delay(self, attempts: int) -> timedelta:
+        # Экспоненциальная задержка со случайным разбросом, чтобы после сбоя
+        # почтового сервера письма не отправлялись одной волной
+        delay = min(
+            self.retry_base_delay * 2 ** (attempts - 1),
+            self.retry_max_delay,
+        )
+        return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+
+async def cleanup_email_outbox() -> int:
+    """Удаление давно отправленных и давно не отправленных (dead) писем из очереди"""
+    now = datetime.now(timezone.utc)
+    sent_before = now - timedelta(days=settings.email.outbox_sent_retention_days)
+    dead_before = now - timedelta(days=settings.email.outbox_dead_retention_days)
+    async with db_helper.session_factory() as session:
+        result = await session.execute(
+            delete(EmailOutbox).where(
+                or_(
+                    and_(
+                        EmailOutbox.status == EMAIL_SENT,
+                        EmailOutbox.sent_at < sent_before,
+                    ),
+                    and_(
+                        EmailOutbox.status == EMAIL_DEAD,
+                        EmailOutbox.created_at < dead_before,
+                    ),
+                )
+            )
+        )
+        await session.commit()
+
+    return result.rowcount
+
+
+email_outbox_worker = EmailOutboxWorker()
@@ -0,0 +1,102 @@
+import os
+import gzip
+from pathlib import Path
+
+import brotli
+
+from core.file.process_pool import run_in_process, run_in_background
+from core.file.stat_cache import file_stat_cache
+
+
+# Сжатые копии в порядке приоритета: кодировка -> расширение файла
+COMPRESSED_ENCODINGS = {
+    "br": ".br",
+    "gzip": ".gz",
+}
+
+# Текстовые форматы, которые имеет смысл хранить в сжатом виде
+COMPRESSIBLE_EXTENSIONS = {".svg", ".txt", ".csv", ".xml", ".json", ".html", ".rtf"}
+
+
+def is_compressible(path: Path) -> bool:
+    return path.suffix.lower() in COMPRESSIBLE_EXTENSIONS
+
+
+def get_compressed_path(path: Path, encoding: str) -> Path:
+    return path.with_name(path.name + COMPRESSED_ENCODINGS[encoding])
+
+
+def compress_file(source_path: str) -> list[str]:
+    """
+    Создание gzip и brotli копий файла (выполняется в отдельном процессе)
+
+    Копия сохраняется, только если она меньше оригинала
+    """
+    path = Path(source_path)
+    content = path.read_bytes()
+    compressors = {
+        "br": lambda data: brotli.compress(data, quality=11),
+        "gzip": lambda data: gzip.compress(data, compresslevel=9, mtime=0),
+    }
+
+    created_paths = []
+    for encoding, compress in compressors.items():
+        compressed = compress(content)
+        if len(compressed) >= len(content):
+            continue
+
+        compressed_path = get_compressed_path(path, encoding)
+        temp_path = compressed_path.with_name(f".{compressed_path.name}.part")
+        temp_path.write_bytes(compressed)
+        os.replace(temp_path, compressed_path)
+        created_paths.append(str(compressed_path))
+
+    return created_paths
+
+
+async def _compress_in_process(path: Path) -> list[str]:
+    try:
+        return await run_in_process(compress_file, str(path))
+    except Exception:
+        return []
+
+
+def schedule_compression(path: Path):
+    """Фоновое создание сжатых копий, не задерживающее ответ на загрузку"""
+    run_in_background(_compress_in_process(path))
+
+
+def get_compressed_paths(path: Path) -> list[Path]:
+    return [get_compressed_path(path, encoding) for encoding in COMPRESSED_ENCODINGS]
+
+
+def _parse_accept_encoding(accept_encoding: str) -> set[str]:
+    encodings = set()
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        encodings.add(name.strip().lower())
+    return encodings
+
+
+def select_compressed(
+    path: Path,
+    accept_encoding: str,
+) -> tuple[Path, str | None]:
+    """Выбор сжатой копии файла, которую поддерживает клиент"""
+    accepted = _parse_accept_encoding(accept_encoding)
+    for encoding in COMPRESSED_ENCODINGS:
+        if encoding not in accepted and "*" not in accepted:
+            continue
+
+        compressed_path = get_compressed_path(path, encoding)
+        if file_stat_cache.stat(compressed_path) is not None:
+            return compressed_path, encoding
+
+    return path, None
@@ -0,0 +1,233 @@
+import os
+import re
+import zipfile
+from pathlib import Path
+from typing import NamedTuple
+from xml.etree import ElementTree
+
+from sqlalchemy import update
+
+from core.config import settings
+from core.db_helper import db_helper
+from core.models import Base, StoredFile
+from core.search.cache import search_cache
+from core.models.mixins.document_preview import DocumentPreviewMixin
+from core.file.process_pool import run_in_process, run_in_background
+
+
+PDF_CONTENT_TYPE = "application/pdf"
+DOCX_CONTENT_TYPE = (
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+)
+
+# Типы документов, для которых извлекаются миниатюра и количество страниц
+DOCUMENT_PREVIEW_CONTENT_TYPES = {PDF_CONTENT_TYPE, DOCX_CONTENT_TYPE}
+
+DOCX_PAGES_PATTERN = re.compile(rb"<(?:\w+:)?Pages>(\d+)</(?:\w+:)?Pages>")
+
+# Пространство имен элементов основного текста DOCX
+DOCX_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+# Элементы DOCX, после которых в тексте ставится разделитель
+DOCX_SEPARATOR_TAGS = {f"{DOCX_NAMESPACE}{tag}" for tag in ("p", "tab", "br")}
+
+
+class DocumentPreview(NamedTuple):
+    thumbnail_path: str | None = None
+    page_count: int | None = None
+    # Текст документа для полнотекстового поиска
+    content_text: str | None = None
+
+
+def get_thumbnail_path(path: Path) -> Path:
+    """Путь к миниатюре первой страницы (хранится рядом с оригиналом)"""
+    return path.with_name(f"{path.stem}_thumb.webp")
+
+
+def _clean_text(parts: list[str], max_length: int) -> str | None:
+    # Лишние пробелы и переносы не влияют на поиск, а NUL не допускается в text
+    text = " ".join("".join(parts).replace("\x00", " ").split())
+    return text[:max_length] or None
+
+
+def _extract_pdf_preview(
+    path: Path,
+    width: int,
+    max_text_length: int,
+) -> DocumentPreview:
+    import pymupdf
+    from PIL import Image
+
+    with pymupdf.open(path) as document:
+        page_count = document.page_count
+        if page_count == 0:
+            return DocumentPreview(page_count=page_count)
+
+        # Текст читаем постранично, пока не наберется нужная длина
+        parts, text_length = [], 0
+        for page in document:
+            if text_length >= max_text_length:
+                break
+            page_text = page.get_text()
+            parts.append(page_text)
+            text_length += len(page_text)
+
+        page = document[0]
+        zoom = width / page.rect.width
+        pixmap = page.get_pixmap(matrix=pymupdf.Matrix(zoom, zoom), alpha=False)
+
+    thumbnail_path = get_thumbnail_path(path)
+    temp_path = thumbnail_path.with_name(f".{thumbnail_path.name}.part")
+    image = Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
+    image.save(temp_path, format="WEBP", quality=80, method=4)
+    os.replace(temp_path, thumbnail_path)
+
+    return DocumentPreview(
+        str(thumbnail_path), page_count, _clean_text(parts, max_text_length)
+    )
+
+
+def _extract_docx_page_count(archive: zipfile.ZipFile) -> int | None:
+    # Количество страниц Word сохраняет в свойствах документа при последнем сохранении
+    try:
+        app_properties = archive.read("docProps/app.xml")
+    except KeyError:
+        return None
+
+    match = DOCX_PAGES_PATTERN.search(app_properties)
+    return int(match.group(1)) if match else None
+
+
+def _extract_docx_text(archive: zipfile.ZipFile, max_text_length: int) -> str | None:
+    try:
+        document = archive.open("word/document.xml")
+    except KeyError:
+        return None
+
+    parts, text_length = [], 0
+    with document:
+        for _, element in ElementTree.iterparse(document):
+            if element.tag == f"{DOCX_NAMESPACE}t" and element.text:
+                parts.append(element.text)
+                text_length += len(element.text)
+            elif element.tag in DOCX_SEPARATOR_TAGS:
+                parts.append(" ")
+
+            # Обработанные абзацы не держим в памяти
+            if element.tag == f"{DOCX_NAMESPACE}p":
+                element.clear()
+                if text_length >= max_text_length:
+                    break
+
+    return _clean_text(parts, max_text_length)
+
+
+def _extract_docx_preview(path: Path, max_text_length: int) -> DocumentPreview:
+    with zipfile.ZipFile(path) as archive:
+        return DocumentPreview(
+            page_count=_extract_docx_page_count(archive),
+            content_text=_extract_docx_text(archive, max_text_length),
+        )
+
+
+def extract_document_preview(
+    source_path: str,
+    content_type: str,
+    width: int,
+    max_text_length: int,
+) -> DocumentPreview:
+    """
+    Извлечение миниатюры первой страницы, количества страниц и текста
+    (выполняется в отдельном процессе)
+    """
+    path = Path(source_path)
+
+    if content_type == PDF_CONTENT_TYPE:
+        return _extract_pdf_preview(path, width, max_text_length)
+
+    if content_type == DOCX_CONTENT_TYPE:
+        return _extract_docx_preview(path, max_text_length)
+
+    return DocumentPreview()
+
+
+class DocumentPreviewService:
+    def __init__(self):
+        self.uploads_dir: Path = settings.file.uploads_dir
+        self.thumbnail_width: int = settings.file.document_thumbnail_width
+        self.max_text_length: int = settings.file.document_text_max_length
+
+    async def generate(self, file_path: str, local_path: Path, content_type: str):
+        try:
+            preview = await run_in_process(
+                extract_document_preview,
+                str(local_path),
+                content_type,
+                self.thumbnail_width,
+                self.max_text_length,
+            )
+        except Exception:
+            return
+
+        thumbnail_url = None
+        if preview.thumbnail_path is not None:
+            thumbnail_url = (
+                Path(preview.thumbnail_path).relative_to(self.uploads_dir).as_posix()
+            )
+
+        await self._save_preview(
+            file_path, thumbnail_url, preview.page_count, preview.content_text
+        )
+
+    def schedule(self, file_path: str, local_path: Path, content_type: str):
+        """Фоновая обработка документа, не задерживающая ответ на загрузку"""
+        run_in_background(self.generate(file_path, local_path, content_type))
+
+    async def _save_preview(
+        self,
+        file_path: str,
+        thumbnail_url: str | None,
+        page_count: int | None,
+        content_text: str | None,
+    ):
+        async with db_helper.session_factory() as session:
+            await session.execute(
+                update(StoredFile)
+                .where(StoredFile.path == file_path)
+                .values(
+                    thumbnail_path=thumbnail_url,
+                    page_count=page_count,
+                    content_text=content_text,
+                )
+            )
+
+            # Документ мог быть сохранен раньше, чем завершилась обработка файла
+            for model in self._get_document_models():
+                await session.execute(
+                    update(model)
+                    .where(model.file_url == file_path)
+                    .values(
+                        thumbnail_url=thumbnail_url,
+                        page_count=page_count,
+                        content_text=content_text,
+                    )
+                )
+
+            await session.commit()
+
+        # Текст документа попадает в поисковый индекс, поэтому прежние результаты устарели
+        if content_text:
+            search_cache.invalidate()
+
+    @staticmethod
+    def _get_document_models() -> list[type[DocumentPreviewMixin]]:
+        return [
+            mapper.class_
+            for mapper in Base.registry.mappers
+            if issubclass(mapper.class_, DocumentPreviewMixin)
+        ]
+
+    def get_preview_paths(self, path: Path) -> list[Path]:
+        return [get_thumbnail_path(path)]
+
+
+document_preview_service = DocumentPreviewService()
@@ -0,0 +1,167 @@
+import os
+import base64
+from io import BytesIO
+from pathlib import Path
+from typing import NamedTuple
+
+from PIL import Image, ImageOps, features
+
+from core.config import settings
+from core.file.process_pool import run_in_process, run_in_background
+from core.file.stat_cache import file_stat_cache
+
+
+# Типы изображений, для которых создаются уменьшенные копии
+IMAGE_VARIANT_CONTENT_TYPES = {"image/jpeg", "image/png", "image/webp"}
+
+# Типы изображений, для которых при загрузке определяются размеры и миниатюра
+IMAGE_METADATA_CONTENT_TYPES = IMAGE_VARIANT_CONTENT_TYPES | {
+    "image/gif",
+    "image/avif",
+}
+
+# Ширина размытой миниатюры, встраиваемой в ответ API
+PLACEHOLDER_WIDTH = 16
+
+VARIANT_SAVE_OPTIONS = {
+    "webp": {"quality": 80, "method": 4},
+    "avif": {"quality": 60},
+}
+
+
+def get_variant_path(path: Path, width: int, image_format: str) -> Path:
+    """Путь к уменьшенной копии изображения (хранится рядом с оригиналом)"""
+    return path.with_name(f"{path.stem}_{width}w.{image_format}")
+
+
+def generate_image_variants(
+    source_path: str,
+    widths: list[int],
+    formats: list[str],
+) -> list[str]:
+    """
+    Создание уменьшенных копий изображения (выполняется в отдельном процессе)
+
+    Копии шире оригинала не создаются
+    """
+    path = Path(source_path)
+    created_paths = []
+
+    with Image.open(path) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+        for width in sorted(widths):
+            if width >= image.width:
+                break
+
+            height = max(1, round(image.height * width / image.width))
+            resized = image.resize((width, height), Image.Resampling.LANCZOS)
+
+            for image_format in formats:
+                if not features.check(image_format):
+                    continue
+
+                variant_path = get_variant_path(path, width, image_format)
+                temp_path = variant_path.with_name(f".{variant_path.name}.part")
+                resized.save(
+                    temp_path,
+                    format=image_format.upper(),
+                    **VARIANT_SAVE_OPTIONS.get(image_format, {}),
+                )
+                os.replace(temp_path, variant_path)
+                created_paths.append(str(variant_path))
+
+    return created_paths
+
+
+class ImageMetadata(NamedTuple):
+    width: int
+    height: int
+    # Основной цвет (#rrggbb)
+    color: str
+    # Размытая миниатюра в виде data URI
+    placeholder: str
+
+
+def extract_image_metadata(source_path: str) -> ImageMetadata:
+    """
+    Размеры, основной цвет и размытая миниатюра изображения
+    (выполняется в отдельном процессе)
+    """
+    with Image.open(source_path) as original:
+        image = ImageOps.exif_transpose(original).convert("RGB")
+
+    # Основной цвет - средний цвет изображения
+    red, green, blue = image.resize((1, 1), Image.Resampling.BOX).getpixel((0, 0))
+
+    height = max(1, round(image.height * PLACEHOLDER_WIDTH / image.width))
+    placeholder = image.resize((PLACEHOLDER_WIDTH, height), Image.Resampling.BOX)
+    buffer = BytesIO()
+    placeholder.save(buffer, format="WEBP", quality=40)
+    encoded = base64.b64encode(buffer.getvalue()).decode("ascii")
+
+    return ImageMetadata(
+        width=image.width,
+        height=image.height,
+        color=f"#{red:02x}{green:02x}{blue:02x}",
+        placeholder=f"data:image/webp;base64,{encoded}",
+    )
+
+
+class ImageVariantService:
+    def __init__(self):
+        self.widths: list[int] = sorted(settings.file.image_variant_widths)
+        # Порядок форматов задает их приоритет при выборе копии
+        self.formats: list[str] = settings.file.image_variant_formats
+
+    async def generate(self, path: Path) -> list[str]:
+        try:
+            return await run_in_process(
+                generate_image_variants,
+                str(path),
+                self.widths,
+                self.formats,
+            )
+        except Exception:
+            return []
+
+    async def get_metadata(self, path: Path) -> ImageMetadata | None:
+        try:
+            return await run_in_process(extract_image_metadata, str(path))
+        except Exception:
+            return None
+
+    def schedule(self, path: Path):
+        """Фоновое создание копий, не задерживающее ответ на загрузку"""
+        run_in_background(self.generate(path))
+
+    def get_variant_paths(self, path: Path) -> list[Path]:
+        return [
+            get_variant_path(path, width, image_format)
+            for width in self.widths
+            for image_format in self.formats
+        ]
+
+    def select_variant(self, path: Path, width: int, accept: str) -> Path:
+        """
+        Выбор самой маленькой копии не уже запрошенной ширины в формате,
+        который поддерживает клиент. Если такой нет - возвращается оригинал
+        """
+        for image_format in self.formats:
+            if f"image/{image_format}" not in accept:
+                continue
+
+            for variant_width in self.widths:
+                if variant_width < width:
+                    continue
+
+                variant_path = get_variant_path(path, variant_width, image_format)
+                if file_stat_cache.stat(variant_path) is not None:
+                    return variant_path
+
+        return path
+
+
+image_variant_service = ImageVariantService()
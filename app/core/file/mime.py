@@ -0,0 +1,177 @@
+from pathlib import Path
+
+
+DEFAULT_MEDIA_TYPE = "application/octet-stream"
+
+# Расширение файла -> MIME тип (по этой таблице файлы отдаются клиенту)
+EXTENSION_MEDIA_TYPES = {
+    # Изображения
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".avif": "image/avif",
+    ".gif": "image/gif",
+    ".svg": "image/svg+xml",
+    ".ico": "image/x-icon",
+    # Документы
+    ".pdf": "application/pdf",
+    ".doc": "application/msword",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".xls": "application/vnd.ms-excel",
+    ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ".ppt": "application/vnd.ms-powerpoint",
+    ".pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+    ".odt": "application/vnd.oasis.opendocument.text",
+    ".ods": "application/vnd.oasis.opendocument.spreadsheet",
+    ".odp": "application/vnd.oasis.opendocument.presentation",
+    ".rtf": "application/rtf",
+    ".txt": "text/plain; charset=utf-8",
+    ".csv": "text/csv; charset=utf-8",
+    ".json": "application/json",
+    ".xml": "application/xml",
+    ".html": "text/html; charset=utf-8",
+    ".zip": "application/zip",
+    # Аудио и видео (подкасты)
+    ".mp3": "audio/mpeg",
+    ".m4a": "audio/mp4",
+    ".ogg": "audio/ogg",
+    ".wav": "audio/wav",
+    ".mp4": "video/mp4",
+    ".webm": "video/webm",
+}
+
+# MIME тип -> расширение, с которым сохраняется файл
+MEDIA_TYPE_EXTENSIONS = {
+    media_type.split(";")[0]: extension
+    for extension, media_type in reversed(EXTENSION_MEDIA_TYPES.items())
+}
+
+# Сигнатуры (magic bytes) форматов, определяемых по началу файла
+FILE_SIGNATURES: tuple[tuple[bytes, str], ...] = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"\x00\x00\x01\x00", "image/x-icon"),
+    (b"%PDF-", "application/pdf"),
+    (b"{\\rtf", "application/rtf"),
+    (b"ID3", "audio/mpeg"),
+    (b"OggS", "audio/ogg"),
+    (b"\x1a\x45\xdf\xa3", "video/webm"),
+)
+
+ZIP_SIGNATURE = b"PK\x03\x04"
+# Старые форматы MS Office (doc, xls, ppt) хранятся в контейнере OLE2
+OLE2_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+# Форматы на основе zip различаются по именам вложенных файлов
+ZIP_CONTENT_MARKERS: tuple[tuple[bytes, str], ...] = (
+    (b"word/", EXTENSION_MEDIA_TYPES[".docx"]),
+    (b"xl/", EXTENSION_MEDIA_TYPES[".xlsx"]),
+    (b"ppt/", EXTENSION_MEDIA_TYPES[".pptx"]),
+    (b"mimetypeapplication/vnd.oasis.opendocument.text", EXTENSION_MEDIA_TYPES[".odt"]),
+    (
+        b"mimetypeapplication/vnd.oasis.opendocument.spreadsheet",
+        EXTENSION_MEDIA_TYPES[".ods"],
+    ),
+    (
+        b"mimetypeapplication/vnd.oasis.opendocument.presentation",
+        EXTENSION_MEDIA_TYPES[".odp"],
+    ),
+)
+
+OLE2_MEDIA_TYPES = {
+    EXTENSION_MEDIA_TYPES[".doc"],
+    EXTENSION_MEDIA_TYPES[".xls"],
+    EXTENSION_MEDIA_TYPES[".ppt"],
+}
+
+# Типы, которые определяются по содержимому. Если клиент заявил такой тип,
+# а сигнатуры в файле нет, файл не принимается
+SIGNATURE_MEDIA_TYPES = {
+    *(media_type for _, media_type in FILE_SIGNATURES),
+    *(media_type for _, media_type in ZIP_CONTENT_MARKERS),
+    *OLE2_MEDIA_TYPES,
+    "image/webp",
+    "image/avif",
+    "image/svg+xml",
+    "audio/wav",
+    "audio/mp4",
+    "video/mp4",
+    "application/zip",
+}
+
+
+# Типы, которые браузер открывает как страницу сайта и может выполнить
+# скрипты из файла (SVG, HTML) или угадать такой тип по содержимому (текст).
+# Такие файлы отдаются на скачивание и в песочнице (CSP sandbox)
+ACTIVE_MEDIA_TYPES = {
+    "image/svg+xml",
+    "text/html",
+    "text/plain",
+    "text/csv",
+    "application/json",
+    "application/xml",
+}
+
+
+def get_media_type(path: Path) -> str:
+    return EXTENSION_MEDIA_TYPES.get(path.suffix.lower(), DEFAULT_MEDIA_TYPE)
+
+
+def is_active_media_type(media_type: str) -> bool:
+    return media_type.split(";")[0].strip().lower() in ACTIVE_MEDIA_TYPES
+
+
+def get_extension(media_type: str | None) -> str | None:
+    if not media_type:
+        return None
+    return MEDIA_TYPE_EXTENSIONS.get(media_type.split(";")[0].strip().lower())
+
+
+def detect_media_type(head: bytes, declared_type: str | None = None) -> str | None:
+    """
+    Определение MIME типа по первым байтам файла
+
+    Заявленный клиентом тип используется, только если формат невозможно
+    определить по содержимому (например, обычный текст). Если заявлен тип
+    с известной сигнатурой, которой нет в файле, возвращается None
+    """
+    for signature, media_type in FILE_SIGNATURES:
+        if head.startswith(signature):
+            return media_type
+
+    if head[:4] == b"RIFF":
+        if head[8:12] == b"WEBP":
+            return "image/webp"
+        if head[8:12] == b"WAVE":
+            return "audio/wav"
+
+    if head[4:8] == b"ftyp":
+        brand = head[8:12]
+        if brand in (b"avif", b"avis"):
+            return "image/avif"
+        if brand == b"M4A ":
+            return "audio/mp4"
+        return "video/mp4"
+
+    if head.startswith(ZIP_SIGNATURE):
+        for marker, media_type in ZIP_CONTENT_MARKERS:
+            if marker in head:
+                return media_type
+        return "application/zip"
+
+    if head.startswith(OLE2_SIGNATURE):
+        if declared_type in OLE2_MEDIA_TYPES:
+            return declared_type
+        return EXTENSION_MEDIA_TYPES[".doc"]
+
+    if b"<svg" in head[:4096]:
+        return "image/svg+xml"
+
+    declared_media_type = (declared_type or "").split(";")[0].strip().lower()
+    if declared_media_type in SIGNATURE_MEDIA_TYPES:
+        return None
+
+    return declared_type
@@ -0,0 +1,41 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
+from core.config import settings
+
+
+# Пул процессов для тяжелой обработки файлов (изображения, документы),
+# чтобы не блокировать event loop и не упираться в GIL
+_process_pool: ProcessPoolExecutor | None = None
+
+# Ссылки на фоновые задачи, чтобы их не собрал сборщик мусора
+_background_tasks: set[asyncio.Task] = set()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=settings.file.processing_workers,
+        )
+    return _process_pool
+
+
+async def run_in_process(func: Callable[..., Any], *args: Any) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_process_pool(), func, *args)
+
+
+def run_in_background(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+def shutdown_process_pool():
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
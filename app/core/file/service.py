@@ -1,11 +1,40 @@
 import os
 import uuid
+import asyncio
+import hashlib
 from pathlib import Path
+from contextlib import suppress
+from typing import NamedTuple
 
 import aiofiles
+import aiofiles.os
 from fastapi import HTTPException, status, UploadFile
+from sqlalchemy import select, event
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.config import settings
+from core.db_helper import db_helper
+from core.models import StoredFile
+from core.file.stat_cache import file_stat_cache
+from core.file.storage import storage
+from core.file.process_pool import run_in_background
+from core.file.mime import detect_media_type, get_extension
+from core.file.compression import (
+    is_compressible,
+    schedule_compression,
+    get_compressed_paths,
+)
+from core.file.image_variants import (
+    image_variant_service,
+    ImageMetadata,
+    IMAGE_VARIANT_CONTENT_TYPES,
+    IMAGE_METADATA_CONTENT_TYPES,
+)
+from core.file.document_preview import (
+    document_preview_service,
+    DOCUMENT_PREVIEW_CONTENT_TYPES,
+)
 
 # Папки для изображений
 IMAGES_FOLDER = "images"
@@ -32,6 +61,18 @@ ORGANIZATION_SECTION_FOLDER = "organization_section"
 APPLICATION_FORM_FOLDER = "application_form"
 
 
+# Размер блока при потоковой записи загружаемого файла (1 МБ)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+# Ключ блокировки индекса файлов в session.info
+STORED_FILE_LOCK_KEY = "stored_file_lock"
+
+
+class StreamedFile(NamedTuple):
+    hash: str
+    size: int
+    content_type: str | None
+
+
 class FileService:
     def __init__(self):
         self.uploads_dir: Path = settings.file.uploads_dir
@@ -43,8 +84,196 @@ class FileService:
         self,
         upload_file: UploadFile,
         subdirectory: str,
+        session: AsyncSession | None = None,
     ) -> str:
-        # Валидация файла в зависимости от типа
+        """
+        Сохранение загруженного файла
+
+        Если передана сессия, счетчик ссылок на файл фиксируется в ее транзакции
+        вместе с записью, которая ссылается на файл, и откатывается вместе с ней
+        """
+        # Допустимые типы файла в зависимости от папки
+        allowed_types = self._get_allowed_types(subdirectory)
+
+        # Сначала пишем файл во временный файл, попутно считая хеш содержимого
+        temp_dir = self.uploads_dir / subdirectory
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = temp_dir / f".{uuid.uuid4().hex}.part"
+        try:
+            streamed_file = await self._write_file_stream(
+                upload_file=upload_file,
+                path=temp_path,
+                allowed_types=allowed_types,
+            )
+
+            # Имя файла определяется его содержимым, одинаковые файлы хранятся один раз.
+            # Расширение берется по определенному типу, чтобы отдавать файл с верным MIME
+            file_extension = get_extension(streamed_file.content_type) or (
+                os.path.splitext(upload_file.filename)[1].lower()
+            )
+            filename = f"{streamed_file.hash}{file_extension}"
+            relative_path = str(Path(subdirectory) / filename).replace("\\", "/")
+
+            # Размеры и миниатюру изображения считаем в пуле процессов до
+            # сохранения, чтобы они сразу попали в запись сущности
+            image_metadata = None
+            if streamed_file.content_type in IMAGE_METADATA_CONTENT_TYPES:
+                image_metadata = await image_variant_service.get_metadata(temp_path)
+
+            stored_path = await self._store_file(
+                temp_path=temp_path,
+                relative_path=relative_path,
+                streamed_file=streamed_file,
+                image_metadata=image_metadata,
+                session=session,
+            )
+        finally:
+            with suppress(OSError):
+                await aiofiles.os.remove(temp_path)
+
+        # Производные копии создаются только для новых файлов в локальном хранилище
+        local_path = storage.get_local_path(stored_path)
+        if stored_path == relative_path and local_path is not None:
+            if session is None:
+                self._schedule_processing(
+                    stored_path, local_path, streamed_file.content_type
+                )
+            else:
+                # Миниатюра документа записывается в индекс файлов, поэтому
+                # обработка начинается, когда запись о файле закоммичена
+                event.listen(
+                    session.sync_session,
+                    "after_commit",
+                    lambda _: self._schedule_processing(
+                        stored_path, local_path, streamed_file.content_type
+                    ),
+                    once=True,
+                )
+
+        return stored_path
+
+    def _schedule_processing(
+        self,
+        stored_path: str,
+        local_path: Path,
+        content_type: str | None,
+    ):
+        # Для изображений в фоне создаем уменьшенные копии
+        if content_type in IMAGE_VARIANT_CONTENT_TYPES:
+            image_variant_service.schedule(local_path)
+
+        # Для PDF и DOCX в фоне извлекаем миниатюру и количество страниц
+        if content_type in DOCUMENT_PREVIEW_CONTENT_TYPES:
+            document_preview_service.schedule(stored_path, local_path, content_type)
+
+        # Для текстовых форматов (SVG и т.п.) в фоне создаем gzip и brotli копии
+        if is_compressible(local_path):
+            schedule_compression(local_path)
+
+    async def save_files(
+        self,
+        upload_files: list[UploadFile],
+        subdirectory: str,
+        session: AsyncSession | None = None,
+    ) -> list[str | HTTPException]:
+        """
+        Одновременное сохранение нескольких файлов с ограничением параллельности
+
+        Ошибка одного файла не прерывает остальные: для каждого файла
+        возвращается путь или исключение HTTPException
+        """
+        semaphore = asyncio.Semaphore(settings.file.batch_upload_concurrency)
+
+        async def save(upload_file: UploadFile) -> str:
+            async with semaphore:
+                return await self.save_file(
+                    upload_file=upload_file,
+                    subdirectory=subdirectory,
+                    session=session,
+                )
+
+        results = await asyncio.gather(
+            *(save(upload_file) for upload_file in upload_files),
+            return_exceptions=True,
+        )
+
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(
+                result, HTTPException
+            ):
+                # Непредвиденная ошибка: удаляем уже сохраненные файлы пакета.
+                # В транзакции вызывающего кода счетчики откатятся вместе с ней
+                if session is None:
+                    for saved_path in results:
+                        if isinstance(saved_path, str):
+                            await self.delete_file(saved_path)
+                raise result
+
+        return results
+
+    async def _store_file(
+        self,
+        temp_path: Path,
+        relative_path: str,
+        streamed_file: StreamedFile,
+        image_metadata: ImageMetadata | None = None,
+        session: AsyncSession | None = None,
+    ) -> str:
+        """Регистрация файла в индексе и перенос на постоянное место"""
+        if session is None:
+            async with db_helper.session_factory() as session:
+                stored_path = await self._store_file(
+                    temp_path=temp_path,
+                    relative_path=relative_path,
+                    streamed_file=streamed_file,
+                    image_metadata=image_metadata,
+                    session=session,
+                )
+                await session.commit()
+            return stored_path
+
+        # Если файл с таким хешем уже есть, увеличиваем счетчик ссылок
+        stmt = (
+            insert(StoredFile)
+            .values(
+                id=uuid.uuid4(),
+                hash=streamed_file.hash,
+                path=relative_path,
+                size=streamed_file.size,
+                content_type=streamed_file.content_type,
+                image_width=image_metadata.width if image_metadata else None,
+                image_height=image_metadata.height if image_metadata else None,
+                image_color=image_metadata.color if image_metadata else None,
+                image_placeholder=(
+                    image_metadata.placeholder if image_metadata else None
+                ),
+                ref_count=1,
+            )
+            .on_conflict_do_update(
+                index_elements=[StoredFile.hash],
+                set_={"ref_count": StoredFile.ref_count + 1},
+            )
+            .returning(StoredFile.path)
+        )
+        # Сессия не допускает параллельных запросов, а файлы пакета
+        # сохраняются одновременно, поэтому запросы к индексу идут по очереди
+        session_lock = session.info.setdefault(STORED_FILE_LOCK_KEY, asyncio.Lock())
+        async with session_lock:
+            stored_path = await session.scalar(stmt)
+
+        # Новый файл переносим до коммита, чтобы запись в индексе
+        # не ссылалась на несуществующий файл
+        if stored_path == relative_path:
+            await storage.save(
+                key=stored_path,
+                source_path=temp_path,
+                content_type=streamed_file.content_type,
+            )
+
+        return stored_path
+
+    def _get_allowed_types(self, subdirectory: str) -> set[str] | None:
+        """Допустимые MIME типы для папки (None - без проверки типа)"""
         # Проверяем, является ли папка папкой для изображений
         image_folders = [
             IMAGES_FOLDER,
@@ -55,83 +284,134 @@ class FileService:
             ORGANIZATION_SECTION_FOLDER,
             APPLICATION_FORM_FOLDER,
         ]
-        is_image_folder = any(
-            subdirectory.startswith(folder) for folder in image_folders
-        )
-
-        if is_image_folder:
-            await self._validate_image_file(upload_file)
-        elif subdirectory.startswith(DOCUMENTS_FOLDER):
-            await self._validate_document_file(upload_file)
+        if any(subdirectory.startswith(folder) for folder in image_folders):
+            return self.allowed_image_types
 
-        # Генерация уникального имени файла
-        file_extension = os.path.splitext(upload_file.filename)[1]
-        filename = f"{uuid.uuid4().hex}{file_extension}"
+        if subdirectory.startswith(DOCUMENTS_FOLDER):
+            return self.allowed_document_types
 
-        # Создание пути для сохранения файла
-        save_path = self.uploads_dir / subdirectory / filename
-        save_path.parent.mkdir(parents=True, exist_ok=True)
+        return None
 
-        # Сохранение файла
-        async with aiofiles.open(save_path, "wb") as f:
-            content = await upload_file.read()
-            await f.write(content)
-
-        # Возвращаем относительный путь к файлу
-        relative_path = str(Path(subdirectory) / filename)
-        return relative_path.replace("\\", "/")
-
-    async def _validate_image_file(
+    async def _write_file_stream(
         self,
         upload_file: UploadFile,
-    ):
-        """Валидация изображения"""
-        content = await upload_file.read()
-        if len(content) > self.max_file_size:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Файл слишком большой",
-            )
+        path: Path,
+        allowed_types: set[str] | None,
+    ) -> StreamedFile:
+        """Потоковая запись файла блоками с проверкой размера и типа"""
+        size = 0
+        file_hash = hashlib.sha256()
+        async with aiofiles.open(path, "wb") as f:
+            chunk = await upload_file.read(UPLOAD_CHUNK_SIZE)
 
-        if upload_file.content_type not in self.allowed_image_types:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Недопустимый тип файла",
+            # Тип файла определяем по первому блоку
+            content_type = detect_media_type(
+                head=chunk,
+                declared_type=upload_file.content_type,
             )
+            # Содержимое не соответствует заявленному типу (например, HTML под видом PNG)
+            if content_type is None and upload_file.content_type:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Содержимое файла не соответствует его типу",
+                )
+            if allowed_types is not None:
+                if content_type not in allowed_types:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="Недопустимый тип файла",
+                    )
 
-        await upload_file.seek(0)
+            while chunk:
+                size += len(chunk)
+                # Прерываем загрузку сразу при превышении лимита
+                if size > self.max_file_size:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="Файл слишком большой",
+                    )
 
-    async def _validate_document_file(
-        self,
-        upload_file: UploadFile,
-    ):
-        """Валидация документа"""
-        content = await upload_file.read()
-        if len(content) > self.max_file_size:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Файл слишком большой",
-            )
+                file_hash.update(chunk)
+                await f.write(chunk)
+                chunk = await upload_file.read(UPLOAD_CHUNK_SIZE)
 
-        if upload_file.content_type not in self.allowed_document_types:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Недопустимый тип файла",
-            )
-
-        await upload_file.seek(0)
+        return StreamedFile(
+            hash=file_hash.hexdigest(),
+            size=size,
+            content_type=content_type,
+        )
 
     async def delete_file(
         self,
         file_path: str,
+        session: AsyncSession | None = None,
     ):
-        """Удаление файла"""
-        absolute_path = self.uploads_dir / file_path
-        try:
-            if absolute_path.exists():
-                absolute_path.unlink()
-        except OSError:
-            pass
+        """
+        Удаление файла (уменьшение счетчика ссылок)
+
+        Если передана сессия, счетчик уменьшается в ее транзакции вместе
+        с изменением записи, которая ссылалась на файл, а сам файл удаляется
+        только после коммита этой транзакции
+        """
+        if session is None:
+            async with db_helper.session_factory() as session:
+                await self.delete_file(file_path=file_path, session=session)
+                await session.commit()
+            return
+
+        session_lock = session.info.setdefault(STORED_FILE_LOCK_KEY, asyncio.Lock())
+        async with session_lock:
+            stored_file = await session.scalar(
+                select(StoredFile).where(StoredFile.path == file_path).with_for_update()
+            )
+
+            if stored_file:
+                stored_file.ref_count -= 1
+                if stored_file.ref_count > 0:
+                    return
+
+                # Последняя ссылка - удаляем запись, файл удалится после коммита
+                await session.delete(stored_file)
+                await session.flush()
+
+        # Файлы, загруженные до появления индекса, удаляются так же после коммита.
+        # При откате транзакции файл остается на месте вместе со ссылкой на него
+        event.listen(
+            session.sync_session,
+            "after_commit",
+            lambda _: run_in_background(self._remove_unreferenced_file(file_path)),
+            once=True,
+        )
+
+    async def _remove_unreferenced_file(self, file_path: str):
+        async with db_helper.session_factory() as session:
+            # Такой же файл могли загрузить заново, пока шел коммит удаления
+            if await session.scalar(
+                select(StoredFile.id).where(StoredFile.path == file_path)
+            ):
+                return
+
+        await self._remove_file(file_path)
+
+    async def _remove_file(self, file_path: str):
+        await storage.delete(file_path)
+
+        local_path = storage.get_local_path(file_path)
+        if local_path is None:
+            return
+
+        # Вместе с оригиналом удаляем уменьшенные и сжатые копии и миниатюры
+        for path in [
+            *image_variant_service.get_variant_paths(local_path),
+            *document_preview_service.get_preview_paths(local_path),
+            *get_compressed_paths(local_path),
+        ]:
+            file_stat_cache.invalidate(path)
+            try:
+                if path.exists():
+                    path.unlink()
+            except OSError:
+                pass
 
 
 # Создаем экземпляр сервиса
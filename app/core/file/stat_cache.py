@@ -0,0 +1,67 @@
+import os
+import stat
+import time
+from pathlib import Path
+from collections import OrderedDict
+
+from core.config import settings
+
+
+class FileStatCache:
+    """
+    LRU кеш метаданных загруженных файлов (путь -> os.stat_result)
+
+    Загруженные файлы не изменяются после записи, поэтому повторные запросы
+    могут обходиться без системных вызовов. TTL ограничивает устаревание кеша
+    при удалении файла другим процессом
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items: OrderedDict[Path, tuple[float, os.stat_result]] = OrderedDict()
+
+    def get(self, path: Path) -> os.stat_result | None:
+        item = self._items.get(path)
+        if item is None:
+            return None
+
+        cached_at, stat_result = item
+        if time.monotonic() - cached_at > self.ttl:
+            del self._items[path]
+            return None
+
+        self._items.move_to_end(path)
+        return stat_result
+
+    def put(self, path: Path, stat_result: os.stat_result):
+        self._items[path] = (time.monotonic(), stat_result)
+        self._items.move_to_end(path)
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def stat(self, path: Path) -> os.stat_result | None:
+        """Метаданные обычного файла (None, если файла нет)"""
+        stat_result = self.get(path)
+        if stat_result is not None:
+            return stat_result
+
+        try:
+            stat_result = path.stat()
+        except OSError:
+            return None
+
+        if not stat.S_ISREG(stat_result.st_mode):
+            return None
+
+        self.put(path, stat_result)
+        return stat_result
+
+    def invalidate(self, path: Path):
+        self._items.pop(path, None)
+
+
+file_stat_cache = FileStatCache(
+    maxsize=settings.file.stat_cache_size,
+    ttl=settings.file.stat_cache_ttl,
+)
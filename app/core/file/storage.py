@@ -0,0 +1,239 @@
+import asyncio
+from abc import ABC, abstractmethod
+from pathlib import Path
+from contextlib import AsyncExitStack
+from typing import AsyncIterator
+
+import aiofiles
+import aiofiles.os
+from aiobotocore.session import get_session
+
+from core.config import settings, StorageConfig
+from core.file.stat_cache import file_stat_cache
+
+
+# Размер блока при чтении файла из хранилища
+READ_CHUNK_SIZE = 64 * 1024
+
+# Имена файлов в хранилище уникальны и не меняются после записи
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class StorageBackend(ABC):
+    """
+    Хранилище загруженных файлов
+
+    Ключ файла - его путь относительно папки загрузок (то же значение,
+    что хранится в колонках *_url моделей)
+    """
+
+    @abstractmethod
+    async def save(
+        self,
+        key: str,
+        source_path: Path,
+        content_type: str | None = None,
+    ):
+        """Сохранение файла из локального временного файла (источник может быть перемещен)"""
+
+    @abstractmethod
+    async def delete(self, key: str):
+        """Удаление файла (отсутствие файла не считается ошибкой)"""
+
+    @abstractmethod
+    def open(self, key: str) -> AsyncIterator[bytes]:
+        """Потоковое чтение файла блоками"""
+
+    @abstractmethod
+    async def get_url(self, key: str) -> str | None:
+        """Прямая ссылка на файл (None - файл отдается через API)"""
+
+    def get_local_path(self, key: str) -> Path | None:
+        """Путь к файлу на локальном диске, если хранилище локальное"""
+        return None
+
+    async def close(self):
+        pass
+
+
+class LocalStorageBackend(StorageBackend):
+    def __init__(self, root: Path):
+        self.root = root
+
+    async def save(
+        self,
+        key: str,
+        source_path: Path,
+        content_type: str | None = None,
+    ):
+        target_path = self.root / key
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        await aiofiles.os.replace(source_path, target_path)
+
+    async def delete(self, key: str):
+        path = self.root / key
+        file_stat_cache.invalidate(path)
+        try:
+            await aiofiles.os.remove(path)
+        except OSError:
+            pass
+
+    async def open(self, key: str) -> AsyncIterator[bytes]:
+        async with aiofiles.open(self.root / key, "rb") as f:
+            while chunk := await f.read(READ_CHUNK_SIZE):
+                yield chunk
+
+    async def get_url(self, key: str) -> str | None:
+        return None
+
+    def get_local_path(self, key: str) -> Path | None:
+        return self.root / key
+
+
+class S3StorageBackend(StorageBackend):
+    """
+    S3-совместимое хранилище (AWS S3, MinIO, Yandex Object Storage и т.п.)
+
+    Большие файлы загружаются multipart-запросами с параллельной отправкой
+    частей, клиенты получают файлы напрямую по подписанным ссылкам
+    """
+
+    def __init__(self, config: StorageConfig):
+        self.config = config
+        self._session = get_session()
+        self._exit_stack: AsyncExitStack | None = None
+        self._client = None
+        self._client_lock = asyncio.Lock()
+
+    async def _get_client(self):
+        # Клиент создается один раз и переиспользует пул соединений
+        async with self._client_lock:
+            if self._client is None:
+                self._exit_stack = AsyncExitStack()
+                self._client = await self._exit_stack.enter_async_context(
+                    self._session.create_client(
+                        "s3",
+                        endpoint_url=self.config.s3_endpoint_url,
+                        region_name=self.config.s3_region,
+                        aws_access_key_id=self.config.s3_access_key,
+                        aws_secret_access_key=self.config.s3_secret_key,
+                    )
+                )
+        return self._client
+
+    async def save(
+        self,
+        key: str,
+        source_path: Path,
+        content_type: str | None = None,
+    ):
+        client = await self._get_client()
+        extra_args = {"CacheControl": IMMUTABLE_CACHE_CONTROL}
+        if content_type:
+            extra_args["ContentType"] = content_type
+
+        size = (await aiofiles.os.stat(source_path)).st_size
+        if size <= self.config.s3_part_size:
+            async with aiofiles.open(source_path, "rb") as f:
+                body = await f.read()
+            await client.put_object(
+                Bucket=self.config.s3_bucket,
+                Key=key,
+                Body=body,
+                **extra_args,
+            )
+            return
+
+        await self._multipart_upload(client, key, source_path, size, extra_args)
+
+    async def _multipart_upload(
+        self,
+        client,
+        key: str,
+        source_path: Path,
+        size: int,
+        extra_args: dict,
+    ):
+        upload = await client.create_multipart_upload(
+            Bucket=self.config.s3_bucket,
+            Key=key,
+            **extra_args,
+        )
+        upload_id = upload["UploadId"]
+        part_size = self.config.s3_part_size
+        semaphore = asyncio.Semaphore(self.config.s3_max_concurrency)
+
+        async def upload_part(part_number: int, offset: int) -> dict:
+            async with semaphore:
+                async with aiofiles.open(source_path, "rb") as f:
+                    await f.seek(offset)
+                    body = await f.read(part_size)
+
+                response = await client.upload_part(
+                    Bucket=self.config.s3_bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=body,
+                )
+                return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+        try:
+            parts = await asyncio.gather(
+                *[
+                    upload_part(part_number, offset)
+                    for part_number, offset in enumerate(
+                        range(0, size, part_size), start=1
+                    )
+                ]
+            )
+            await client.complete_multipart_upload(
+                Bucket=self.config.s3_bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": list(parts)},
+            )
+        except BaseException:
+            # Не оставляем в бакете незавершенные загрузки
+            await client.abort_multipart_upload(
+                Bucket=self.config.s3_bucket,
+                Key=key,
+                UploadId=upload_id,
+            )
+            raise
+
+    async def delete(self, key: str):
+        client = await self._get_client()
+        await client.delete_object(Bucket=self.config.s3_bucket, Key=key)
+
+    async def open(self, key: str) -> AsyncIterator[bytes]:
+        client = await self._get_client()
+        response = await client.get_object(Bucket=self.config.s3_bucket, Key=key)
+        body = response["Body"]
+        # Контекстный менеджер тела закрывает соединение после чтения
+        async with body:
+            async for chunk in body.iter_chunks(READ_CHUNK_SIZE):
+                yield chunk
+
+    async def get_url(self, key: str) -> str | None:
+        client = await self._get_client()
+        return await client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.config.s3_bucket, "Key": key},
+            ExpiresIn=self.config.s3_presigned_url_expire_seconds,
+        )
+
+    async def close(self):
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+            self._exit_stack = None
+            self._client = None
+
+
+def create_storage_backend() -> StorageBackend:
+    if settings.storage.backend == "s3":
+        return S3StorageBackend(settings.storage)
+    return LocalStorageBackend(settings.file.uploads_dir)
+
+
+storage = create_storage_backend()
@@ -0,0 +1,87 @@
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from fastapi import HTTPException, status
+
+
+class RequestBodyTooLarge(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Request body too large",
+        )
+
+
+class BodySizeLimitMiddleware:
+    """
+    Ограничение размера тела запроса до его разбора приложением
+
+    Лимит выбирается по самому длинному совпавшему префиксу пути. Заголовок
+    Content-Length проверяется сразу, а для chunked запросов считаются
+    полученные байты, и запрос прерывается при превышении лимита
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        default_limit: int,
+        route_limits: dict[str, int] | None = None,
+    ):
+        self.app = app
+        self.default_limit = default_limit
+        # Более длинные (более точные) префиксы проверяем первыми
+        self.route_limits = sorted(
+            (route_limits or {}).items(),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+
+    def get_limit(self, path: str) -> int:
+        for prefix, limit in self.route_limits:
+            if path.startswith(prefix):
+                return limit
+        return self.default_limit
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        limit = self.get_limit(scope["path"])
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > limit:
+            await self._reject(scope, receive, send)
+            return
+
+        received_size = 0
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received_size
+            message = await receive()
+            if message["type"] == "http.request":
+                received_size += len(message.get("body", b""))
+                if received_size > limit:
+                    raise RequestBodyTooLarge()
+            return message
+
+        async def tracked_send(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracked_send)
+        except RequestBodyTooLarge:
+            if response_started:
+                raise
+            await self._reject(scope, receive, send)
+
+    async def _reject(self, scope: Scope, receive: Receive, send: Send):
+        response = JSONResponse(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            content={"detail": "Request body too large"},
+        )
+        await response(scope, receive, send)
@@ -84,6 +84,11 @@ from core.models.organization_section import (
     OrganizationProfessionalLearningTrajectoryContact,
 )
 from core.models.application_form import ApplicationForm
+from core.models.stored_file import StoredFile
+from core.models.search_keyword import SearchKeyword
+from core.models.keyword_facet import KeywordFacet
+from core.models.email_outbox import EmailOutbox
+from core.models.newsletter import NewsletterMailing, NewsletterDelivery
 
 
 all = (
@@ -167,4 +172,10 @@ all = (
     "OrganizationProfessionalLearningTrajectoryEvent",
     "OrganizationProfessionalLearningTrajectoryContact",
     "ApplicationForm",
+    "StoredFile",
+    "SearchKeyword",
+    "KeywordFacet",
+    "EmailOutbox",
+    "NewsletterMailing",
+    "NewsletterDelivery",
 )
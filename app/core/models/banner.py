@@ -3,9 +3,10 @@ from sqlalchemy.orm import Mapped, mapped_column
 
 from core.models.base import Base
 from core.models.mixins.id import IdMixin
+from core.models.mixins.image_metadata import ImageMetadataMixin
 
 
-class Banner(Base, IdMixin):
+class Banner(Base, IdMixin, ImageMetadataMixin):
     __tablename__ = "banners"
 
     # Заголовок
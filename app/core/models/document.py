@@ -3,9 +3,13 @@ from sqlalchemy.orm import Mapped, mapped_column
 
 from core.models.base import Base
 from core.models.mixins.id import IdMixin
+from core.models.mixins.document_preview import DocumentPreviewMixin
+from core.models.mixins.search import SearchVectorMixin
 
 
-class Document(Base, IdMixin):
+class Document(Base, IdMixin, DocumentPreviewMixin, SearchVectorMixin):
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "content_text": "D"}
 
     # Название/заголовок документа
     title: Mapped[str] = mapped_column(Text())
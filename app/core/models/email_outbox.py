@@ -0,0 +1,51 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import String, Text, DateTime, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.models.base import Base
+from core.models.mixins.id import IdMixin
+
+
+# Статусы писем в очереди
+EMAIL_PENDING = "pending"
+EMAIL_SENT = "sent"
+# Письмо не удалось отправить за все попытки, оставляем его для разбора
+EMAIL_DEAD = "dead"
+
+
+class EmailOutbox(Base, IdMixin):
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # Воркер выбирает готовые к отправке письма по статусу и времени попытки
+        Index(
+            "ix_email_outbox_pending",
+            "next_attempt_at",
+            postgresql_where=text(f"status = '{EMAIL_PENDING}'"),
+        ),
+    )
+
+    recipient: Mapped[str] = mapped_column(String(320))
+    subject: Mapped[str] = mapped_column(Text())
+    # Имя шаблона и переменные, с которыми он рендерится при отправке
+    template_name: Mapped[str] = mapped_column(String(255))
+    context: Mapped[dict] = mapped_column(JSONB(), default=dict)
+
+    status: Mapped[str] = mapped_column(
+        String(16),
+        default=EMAIL_PENDING,
+        server_default=EMAIL_PENDING,
+    )
+    # Количество начатых попыток отправки
+    attempts: Mapped[int] = mapped_column(default=0, server_default="0")
+    # Не раньше этого времени письмо снова будет взято воркером
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+    )
+    last_error: Mapped[str | None] = mapped_column(Text(), nullable=True)
+    sent_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
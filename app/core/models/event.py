@@ -5,9 +5,14 @@ from sqlalchemy.orm import Mapped, mapped_column
 
 from core.models.base import Base
 from core.models.mixins.id import IdMixin
+from core.models.mixins.image_metadata import ImageMetadataMixin
+from core.models.mixins.search import SearchVectorMixin
 
 
-class Event(Base, IdMixin):
+class Event(Base, IdMixin, ImageMetadataMixin, SearchVectorMixin):
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "description": "C", "location": "D"}
+
     # Заголовок/название мероприятия
     title: Mapped[str] = mapped_column(Text())
     # Описание мероприятия
@@ -0,0 +1,137 @@
+from collections import Counter
+
+from sqlalchemy import Text, String, UniqueConstraint, delete, event, inspect
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.models.base import Base
+from core.models.mixins.id import IdMixin
+from core.models.news import News
+from core.models.project import Project
+
+
+class KeywordFacet(Base, IdMixin):
+    """
+    Количество материалов с каждым ключевым словом (для облака тегов и фильтров)
+
+    Счетчики ведутся в целом по типу материала (scope = "") и отдельно
+    в пределах типа новости, темы или категории проекта
+    """
+
+    __table_args__ = (
+        UniqueConstraint(
+            "entity_type",
+            "scope",
+            "scope_value",
+            "keyword",
+            name="uq_keywordfacets_entity_type_scope_keyword",
+        ),
+    )
+
+    # Тип материала: news или project
+    entity_type: Mapped[str] = mapped_column(String(50))
+    # Поле, в пределах которого считаются материалы (type_id, theme, category)
+    scope: Mapped[str] = mapped_column(String(50), default="", server_default="")
+    # Значение этого поля
+    scope_value: Mapped[str] = mapped_column(Text(), default="", server_default="")
+    # Ключевое слово
+    keyword: Mapped[str] = mapped_column(Text())
+    # Количество материалов с этим ключевым словом
+    count: Mapped[int] = mapped_column(default=0, server_default="0")
+
+
+# Поля, в пределах которых ведутся счетчики для каждого типа материала
+FACET_SCOPES = {
+    News: ("news", ("type_id",)),
+    Project: ("project", ("theme", "category")),
+}
+
+
+def get_facet_keys(model: type, values: dict) -> Counter:
+    """Ключи счетчиков, в которые материал с такими значениями полей дает +1"""
+    entity_type, scopes = FACET_SCOPES[model]
+    keys = Counter()
+    for keyword in set(values["keywords"] or []):
+        keys[(entity_type, "", "", keyword)] += 1
+        for scope in scopes:
+            if values[scope] is not None:
+                keys[(entity_type, scope, str(values[scope]), keyword)] += 1
+    return keys
+
+
+def _get_values(model: type, target, old: bool) -> dict:
+    """
+    Текущие или прежние (до изменения) значения полей материала
+
+    Прежние значения берутся из истории атрибутов, поэтому эти поля в моделях
+    объявлены с active_history=True
+    """
+    _, scopes = FACET_SCOPES[model]
+    state = inspect(target)
+    values = {}
+    for field in ("keywords", *scopes):
+        history = state.attrs[field].history
+        if old and history.deleted:
+            values[field] = history.deleted[0]
+        else:
+            values[field] = getattr(target, field)
+    return values
+
+
+def apply_facet_deltas(connection, deltas: Counter):
+    """Изменение счетчиков одним запросом и удаление обнулившихся"""
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    stmt = insert(KeywordFacet).values(
+        [
+            dict(
+                entity_type=entity_type,
+                scope=scope,
+                scope_value=scope_value,
+                keyword=keyword,
+                count=delta,
+            )
+            for (entity_type, scope, scope_value, keyword), delta in deltas.items()
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_keywordfacets_entity_type_scope_keyword",
+        set_={"count": KeywordFacet.count + stmt.excluded.count},
+    )
+    connection.execute(stmt)
+
+    keywords = {keyword for *_, keyword in deltas}
+    connection.execute(
+        delete(KeywordFacet).where(
+            KeywordFacet.keyword.in_(keywords),
+            KeywordFacet.count <= 0,
+        )
+    )
+
+
+def _after_insert(mapper, connection, target):
+    model = mapper.class_
+    deltas = get_facet_keys(model, _get_values(model, target, old=False))
+    apply_facet_deltas(connection, deltas)
+
+
+def _after_update(mapper, connection, target):
+    model = mapper.class_
+    deltas = get_facet_keys(model, _get_values(model, target, old=False))
+    deltas.subtract(get_facet_keys(model, _get_values(model, target, old=True)))
+    apply_facet_deltas(connection, deltas)
+
+
+def _after_delete(mapper, connection, target):
+    model = mapper.class_
+    deltas = Counter()
+    deltas.subtract(get_facet_keys(model, _get_values(model, target, old=True)))
+    apply_facet_deltas(connection, deltas)
+
+
+for facet_model in FACET_SCOPES:
+    event.listen(facet_model, "after_insert", _after_insert)
+    event.listen(facet_model, "after_update", _after_update)
+    event.listen(facet_model, "after_delete", _after_delete)
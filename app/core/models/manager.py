@@ -3,10 +3,13 @@ from sqlalchemy.orm import Mapped, mapped_column
 
 from core.models.base import Base
 from core.models.mixins.id import IdMixin
+from core.models.mixins.search import SearchVectorMixin
 
 
-class Manager(Base, IdMixin):
+class Manager(Base, IdMixin, SearchVectorMixin):
     __tablename__ = "managers"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"full_name": "A", "position": "B"}
 
     # Фотография члена руководства
     image_url: Mapped[str | None] = mapped_column(Text(), nullable=True)
@@ -0,0 +1,50 @@
+from sqlalchemy import Text, BigInteger, select, event, inspect
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.models.stored_file import StoredFile
+
+
+class DocumentPreviewMixin:
+    # Миниатюра первой страницы документа
+    thumbnail_url: Mapped[str | None] = mapped_column(Text(), nullable=True)
+    # Количество страниц
+    page_count: Mapped[int | None] = mapped_column(nullable=True)
+    # Размер файла в байтах
+    file_size: Mapped[int | None] = mapped_column(BigInteger(), nullable=True)
+    # Извлеченный текст документа, входит в поисковый индекс с наименьшим весом
+    content_text: Mapped[str | None] = mapped_column(
+        Text(), nullable=True, deferred=True
+    )
+
+
+def _fill_document_preview(connection, target: DocumentPreviewMixin):
+    # Превью могло быть создано раньше, чем появилась запись о документе
+    if not target.file_url:
+        return
+
+    preview = connection.execute(
+        select(
+            StoredFile.thumbnail_path,
+            StoredFile.page_count,
+            StoredFile.size,
+            StoredFile.content_text,
+        ).where(StoredFile.path == target.file_url)
+    ).first()
+
+    (
+        target.thumbnail_url,
+        target.page_count,
+        target.file_size,
+        target.content_text,
+    ) = preview or (None, None, None, None)
+
+
+@event.listens_for(DocumentPreviewMixin, "before_insert", propagate=True)
+def _before_document_insert(mapper, connection, target):
+    _fill_document_preview(connection, target)
+
+
+@event.listens_for(DocumentPreviewMixin, "before_update", propagate=True)
+def _before_document_update(mapper, connection, target):
+    if inspect(target).attrs.file_url.history.has_changes():
+        _fill_document_preview(connection, target)
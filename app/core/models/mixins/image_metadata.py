@@ -0,0 +1,50 @@
+from sqlalchemy import String, Text, select, event, inspect
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.models.stored_file import StoredFile
+
+
+class ImageMetadataMixin:
+    # Поле модели, в котором хранится путь к изображению
+    __image_url_attribute__ = "image_url"
+
+    # Размеры изображения в пикселях
+    image_width: Mapped[int | None] = mapped_column(nullable=True)
+    image_height: Mapped[int | None] = mapped_column(nullable=True)
+    # Основной цвет изображения (#rrggbb)
+    image_color: Mapped[str | None] = mapped_column(String(7), nullable=True)
+    # Размытая миниатюра (data URI) для показа до загрузки изображения
+    image_placeholder: Mapped[str | None] = mapped_column(Text(), nullable=True)
+
+
+def _fill_image_metadata(connection, target: ImageMetadataMixin):
+    image_url = getattr(target, target.__image_url_attribute__)
+    metadata = None
+    if image_url:
+        metadata = connection.execute(
+            select(
+                StoredFile.image_width,
+                StoredFile.image_height,
+                StoredFile.image_color,
+                StoredFile.image_placeholder,
+            ).where(StoredFile.path == image_url)
+        ).first()
+
+    (
+        target.image_width,
+        target.image_height,
+        target.image_color,
+        target.image_placeholder,
+    ) = metadata or (None, None, None, None)
+
+
+@event.listens_for(ImageMetadataMixin, "before_insert", propagate=True)
+def _before_image_insert(mapper, connection, target):
+    _fill_image_metadata(connection, target)
+
+
+@event.listens_for(ImageMetadataMixin, "before_update", propagate=True)
+def _before_image_update(mapper, connection, target):
+    attribute = getattr(inspect(target).attrs, target.__image_url_attribute__)
+    if attribute.history.has_changes():
+        _fill_image_metadata(connection, target)
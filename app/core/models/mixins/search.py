@@ -0,0 +1,99 @@
+import hashlib
+
+from sqlalchemy import Computed, DDL, Index, event
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column, declared_attr
+
+from core.models.base import Base
+
+
+# Конфигурация полнотекстового поиска (стемминг русского языка)
+SEARCH_CONFIG = "russian"
+
+# Выражение сгенерированной колонки должно быть IMMUTABLE, а array_to_string
+# и coalesce для массивов таковыми не считаются, поэтому оборачиваем их в функции.
+# Перегрузка позволяет одинаково передавать в выражение и строки, и массивы строк.
+# "ё" заменяется на "е", как и в нормализованных поисковых запросах
+SEARCH_TEXT_FUNCTIONS = (
+    # Триграммы для нечеткого поиска подсказок
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    """
+    CREATE OR REPLACE FUNCTION search_text(value text) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE
+    AS $$ SELECT translate(coalesce(value, ''), 'ёЁ', 'еЕ') $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION search_text(value text[]) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE
+    AS $$ SELECT translate(coalesce(array_to_string(value, ' '), ''), 'ёЁ', 'еЕ') $$
+    """,
+)
+
+for statement in SEARCH_TEXT_FUNCTIONS:
+    event.listen(Base.metadata, "before_create", DDL(statement))
+
+
+def build_search_vector_expression(search_fields: dict[str, str]) -> str:
+    """
+    SQL выражение tsvector из полей модели с весами
+
+    :param search_fields: Поля модели и их веса (A - самый важный, D - наименее)
+    """
+    return " || ".join(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', search_text({field})), '{weight}')"
+        for field, weight in search_fields.items()
+    )
+
+
+# Максимальная длина имени объекта в PostgreSQL
+MAX_IDENTIFIER_LENGTH = 63
+
+
+def get_search_index_name(table_name: str, suffix: str) -> str:
+    """Имя индекса, укороченное с хешем таблицы для длинных названий таблиц"""
+    name = f"ix_{table_name}_{suffix}"
+    if len(name) <= MAX_IDENTIFIER_LENGTH:
+        return name
+
+    table_hash = hashlib.md5(table_name.encode()).hexdigest()[:8]
+    prefix_length = MAX_IDENTIFIER_LENGTH - len(suffix) - len(table_hash) - 5
+    return f"ix_{table_name[:prefix_length]}_{table_hash}_{suffix}"
+
+
+class SearchVectorMixin:
+    # Поля для полнотекстового поиска и их веса
+    __search_fields__: dict[str, str] = {}
+
+    @declared_attr
+    def search_vector(cls) -> Mapped[str]:
+        # Колонка вычисляется самой базой при вставке и обновлении строки
+        return mapped_column(
+            TSVECTOR(),
+            Computed(
+                build_search_vector_expression(cls.__search_fields__),
+                persisted=True,
+            ),
+            deferred=True,
+        )
+
+    @declared_attr.directive
+    def __table_args__(cls) -> tuple:
+        # Для самых важных полей (заголовков) строим триграммный индекс для подсказок
+        trigram_indexes = tuple(
+            Index(
+                get_search_index_name(cls.__tablename__, f"{field}_trgm"),
+                field,
+                postgresql_using="gin",
+                postgresql_ops={field: "gin_trgm_ops"},
+            )
+            for field, weight in cls.__search_fields__.items()
+            if weight == "A"
+        )
+        return (
+            Index(
+                get_search_index_name(cls.__tablename__, "search_vector"),
+                "search_vector",
+                postgresql_using="gin",
+            ),
+            *trigram_indexes,
+        )
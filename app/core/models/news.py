@@ -2,25 +2,29 @@ import uuid
 from typing import TYPE_CHECKING
 from datetime import date
 
-from sqlalchemy import Text, ARRAY, ForeignKey
+from sqlalchemy import Text, ARRAY, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.models.base import Base
 from core.models.mixins.id import IdMixin
+from core.models.mixins.image_metadata import ImageMetadataMixin
+from core.models.mixins.search import SearchVectorMixin
 
 if TYPE_CHECKING:
     from core.models.news_type import NewsType
 
 
-class News(Base, IdMixin):
+class News(Base, IdMixin, ImageMetadataMixin, SearchVectorMixin):
     __tablename__ = "news"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "keywords": "B", "min_text": "C"}
 
     # Заголовок новости
     title: Mapped[str] = mapped_column(Text())
     # Ссылка на новость
     news_url: Mapped[str] = mapped_column(Text())
     # Ключевые слова
-    keywords: Mapped[list[str]] = mapped_column(ARRAY(Text()))
+    keywords: Mapped[list[str]] = mapped_column(ARRAY(Text()), active_history=True)
     # Изображение новости
     image_url: Mapped[str] = mapped_column(Text())
     # Минимальный текст/описание новости
@@ -28,8 +32,15 @@ class News(Base, IdMixin):
     # Дата новости (формата dd.mm.YYYY)
     news_date: Mapped[date]
     # Тип новости
-    type_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("news_types.id"))
+    type_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("news_types.id"),
+        active_history=True,
+    )
 
     type: Mapped["NewsType"] = relationship(
         back_populates="news",
     )  # Тип новости
+
+
+# GIN индекс для фильтрации по ключевым словам (оператор @>)
+Index("ix_news_keywords", News.keywords, postgresql_using="gin")
@@ -0,0 +1,116 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import String, Text, DateTime, ForeignKey, event, insert, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.config import settings
+from core.models.base import Base
+from core.models.mixins.id import IdMixin
+from core.models.news import News
+
+
+# Статусы рассылки
+MAILING_PENDING = "pending"
+MAILING_RUNNING = "running"
+MAILING_DONE = "done"
+
+# Статусы отправки письма одному подписчику
+DELIVERY_CLAIMED = "claimed"
+DELIVERY_SENT = "sent"
+DELIVERY_FAILED = "failed"
+# Процесс прервался после отметки, и неизвестно, было ли письмо отправлено
+DELIVERY_UNKNOWN = "unknown"
+
+
+class NewsletterMailing(Base, IdMixin):
+    # Рассылка идет подтвержденным подписчикам этого типа новостей
+    type_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("news_types.id", ondelete="CASCADE")
+    )
+    subject: Mapped[str] = mapped_column(Text())
+    # Имя шаблона и переменные, с которыми он рендерится один раз на всю рассылку
+    template_name: Mapped[str] = mapped_column(String(255))
+    context: Mapped[dict] = mapped_column(JSONB(), default=dict)
+
+    status: Mapped[str] = mapped_column(
+        String(16),
+        default=MAILING_PENDING,
+        server_default=MAILING_PENDING,
+    )
+    # Рассылка закреплена за процессом до этого времени (продлевается по ходу отправки)
+    lease_until: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    # Последний обработанный подписчик, с него рассылка продолжится после сбоя
+    checkpoint_subscriber_id: Mapped[uuid.UUID | None] = mapped_column(nullable=True)
+
+    sent_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    failed_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    # Конец периода, за который собран дайджест (для рассылок одной новости пусто)
+    period_end: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+
+class NewsletterDelivery(Base):
+    """
+    Отметка об отправке письма подписчику в рамках рассылки
+
+    Запись создается до отправки, поэтому после сбоя письмо не уйдет повторно.
+    Отметки, оставшиеся в статусе claimed после сбоя процесса (claimed_at
+    раньше возобновления рассылки), получают статус unknown и повторно
+    не отправляются. Записи удаляются после завершения рассылки
+    """
+
+    __tablename__ = "newsletter_deliveries"
+
+    mailing_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("newslettermailings.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    subscriber_id: Mapped[uuid.UUID] = mapped_column(primary_key=True)
+    status: Mapped[str] = mapped_column(
+        String(16),
+        default=DELIVERY_CLAIMED,
+        server_default=DELIVERY_CLAIMED,
+    )
+    # Когда процесс отметил подписчика перед отправкой
+    claimed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
+
+
+def get_news_mailing_values(news: News) -> dict:
+    return dict(
+        type_id=news.type_id,
+        subject="Новая новость",
+        template_name="mailing.html",
+        context=dict(
+            title=news.title,
+            text=news.min_text,
+            redirect_url=news.news_url,
+        ),
+    )
+
+
+@event.listens_for(News, "after_insert")
+def _create_news_mailing(mapper, connection, target: News):
+    # Рассылка создается в той же транзакции, что и новость.
+    # В режиме дайджеста новости рассылаются раз в период одним письмом
+    if settings.newsletter.enabled and settings.newsletter.mode == "instant":
+        connection.execute(
+            insert(NewsletterMailing).values(**get_news_mailing_values(target))
+        )
@@ -6,17 +6,24 @@ from sqlalchemy.orm import Mapped, mapped_column
 
 from core.models.base import Base
 from core.models.mixins.id import IdMixin
+from core.models.mixins.document_preview import DocumentPreviewMixin
+from core.models.mixins.image_metadata import ImageMetadataMixin
+from core.models.mixins.search import SearchVectorMixin
 
 if TYPE_CHECKING:
     from core.models.news_type import NewsType
 
 
-class OrganizationSupportDocument(Base, IdMixin):
+class OrganizationSupportDocument(
+    Base, IdMixin, DocumentPreviewMixin, SearchVectorMixin
+):
     """
     Модель для хранения документов сопровождения управляющих советов в разделе "Образовательным организациям"
     """
 
     __tablename__ = "organization_support_documents"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "content_text": "D"}
 
     # Заголовок/название документа
     title: Mapped[str] = mapped_column(Text())
@@ -25,12 +32,14 @@ class OrganizationSupportDocument(Base, IdMixin):
     file_url: Mapped[str] = mapped_column(Text())
 
 
-class OrganizationSupportEvent(Base, IdMixin):
+class OrganizationSupportEvent(Base, IdMixin, ImageMetadataMixin, SearchVectorMixin):
     """
     Модель для хранения мероприятий сопровождения управляющих советов в разделе "Образовательным организациям"
     """
 
     __tablename__ = "organization_support_events"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "description": "C", "location": "D"}
 
     # Заголовок/название мероприятия
     title: Mapped[str] = mapped_column(Text())
@@ -74,7 +83,7 @@ class OrganizationSupportApplication(Base, IdMixin):
     text: Mapped[str] = mapped_column(Text())
 
 
-class OrganizationLeader(Base, IdMixin):
+class OrganizationLeader(Base, IdMixin, ImageMetadataMixin):
     """
     Модель для хранения лидеров управляющих советов в разделе "Образовательным организациям"
     """
@@ -91,12 +100,14 @@ class OrganizationLeader(Base, IdMixin):
     image_url: Mapped[str | None] = mapped_column(Text(), nullable=True)
 
 
-class OrganizationNews(Base, IdMixin):
+class OrganizationNews(Base, IdMixin, ImageMetadataMixin, SearchVectorMixin):
     """
     Модель для хранения новостей управляющих советов в разделе "Образовательным организациям"
     """
 
     __tablename__ = "organization_news"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "subtitle": "B", "description": "C"}
 
     # Заголовок
     title: Mapped[str] = mapped_column(Text())
@@ -157,12 +168,16 @@ class OrganizationContact(Base, IdMixin):
     vk_group: Mapped[str | None] = mapped_column(Text(), nullable=True)
 
 
-class OrganizationEducationalProgramDocument(Base, IdMixin):
+class OrganizationEducationalProgramDocument(
+    Base, IdMixin, DocumentPreviewMixin, SearchVectorMixin
+):
     """
     Модель для хранения документов образовательных программ в разделе "Образовательным организациям"
     """
 
     __tablename__ = "organization_educational_program_documents"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "content_text": "D"}
 
     # Название/заголовок документа
     title: Mapped[str] = mapped_column(Text())
@@ -191,7 +206,7 @@ class OrganizationEducationalProgramContact(Base, IdMixin):
     phone: Mapped[str] = mapped_column(String(40))
 
 
-class OrganizationThematicMeetingParticipant(Base, IdMixin):
+class OrganizationThematicMeetingParticipant(Base, IdMixin, ImageMetadataMixin):
     """
     Модель для хранения участников тематических встреч в разделе "Образовательным организациям"
     """
@@ -208,12 +223,16 @@ class OrganizationThematicMeetingParticipant(Base, IdMixin):
     image_url: Mapped[str | None] = mapped_column(Text(), nullable=True)
 
 
-class OrganizationThematicMeetingEvent(Base, IdMixin):
+class OrganizationThematicMeetingEvent(
+    Base, IdMixin, ImageMetadataMixin, SearchVectorMixin
+):
     """
     Модель для хранения мероприятий тематических встреч в разделе "Образовательным организациям"
     """
 
     __tablename__ = "organization_thematic_meeting_events"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "description": "C", "location": "D"}
 
     # Заголовок/название мероприятия
     title: Mapped[str] = mapped_column(Text())
@@ -234,7 +253,7 @@ class OrganizationThematicMeetingEvent(Base, IdMixin):
     location: Mapped[str | None] = mapped_column(Text(), nullable=True)
 
 
-class OrganizationThematicMeetingContact(Base, IdMixin):
+class OrganizationThematicMeetingContact(Base, IdMixin, ImageMetadataMixin):
     """
     Модель для хранения контактов тематических встреч в разделе "Образовательным организациям"
     """
@@ -257,12 +276,16 @@ class OrganizationThematicMeetingContact(Base, IdMixin):
     image_url: Mapped[str | None] = mapped_column(Text(), nullable=True)
 
 
-class OrganizationEtiquetteInEducationDocument(Base, IdMixin):
+class OrganizationEtiquetteInEducationDocument(
+    Base, IdMixin, DocumentPreviewMixin, SearchVectorMixin
+):
     """
     Модель для хранения документов проекта "Этикет в образовании" в разделе "Образовательным организациям"
     """
 
     __tablename__ = "organization_etiquette_in_education_documents"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "content_text": "D"}
 
     # Название/заголовок документа
     title: Mapped[str] = mapped_column(Text())
@@ -271,12 +294,16 @@ class OrganizationEtiquetteInEducationDocument(Base, IdMixin):
     file_url: Mapped[str] = mapped_column(Text())
 
 
-class OrganizationEtiquetteInEducationEvent(Base, IdMixin):
+class OrganizationEtiquetteInEducationEvent(
+    Base, IdMixin, ImageMetadataMixin, SearchVectorMixin
+):
     """
     Модель для хранения мероприятий проекта "Этикет в образовании" в разделе "Образовательным организациям"
     """
 
     __tablename__ = "organization_etiquette_in_education_events"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "description": "C", "location": "D"}
 
     # Заголовок/название мероприятия
     title: Mapped[str] = mapped_column(Text())
@@ -297,7 +324,7 @@ class OrganizationEtiquetteInEducationEvent(Base, IdMixin):
     location: Mapped[str | None] = mapped_column(Text(), nullable=True)
 
 
-class OrganizationEtiquetteInEducationContact(Base, IdMixin):
+class OrganizationEtiquetteInEducationContact(Base, IdMixin, ImageMetadataMixin):
     """
     Модель для хранения контактов проекта "Этикет в образовании" в разделе "Образовательным организациям"
     """
@@ -320,12 +347,16 @@ class OrganizationEtiquetteInEducationContact(Base, IdMixin):
     image_url: Mapped[str | None] = mapped_column(Text(), nullable=True)
 
 
-class OrganizationProfessionalLearningTrajectoryDocument(Base, IdMixin):
+class OrganizationProfessionalLearningTrajectoryDocument(
+    Base, IdMixin, DocumentPreviewMixin, SearchVectorMixin
+):
     """
     Модель для хранения документов проекта "Профессиональная траектория обучения ребенка" в разделе "Образовательным организациям"
     """
 
     __tablename__ = "organization_professional_learning_trajectory_documents"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "content_text": "D"}
 
     # Название/заголовок документа
     title: Mapped[str] = mapped_column(Text())
@@ -334,7 +365,9 @@ class OrganizationProfessionalLearningTrajectoryDocument(Base, IdMixin):
     file_url: Mapped[str] = mapped_column(Text())
 
 
-class OrganizationProfessionalLearningTrajectoryParticipant(Base, IdMixin):
+class OrganizationProfessionalLearningTrajectoryParticipant(
+    Base, IdMixin, ImageMetadataMixin
+):
     """
     Модель для хранения участников проекта "Профессиональная траектория обучения ребенка" в разделе "Образовательным организациям"
     """
@@ -351,12 +384,16 @@ class OrganizationProfessionalLearningTrajectoryParticipant(Base, IdMixin):
     image_url: Mapped[str | None] = mapped_column(Text(), nullable=True)
 
 
-class OrganizationProfessionalLearningTrajectoryEvent(Base, IdMixin):
+class OrganizationProfessionalLearningTrajectoryEvent(
+    Base, IdMixin, ImageMetadataMixin, SearchVectorMixin
+):
     """
     Модель для хранения мероприятий проекта "Профессиональная траектория обучения ребенка" в разделе "Образовательным организациям"
     """
 
     __tablename__ = "organization_professional_learning_trajectory_events"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "description": "C", "location": "D"}
 
     # Заголовок/название мероприятия
     title: Mapped[str] = mapped_column(Text())
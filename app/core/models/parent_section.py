@@ -5,14 +5,19 @@ from sqlalchemy.orm import Mapped, mapped_column
 
 from core.models.base import Base
 from core.models.mixins.id import IdMixin
+from core.models.mixins.document_preview import DocumentPreviewMixin
+from core.models.mixins.image_metadata import ImageMetadataMixin
+from core.models.mixins.search import SearchVectorMixin
 
 
-class ParentDocument(Base, IdMixin):
+class ParentDocument(Base, IdMixin, DocumentPreviewMixin, SearchVectorMixin):
     """
     Модель для хранения документов в разделе "Родителям"
     """
 
     __tablename__ = "parent_documents"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "content_text": "D"}
 
     # Название/заголовок документа
     title: Mapped[str] = mapped_column(Text())
@@ -41,7 +46,7 @@ class ParentContact(Base, IdMixin):
     phone: Mapped[str] = mapped_column(String(40))
 
 
-class ThematicMeetingParticipant(Base, IdMixin):
+class ThematicMeetingParticipant(Base, IdMixin, ImageMetadataMixin):
     """
     Модель для хранения участников тематических встреч в разделе "Родителям"
     """
@@ -58,12 +63,14 @@ class ThematicMeetingParticipant(Base, IdMixin):
     image_url: Mapped[str | None] = mapped_column(Text(), nullable=True)
 
 
-class ThematicMeetingEvent(Base, IdMixin):
+class ThematicMeetingEvent(Base, IdMixin, ImageMetadataMixin, SearchVectorMixin):
     """
     Модель для хранения мероприятий тематических встреч в разделе "Родителям"
     """
 
     __tablename__ = "thematic_meeting_events"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "description": "C", "location": "D"}
 
     # Заголовок/название мероприятия
     title: Mapped[str] = mapped_column(Text())
@@ -84,7 +91,7 @@ class ThematicMeetingEvent(Base, IdMixin):
     location: Mapped[str | None] = mapped_column(Text(), nullable=True)
 
 
-class ThematicMeetingContact(Base, IdMixin):
+class ThematicMeetingContact(Base, IdMixin, ImageMetadataMixin):
     """
     Модель для хранения контактов тематических встреч в разделе "Родителям"
     """
@@ -107,12 +114,16 @@ class ThematicMeetingContact(Base, IdMixin):
     image_url: Mapped[str | None] = mapped_column(Text(), nullable=True)
 
 
-class EtiquetteInEducationDocument(Base, IdMixin):
+class EtiquetteInEducationDocument(
+    Base, IdMixin, DocumentPreviewMixin, SearchVectorMixin
+):
     """
     Модель для хранения документов проекта "Этикет в образовании" в разделе "Родителям"
     """
 
     __tablename__ = "etiquette_in_education_documents"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "content_text": "D"}
 
     # Название/заголовок документа
     title: Mapped[str] = mapped_column(Text())
@@ -121,12 +132,14 @@ class EtiquetteInEducationDocument(Base, IdMixin):
     file_url: Mapped[str] = mapped_column(Text())
 
 
-class EtiquetteInEducationEvent(Base, IdMixin):
+class EtiquetteInEducationEvent(Base, IdMixin, ImageMetadataMixin, SearchVectorMixin):
     """
     Модель для хранения мероприятий проекта "Этикет в образовании" в разделе "Родителям"
     """
 
     __tablename__ = "etiquette_in_education_events"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "description": "C", "location": "D"}
 
     # Заголовок/название мероприятия
     title: Mapped[str] = mapped_column(Text())
@@ -147,7 +160,7 @@ class EtiquetteInEducationEvent(Base, IdMixin):
     location: Mapped[str | None] = mapped_column(Text(), nullable=True)
 
 
-class EtiquetteInEducationContact(Base, IdMixin):
+class EtiquetteInEducationContact(Base, IdMixin, ImageMetadataMixin):
     """
     Модель для хранения контактов проекта "Этикет в образовании" в разделе "Родителям"
     """
@@ -170,12 +183,16 @@ class EtiquetteInEducationContact(Base, IdMixin):
     image_url: Mapped[str | None] = mapped_column(Text(), nullable=True)
 
 
-class ProfessionalLearningTrajectoryDocument(Base, IdMixin):
+class ProfessionalLearningTrajectoryDocument(
+    Base, IdMixin, DocumentPreviewMixin, SearchVectorMixin
+):
     """
     Модель для хранения документов проекта "Профессиональная траектория обучения ребенка" в разделе "Родителям"
     """
 
     __tablename__ = "professional_learning_trajectory_documents"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "content_text": "D"}
 
     # Название/заголовок документа
     title: Mapped[str] = mapped_column(Text())
@@ -184,7 +201,7 @@ class ProfessionalLearningTrajectoryDocument(Base, IdMixin):
     file_url: Mapped[str] = mapped_column(Text())
 
 
-class ProfessionalLearningTrajectoryParticipant(Base, IdMixin):
+class ProfessionalLearningTrajectoryParticipant(Base, IdMixin, ImageMetadataMixin):
     """
     Модель для хранения участников проекта "Профессиональная траектория обучения ребенка" в разделе "Родителям"
     """
@@ -201,12 +218,16 @@ class ProfessionalLearningTrajectoryParticipant(Base, IdMixin):
     image_url: Mapped[str | None] = mapped_column(Text(), nullable=True)
 
 
-class ProfessionalLearningTrajectoryEvent(Base, IdMixin):
+class ProfessionalLearningTrajectoryEvent(
+    Base, IdMixin, ImageMetadataMixin, SearchVectorMixin
+):
     """
     Модель для хранения мероприятий проекта "Профессиональная траектория обучения ребенка" в разделе "Родителям"
     """
 
     __tablename__ = "professional_learning_trajectory_events"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "description": "C", "location": "D"}
 
     # Заголовок/название мероприятия
     title: Mapped[str] = mapped_column(Text())
@@ -3,10 +3,16 @@ from sqlalchemy.orm import Mapped, mapped_column
 
 from core.models import Base
 from core.models.mixins.id import IdMixin
+from core.models.mixins.image_metadata import ImageMetadataMixin
+from core.models.mixins.search import SearchVectorMixin
 
 
-class Partner(Base, IdMixin):
+class Partner(Base, IdMixin, ImageMetadataMixin, SearchVectorMixin):
     __tablename__ = "partners"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"partner_name": "A"}
+    # Для партнеров метаданные берутся по логотипу
+    __image_url_attribute__ = "logo_url"
 
     # Название
     partner_name: Mapped[str] = mapped_column(Text())
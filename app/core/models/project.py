@@ -1,18 +1,48 @@
-from sqlalchemy import Text, String, ARRAY
+from sqlalchemy import Text, String, ARRAY, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from core.models.base import Base
 from core.models.mixins.id import IdMixin
+from core.models.mixins.image_metadata import ImageMetadataMixin
+from core.models.mixins.search import SearchVectorMixin
 
 
-class Project(Base, IdMixin):
+class Project(Base, IdMixin, ImageMetadataMixin, SearchVectorMixin):
     __tablename__ = "projects"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {
+        "title": "A",
+        "keywords": "B",
+        "theme": "B",
+        "category": "B",
+        "min_text": "C",
+    }
 
     title: Mapped[str] = mapped_column(Text, nullable=False)
     project_url: Mapped[str] = mapped_column(Text, nullable=False)
-    keywords: Mapped[list[str]] = mapped_column(ARRAY(Text), nullable=False)
+    keywords: Mapped[list[str]] = mapped_column(
+        ARRAY(Text),
+        nullable=False,
+        active_history=True,
+    )
     min_text: Mapped[str] = mapped_column(Text, nullable=False)
     image_url: Mapped[str] = mapped_column(Text, nullable=False)
-    theme: Mapped[str] = mapped_column(String(255), nullable=False)
-    category: Mapped[str] = mapped_column(String(255), nullable=False)
-    is_active: Mapped[bool] = mapped_column(default=True, server_default="true")
+    theme: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        active_history=True,
+    )
+    category: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        active_history=True,
+    )
+    is_active: Mapped[bool] = mapped_column(
+        default=True,
+        server_default="true",
+        active_history=True,
+    )
+
+
+# GIN индекс для фильтрации по ключевым словам (оператор @>)
+Index("ix_projects_keywords", Project.keywords, postgresql_using="gin")
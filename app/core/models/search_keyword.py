@@ -0,0 +1,172 @@
+from datetime import date
+
+from sqlalchemy import Text, Index, func, event, inspect, delete, case
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.models.base import Base
+from core.models.mixins.id import IdMixin
+from core.models.news import News
+from core.models.project import Project
+from core.search.normalize import normalize_search_text
+
+
+class SearchKeyword(Base, IdMixin):
+    __table_args__ = (
+        Index(
+            "ix_searchkeywords_keyword_trgm",
+            "keyword",
+            postgresql_using="gin",
+            postgresql_ops={"keyword": "gin_trgm_ops"},
+        ),
+    )
+
+    # Нормализованное ключевое слово (нижний регистр, "ё" заменена на "е")
+    keyword: Mapped[str] = mapped_column(Text(), unique=True)
+    # Ключевое слово в том виде, в котором его показываем в подсказках
+    value: Mapped[str] = mapped_column(Text())
+    # Дата последнего материала с этим ключевым словом (для ранжирования подсказок)
+    last_used_on: Mapped[date]
+    # Количество опубликованных материалов с этим ключевым словом
+    ref_count: Mapped[int] = mapped_column(default=0, server_default="0")
+
+
+def get_keyword_values(keywords: list[str] | None) -> dict[str, str]:
+    """Нормализованные ключевые слова материала и их вид для подсказок"""
+    values = {}
+    for keyword in keywords or []:
+        normalized = normalize_search_text(keyword)
+        if normalized:
+            values.setdefault(normalized, keyword.strip())
+    return values
+
+
+def sync_search_keywords(
+    connection,
+    keywords: list[str] | None,
+    used_on: date,
+    old_keywords: list[str] | None = None,
+):
+    """
+    Изменение справочника подсказок при изменении ключевых слов материала
+
+    Новые слова материала увеличивают счетчик, прежние уменьшают,
+    слова без материалов удаляются из справочника
+    """
+    values = get_keyword_values(keywords)
+    old_values = get_keyword_values(old_keywords)
+    deltas = {keyword: 1 for keyword in values}
+    for keyword, value in old_values.items():
+        deltas[keyword] = deltas.get(keyword, 0) - 1
+        values.setdefault(keyword, value)
+
+    if not deltas:
+        return
+
+    stmt = insert(SearchKeyword).values(
+        [
+            dict(
+                keyword=keyword,
+                value=values[keyword],
+                last_used_on=used_on,
+                ref_count=delta,
+            )
+            for keyword, delta in deltas.items()
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SearchKeyword.keyword],
+        set_={
+            "ref_count": SearchKeyword.ref_count + stmt.excluded.ref_count,
+            # Дата обновляется только материалами, у которых это слово есть
+            "last_used_on": case(
+                (
+                    stmt.excluded.ref_count >= 0,
+                    func.greatest(
+                        SearchKeyword.last_used_on,
+                        stmt.excluded.last_used_on,
+                    ),
+                ),
+                else_=SearchKeyword.last_used_on,
+            ),
+        },
+    )
+    connection.execute(stmt)
+
+    connection.execute(
+        delete(SearchKeyword).where(
+            SearchKeyword.keyword.in_(deltas),
+            SearchKeyword.ref_count <= 0,
+        )
+    )
+
+
+def _get_old_value(target, field: str):
+    """Значение поля до изменения (поле объявлено с active_history=True)"""
+    history = inspect(target).attrs[field].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(target, field)
+
+
+def _has_changes(target, *fields: str) -> bool:
+    state = inspect(target)
+    return any(state.attrs[field].history.has_changes() for field in fields)
+
+
+@event.listens_for(News, "after_insert")
+def _add_news_keywords(mapper, connection, target: News):
+    sync_search_keywords(connection, target.keywords, target.news_date)
+
+
+@event.listens_for(News, "after_update")
+def _update_news_keywords(mapper, connection, target: News):
+    if _has_changes(target, "keywords"):
+        sync_search_keywords(
+            connection,
+            target.keywords,
+            target.news_date,
+            old_keywords=_get_old_value(target, "keywords"),
+        )
+
+
+@event.listens_for(News, "after_delete")
+def _remove_news_keywords(mapper, connection, target: News):
+    sync_search_keywords(
+        connection,
+        None,
+        target.news_date,
+        old_keywords=_get_old_value(target, "keywords"),
+    )
+
+
+@event.listens_for(Project, "after_insert")
+def _add_project_keywords(mapper, connection, target: Project):
+    # Ключевые слова неактивных проектов в подсказках не показываются
+    if target.is_active is not False:
+        sync_search_keywords(connection, target.keywords, date.today())
+
+
+@event.listens_for(Project, "after_update")
+def _update_project_keywords(mapper, connection, target: Project):
+    if _has_changes(target, "keywords", "is_active"):
+        old_keywords = None
+        if _get_old_value(target, "is_active"):
+            old_keywords = _get_old_value(target, "keywords")
+        sync_search_keywords(
+            connection,
+            target.keywords if target.is_active else None,
+            date.today(),
+            old_keywords=old_keywords,
+        )
+
+
+@event.listens_for(Project, "after_delete")
+def _remove_project_keywords(mapper, connection, target: Project):
+    if _get_old_value(target, "is_active"):
+        sync_search_keywords(
+            connection,
+            None,
+            date.today(),
+            old_keywords=_get_old_value(target, "keywords"),
+        )
@@ -5,14 +5,19 @@ from sqlalchemy.orm import Mapped, mapped_column
 
 from core.models.base import Base
 from core.models.mixins.id import IdMixin
+from core.models.mixins.document_preview import DocumentPreviewMixin
+from core.models.mixins.image_metadata import ImageMetadataMixin
+from core.models.mixins.search import SearchVectorMixin
 
 
-class SovietSupportDocument(Base, IdMixin):
+class SovietSupportDocument(Base, IdMixin, DocumentPreviewMixin, SearchVectorMixin):
     """
     Модель для хранения документов сопровождения управляющих советов в разделе "Управляющим советам"
     """
 
     __tablename__ = "soviet_support_documents"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "content_text": "D"}
 
     # Заголовок/название документа
     title: Mapped[str] = mapped_column(Text())
@@ -21,12 +26,14 @@ class SovietSupportDocument(Base, IdMixin):
     file_url: Mapped[str] = mapped_column(Text())
 
 
-class SovietSupportEvent(Base, IdMixin):
+class SovietSupportEvent(Base, IdMixin, ImageMetadataMixin, SearchVectorMixin):
     """
     Модель для хранения мероприятий сопровождения управляющих советов в разделе "Управляющим советам"
     """
 
     __tablename__ = "soviet_support_events"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "description": "C", "location": "D"}
 
     # Заголовок/название мероприятия
     title: Mapped[str] = mapped_column(Text())
@@ -70,7 +77,7 @@ class SovietSupportApplication(Base, IdMixin):
     text: Mapped[str] = mapped_column(Text())
 
 
-class SovietLeader(Base, IdMixin):
+class SovietLeader(Base, IdMixin, ImageMetadataMixin):
     """
     Модель для хранения лидеров управляющих советов в разделе "Управляющим советам"
     """
@@ -87,12 +94,14 @@ class SovietLeader(Base, IdMixin):
     image_url: Mapped[str | None] = mapped_column(Text(), nullable=True)
 
 
-class SovietNews(Base, IdMixin):
+class SovietNews(Base, IdMixin, ImageMetadataMixin, SearchVectorMixin):
     """
     Модель для хранения новостей управляющих советов в разделе "Управляющим советам"
     """
 
     __tablename__ = "soviet_news"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "subtitle": "B", "description": "C"}
 
     # Заголовок
     title: Mapped[str] = mapped_column(Text())
@@ -153,12 +162,14 @@ class SovietContact(Base, IdMixin):
     vk_group: Mapped[str | None] = mapped_column(Text(), nullable=True)
 
 
-class LearningDocument(Base, IdMixin):
+class LearningDocument(Base, IdMixin, DocumentPreviewMixin, SearchVectorMixin):
     """
     Модель для хранения документов в разделе "Обучение"
     """
 
     __tablename__ = "learning_documents"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "content_text": "D"}
 
     # Название/Заголовок документа
     title: Mapped[str] = mapped_column(Text())
@@ -167,12 +178,14 @@ class LearningDocument(Base, IdMixin):
     file_url: Mapped[str] = mapped_column(Text())
 
 
-class LearningEvent(Base, IdMixin):
+class LearningEvent(Base, IdMixin, ImageMetadataMixin, SearchVectorMixin):
     """
     Модель для хранения мероприятий в разделе "Обучение"
     """
 
     __tablename__ = "learning_events"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "description": "C", "location": "D"}
 
     # Заголовок/название мероприятия
     title: Mapped[str] = mapped_column(Text())
@@ -216,12 +229,14 @@ class LearningApplication(Base, IdMixin):
     text: Mapped[str] = mapped_column(Text())
 
 
-class LearningNews(Base, IdMixin):
+class LearningNews(Base, IdMixin, ImageMetadataMixin, SearchVectorMixin):
     """
     Модель для хранения новостей в разделе "Обучение"
     """
 
     __tablename__ = "learning_news"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "subtitle": "B", "description": "C"}
 
     # Заголовок новости
     title: Mapped[str] = mapped_column(Text())
@@ -262,7 +277,7 @@ class LearningQuestion(Base, IdMixin):
     response: Mapped[str | None] = mapped_column(Text(), nullable=True)
 
 
-class LearningContact(Base, IdMixin):
+class LearningContact(Base, IdMixin, ImageMetadataMixin):
     """
     Модель для хранения контактов в разделе "Обучение"
     """
@@ -285,12 +300,16 @@ class LearningContact(Base, IdMixin):
     phone: Mapped[str] = mapped_column(String(40))
 
 
-class OnlineConferenceRegulation(Base, IdMixin):
+class OnlineConferenceRegulation(
+    Base, IdMixin, DocumentPreviewMixin, SearchVectorMixin
+):
     """
     Модель для хранения регламентов онлайн селекторных совещаний в разделе "Управляющим советам"
     """
 
     __tablename__ = "online_conference_regulations"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "content_text": "D"}
 
     # Название/заголовок документа
     title: Mapped[str] = mapped_column(Text())
@@ -299,7 +318,7 @@ class OnlineConferenceRegulation(Base, IdMixin):
     file_url: Mapped[str] = mapped_column(Text())
 
 
-class OnlineConferenceParticipant(Base, IdMixin):
+class OnlineConferenceParticipant(Base, IdMixin, ImageMetadataMixin):
     """
     Модель для хранения участников онлайн селекторных совещаний в разделе "Управляющим советам"
     """
@@ -316,12 +335,14 @@ class OnlineConferenceParticipant(Base, IdMixin):
     image_url: Mapped[str | None] = mapped_column(Text(), nullable=True)
 
 
-class OnlineConferenceNews(Base, IdMixin):
+class OnlineConferenceNews(Base, IdMixin, ImageMetadataMixin, SearchVectorMixin):
     """
     Модель для хранения новостей онлайн селекторных совещаний в разделе "Управляющим советам"
     """
 
     __tablename__ = "online_conference_news"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "subtitle": "B", "description": "C"}
 
     # Заголовок
     title: Mapped[str] = mapped_column(Text())
@@ -362,7 +383,7 @@ class OnlineConferenceQuestion(Base, IdMixin):
     response: Mapped[str | None] = mapped_column(Text(), nullable=True)
 
 
-class OnlineConferenceContact(Base, IdMixin):
+class OnlineConferenceContact(Base, IdMixin, ImageMetadataMixin):
     """
     Модель для хранения контактов онлайн селекторных совещаний в разделе "Управляющим советам"
     """
@@ -422,12 +443,14 @@ class PodcastParticipant(Base, IdMixin):
     guests: Mapped[list[str]] = mapped_column(Text())  # В виде JSON строки
 
 
-class PodcastNews(Base, IdMixin):
+class PodcastNews(Base, IdMixin, ImageMetadataMixin, SearchVectorMixin):
     """
     Модель для хранения новостей подкастов с командами УС в разделе "Управляющим советам"
     """
 
     __tablename__ = "podcast_news"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "subtitle": "B", "description": "C"}
 
     # Заголовок
     title: Mapped[str] = mapped_column(Text())
@@ -442,7 +465,7 @@ class PodcastNews(Base, IdMixin):
     image_url: Mapped[str] = mapped_column(Text())
 
 
-class PodcastContact(Base, IdMixin):
+class PodcastContact(Base, IdMixin, ImageMetadataMixin):
     """
     Модель для хранения контактов подкастов с командами УС в разделе "Управляющим советам"
     """
@@ -465,12 +488,14 @@ class PodcastContact(Base, IdMixin):
     phone: Mapped[str] = mapped_column(String(40))
 
 
-class ProjectNews(Base, IdMixin):
+class ProjectNews(Base, IdMixin, ImageMetadataMixin, SearchVectorMixin):
     """
     Модель для хранения новостей банка проектов в разделе "Управляющим советам"
     """
 
     __tablename__ = "project_news"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "subtitle": "B", "description": "C"}
 
     # Заголовок
     title: Mapped[str] = mapped_column(Text())
@@ -499,12 +524,14 @@ class ProjectReport(Base, IdMixin):
     video_url: Mapped[str] = mapped_column(Text())
 
 
-class CompetitionDocument(Base, IdMixin):
+class CompetitionDocument(Base, IdMixin, DocumentPreviewMixin, SearchVectorMixin):
     """
     Модель для хранения документов конкурса в разделе "Управляющим советам"
     """
 
     __tablename__ = "competition_documents"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "content_text": "D"}
 
     # Название документа
     title: Mapped[str] = mapped_column(Text())
@@ -530,12 +557,14 @@ class CompetitionContact(Base, IdMixin):
     email: Mapped[str] = mapped_column(String(320))
 
 
-class JournalNews(Base, IdMixin):
+class JournalNews(Base, IdMixin, ImageMetadataMixin, SearchVectorMixin):
     """
     Модель для хранения новостей журналов в разделе "Управляющим советам"
     """
 
     __tablename__ = "journal_news"
+    # Поля полнотекстового поиска и их веса
+    __search_fields__ = {"title": "A", "subtitle": "B", "description": "C"}
 
     # Заголовок новости
     title: Mapped[str] = mapped_column(Text())
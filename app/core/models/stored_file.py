@@ -0,0 +1,32 @@
+from sqlalchemy import Text, String, BigInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.models.base import Base
+from core.models.mixins.id import IdMixin
+
+
+class StoredFile(Base, IdMixin):
+    __tablename__ = "stored_files"
+
+    # SHA-256 содержимого файла
+    hash: Mapped[str] = mapped_column(String(64), unique=True)
+    # Путь к файлу относительно папки загрузок
+    path: Mapped[str] = mapped_column(Text(), unique=True)
+    # Размер файла в байтах
+    size: Mapped[int] = mapped_column(BigInteger())
+    # MIME тип файла
+    content_type: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # Миниатюра первой страницы и количество страниц (для документов)
+    thumbnail_path: Mapped[str | None] = mapped_column(Text(), nullable=True)
+    page_count: Mapped[int | None] = mapped_column(nullable=True)
+    # Извлеченный текст документа (для полнотекстового поиска)
+    content_text: Mapped[str | None] = mapped_column(
+        Text(), nullable=True, deferred=True
+    )
+    # Размеры, основной цвет и размытая миниатюра (для изображений)
+    image_width: Mapped[int | None] = mapped_column(nullable=True)
+    image_height: Mapped[int | None] = mapped_column(nullable=True)
+    image_color: Mapped[str | None] = mapped_column(String(7), nullable=True)
+    image_placeholder: Mapped[str | None] = mapped_column(Text(), nullable=True)
+    # Количество записей, ссылающихся на файл
+    ref_count: Mapped[int] = mapped_column(default=1, server_default="1")
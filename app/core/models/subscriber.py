@@ -2,7 +2,7 @@ import uuid
 from typing import TYPE_CHECKING
 from datetime import date, datetime, timezone
 
-from sqlalchemy import String, func, Date, ForeignKey
+from sqlalchemy import String, func, Date, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.models.base import Base
@@ -14,6 +14,11 @@ if TYPE_CHECKING:
 
 
 class Subscriber(Base, IdMixin):
+    __table_args__ = (
+        # Рассылка читает подписчиков типа новостей по порядку id
+        Index("ix_subscribers_type_id_id", "type_id", "id"),
+    )
+
     # Тип новости
     type_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("news_types.id"))
     email: Mapped[str] = mapped_column(String(320))
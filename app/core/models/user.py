@@ -24,6 +24,8 @@ class User(Base, IdMixin):
     )
     _hashed_password: Mapped[bytes] = mapped_column("hashed_password")
     is_active: Mapped[bool] = mapped_column(default=False, server_default="false")
+    # Версия access токенов пользователя (увеличивается при смене активности или удалении)
+    token_version: Mapped[int] = mapped_column(default=0, server_default="0")
 
     refresh_tokens: Mapped[list["RefreshToken"]] = relationship(
         back_populates="user",
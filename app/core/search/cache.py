@@ -0,0 +1,121 @@
+import json
+import time
+import logging
+from pathlib import Path
+from collections import Counter, OrderedDict
+from typing import Any, Awaitable, Callable
+
+from core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class SearchCache:
+    """
+    LRU кеш результатов поиска и подсказок с ограниченным временем жизни
+
+    Ключ строится из нормализованного запроса, типа сущности и страницы.
+    Любое изменение искомых данных сбрасывает кеш целиком и увеличивает
+    номер поколения: результат, вычисленный до сброса, в кеш уже не попадет.
+
+    Кеш свой у каждого процесса, и сбрасывается он только в том процессе,
+    который изменил данные. Остальные процессы отдают прежние результаты,
+    пока не истечет TTL, поэтому время жизни записей должно быть коротким
+    """
+
+    def __init__(self, maxsize: int, ttl: float, top_queries_size: int):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.top_queries_size = top_queries_size
+        self._items: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._generation = 0
+        self._hits: Counter[str] = Counter()
+        self._misses: Counter[str] = Counter()
+        self._query_counts: Counter[str] = Counter()
+
+    async def get_or_compute(
+        self,
+        kind: str,
+        key: tuple,
+        compute: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Результат из кеша или вычисленный и сохраненный в кеш
+
+        :param kind: Вид запроса ("search" или "suggestions") для статистики
+        :param key: Нормализованный запрос и параметры, от которых зависит результат
+        :param compute: Функция, вычисляющая результат при промахе
+        """
+        self._count_query(key[0])
+        cache_key = (kind, *key)
+
+        item = self._items.get(cache_key)
+        if item is not None and time.monotonic() - item[0] <= self.ttl:
+            self._items.move_to_end(cache_key)
+            self._hits[kind] += 1
+            return item[1]
+
+        self._misses[kind] += 1
+        generation = self._generation
+        value = await compute()
+
+        # Пока результат вычислялся, данные могли измениться
+        if generation == self._generation:
+            self._items[cache_key] = (time.monotonic(), value)
+            self._items.move_to_end(cache_key)
+            if len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+        return value
+
+    def invalidate(self):
+        self._items.clear()
+        self._generation += 1
+
+    def get_top_queries(self) -> list[str]:
+        return [
+            query for query, _ in self._query_counts.most_common(self.top_queries_size)
+        ]
+
+    def get_stats(self) -> dict:
+        stats = {"size": len(self._items), "top_queries": self.get_top_queries()}
+        for kind in ("search", "suggestions"):
+            hits, misses = self._hits[kind], self._misses[kind]
+            stats[kind] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            }
+        return stats
+
+    def save_top_queries(self, path: Path):
+        try:
+            path.write_text(
+                json.dumps(self.get_top_queries(), ensure_ascii=False),
+                encoding="utf-8",
+            )
+        except OSError:
+            logger.exception("Failed to save top search queries")
+
+    def load_top_queries(self, path: Path) -> list[str]:
+        try:
+            queries = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return []
+        return [query for query in queries if isinstance(query, str)]
+
+    def _count_query(self, query: str):
+        self._query_counts[query] += 1
+        # Не даем счетчику расти бесконечно из-за редких запросов
+        if len(self._query_counts) > self.top_queries_size * 10:
+            self._query_counts = Counter(
+                dict(self._query_counts.most_common(self.top_queries_size * 5))
+            )
+
+
+search_cache = SearchCache(
+    maxsize=settings.search.cache_size,
+    ttl=settings.search.cache_ttl,
+    top_queries_size=settings.search.top_queries_size,
+)
@@ -0,0 +1,6 @@
+def normalize_search_text(text: str) -> str:
+    """
+    Приведение поисковой строки к единому виду: без учета регистра,
+    лишних пробелов и различий между "ё" и "е"
+    """
+    return " ".join(text.casefold().replace("ё", "е").split())
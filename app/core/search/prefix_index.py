@@ -0,0 +1,230 @@
+import uuid
+import logging
+from bisect import bisect_left, insort
+from datetime import date, datetime
+from typing import NamedTuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.models import (
+    News,
+    Project,
+    SovietNews,
+    LearningNews,
+    OnlineConferenceNews,
+    PodcastNews,
+    ProjectNews,
+    JournalNews,
+    OrganizationNews,
+)
+from core.search.normalize import normalize_search_text
+
+
+logger = logging.getLogger(__name__)
+
+
+class PrefixIndexSource(NamedTuple):
+    model: type
+    # Поле с датой материала (для ранжирования подсказок по свежести)
+    date_field: str = "created_at"
+    # Поле с ключевыми словами (если есть)
+    keywords_field: str | None = None
+
+
+# Материалы, заголовки и ключевые слова которых попадают в подсказки
+PREFIX_INDEX_SOURCES = {
+    source.model: source
+    for source in (
+        PrefixIndexSource(News, date_field="news_date", keywords_field="keywords"),
+        PrefixIndexSource(Project, keywords_field="keywords"),
+        PrefixIndexSource(SovietNews),
+        PrefixIndexSource(LearningNews),
+        PrefixIndexSource(OnlineConferenceNews),
+        PrefixIndexSource(PodcastNews),
+        PrefixIndexSource(ProjectNews),
+        PrefixIndexSource(JournalNews),
+        PrefixIndexSource(OrganizationNews),
+    )
+}
+
+
+class PrefixIndex:
+    """
+    Индекс подсказок в памяти процесса
+
+    Хранит отсортированный массив пар (нормализованный ключ, подсказка), поэтому
+    поиск по префиксу - это двоичный поиск и просмотр соседних элементов.
+    Ключами служат заголовок целиком, его окончания с начала каждого слова
+    (чтобы находить слово из середины заголовка) и ключевые слова.
+    Одна пара может принадлежать нескольким материалам, поэтому для пар ведется
+    счетчик ссылок, а для материалов - список их пар
+    """
+
+    def __init__(self, max_entries: int, max_title_words: int, scan_limit: int):
+        self.max_entries = max_entries
+        self.max_title_words = max_title_words
+        self.scan_limit = scan_limit
+
+        self._entries: list[tuple[str, str]] = []
+        self._ref_counts: dict[tuple[str, str], int] = {}
+        # Для каждой подсказки: нормализованный вид, самая свежая дата материала
+        # и количество пар, в которых она участвует
+        self._suggestions: dict[str, list] = {}
+        # Пары, добавленные каждым материалом, для удаления при изменении
+        self._entries_by_item: dict[tuple[type, uuid.UUID], list[tuple[str, str]]] = {}
+        self._is_full = False
+        self.is_ready = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def build(self, session: AsyncSession):
+        """Построение индекса по всем материалам (при запуске приложения)"""
+        items_by_model = {}
+        for model in PREFIX_INDEX_SOURCES:
+            result = await session.scalars(select(model))
+            items_by_model[model] = result.all()
+
+        self.load(items_by_model)
+        logger.info("Search prefix index built with %d entries", len(self._entries))
+
+    def load(self, items_by_model: dict[type, list]):
+        """Заполнение индекса материалами с полной перестройкой"""
+        self._entries = []
+        self._ref_counts = {}
+        self._suggestions = {}
+        self._entries_by_item = {}
+        self._is_full = False
+
+        # Сначала собираем все пары, затем один раз сортируем
+        entries = []
+        for model, items in items_by_model.items():
+            source = PREFIX_INDEX_SOURCES[model]
+            for item in items:
+                entries.extend(self._register_item(source, item))
+
+        self._entries = sorted(set(entries))
+        self.is_ready = True
+
+    def on_write(self, model: type, items: list, deleted: bool = False):
+        """Обновление индекса после создания, изменения или удаления материалов"""
+        source = PREFIX_INDEX_SOURCES.get(model)
+        if source is None or not self.is_ready:
+            return
+
+        for item in items:
+            self._remove_item(model, item.id)
+            if not deleted:
+                for entry in self._register_item(source, item):
+                    if self._ref_counts[entry] == 1:
+                        insort(self._entries, entry)
+
+    def suggest(self, query: str, limit: int) -> list[str]:
+        """Подсказки, начинающиеся с запроса, более свежие материалы выше"""
+        prefix = normalize_search_text(query)
+        if not prefix:
+            return []
+
+        matches = set()
+        position = bisect_left(self._entries, (prefix, ""))
+        while position < len(self._entries) and len(matches) < self.scan_limit:
+            key, suggestion = self._entries[position]
+            if not key.startswith(prefix):
+                break
+            matches.add(suggestion)
+            position += 1
+
+        def rank(suggestion: str) -> tuple[bool, date]:
+            normalized, suggestion_date, _ = self._suggestions[suggestion]
+            # Совпадение с началом подсказки важнее совпадения с середины заголовка
+            return normalized.startswith(prefix), suggestion_date
+
+        # Подсказки, отличающиеся только регистром, показываем один раз
+        suggestions = {}
+        for suggestion in sorted(matches, key=rank, reverse=True):
+            suggestions.setdefault(self._suggestions[suggestion][0], suggestion)
+            if len(suggestions) >= limit:
+                break
+        return list(suggestions.values())
+
+    def _register_item(self, source: PrefixIndexSource, item) -> list[tuple[str, str]]:
+        # Неактивные материалы в подсказках не показываем. При изменении
+        # материала его прежние пары уже удалены, поэтому выключенный
+        # материал пропадает из индекса
+        if getattr(item, "is_active", True) is False:
+            return []
+
+        entries = self._get_item_entries(source, item)
+
+        # Ограничиваем память: новые пары не добавляются, пока индекс заполнен
+        new_entries_count = sum(entry not in self._ref_counts for entry in entries)
+        if len(self._ref_counts) + new_entries_count > self.max_entries:
+            if not self._is_full:
+                logger.warning("Search prefix index is full, new items are skipped")
+            self._is_full = True
+            return []
+        self._is_full = False
+
+        item_date = getattr(item, source.date_field)
+        if isinstance(item_date, datetime):
+            item_date = item_date.date()
+
+        for entry in entries:
+            self._ref_counts[entry] = self._ref_counts.get(entry, 0) + 1
+
+            suggestion = entry[1]
+            if suggestion not in self._suggestions:
+                self._suggestions[suggestion] = [
+                    normalize_search_text(suggestion),
+                    date.min,
+                    0,
+                ]
+            suggestion_info = self._suggestions[suggestion]
+            suggestion_info[1] = max(suggestion_info[1], item_date or date.min)
+            suggestion_info[2] += 1
+
+        self._entries_by_item[(source.model, item.id)] = entries
+        return entries
+
+    def _remove_item(self, model: type, item_id: uuid.UUID):
+        for entry in self._entries_by_item.pop((model, item_id), []):
+            suggestion = entry[1]
+            self._suggestions[suggestion][2] -= 1
+            if self._suggestions[suggestion][2] == 0:
+                del self._suggestions[suggestion]
+
+            self._ref_counts[entry] -= 1
+            if self._ref_counts[entry] > 0:
+                continue
+
+            del self._ref_counts[entry]
+            position = bisect_left(self._entries, entry)
+            if position < len(self._entries) and self._entries[position] == entry:
+                del self._entries[position]
+
+    def _get_item_entries(
+        self, source: PrefixIndexSource, item
+    ) -> list[tuple[str, str]]:
+        entries = set()
+
+        title = (item.title or "").strip()
+        words = normalize_search_text(title).split()
+        for start in range(min(len(words), self.max_title_words)):
+            entries.add((" ".join(words[start:]), title))
+
+        if source.keywords_field:
+            for keyword in getattr(item, source.keywords_field) or []:
+                normalized = normalize_search_text(keyword)
+                if normalized:
+                    entries.add((normalized, keyword.strip()))
+
+        return list(entries)
+
+
+prefix_index = PrefixIndex(
+    max_entries=settings.search.prefix_index_max_entries,
+    max_title_words=settings.search.prefix_index_max_title_words,
+    scan_limit=settings.search.prefix_index_scan_limit,
+)
@@ -0,0 +1,138 @@
+from typing import NamedTuple
+
+from core.models import (
+    News,
+    Project,
+    Event,
+    Partner,
+    Manager,
+    Document,
+    ParentDocument,
+    ThematicMeetingEvent,
+    EtiquetteInEducationDocument,
+    EtiquetteInEducationEvent,
+    ProfessionalLearningTrajectoryDocument,
+    ProfessionalLearningTrajectoryEvent,
+    SovietSupportDocument,
+    SovietSupportEvent,
+    SovietNews,
+    LearningDocument,
+    LearningEvent,
+    LearningNews,
+    OnlineConferenceRegulation,
+    OnlineConferenceNews,
+    PodcastNews,
+    ProjectNews,
+    CompetitionDocument,
+    JournalNews,
+    OrganizationSupportDocument,
+    OrganizationSupportEvent,
+    OrganizationNews,
+    OrganizationEducationalProgramDocument,
+    OrganizationThematicMeetingEvent,
+    OrganizationEtiquetteInEducationDocument,
+    OrganizationEtiquetteInEducationEvent,
+    OrganizationProfessionalLearningTrajectoryDocument,
+    OrganizationProfessionalLearningTrajectoryEvent,
+)
+
+
+class SearchableEntity(NamedTuple):
+    # Тип сущности в результатах поиска и в фильтре entity_type
+    entity_type: str
+    # Модель с колонкой search_vector (SearchVectorMixin)
+    model: type
+    # Поле, которое показывается как заголовок результата
+    title_field: str = "title"
+    # Поле, которое показывается как описание результата (если есть)
+    description_field: str | None = None
+    # Поле со ссылкой на материал или файл (если есть)
+    url_field: str | None = None
+
+
+def _news(entity_type: str, model: type) -> SearchableEntity:
+    return SearchableEntity(entity_type, model, description_field="subtitle")
+
+
+def _event(entity_type: str, model: type) -> SearchableEntity:
+    return SearchableEntity(entity_type, model, description_field="description")
+
+
+def _document(entity_type: str, model: type) -> SearchableEntity:
+    return SearchableEntity(entity_type, model, url_field="file_url")
+
+
+# Все сущности, по которым идет поиск
+SEARCHABLE_ENTITIES: dict[str, SearchableEntity] = {
+    entity.entity_type: entity
+    for entity in (
+        SearchableEntity(
+            "news", News, description_field="min_text", url_field="news_url"
+        ),
+        SearchableEntity(
+            "project", Project, description_field="min_text", url_field="project_url"
+        ),
+        _event("event", Event),
+        SearchableEntity(
+            "partner", Partner, title_field="partner_name", url_field="partner_url"
+        ),
+        SearchableEntity(
+            "manager", Manager, title_field="full_name", description_field="position"
+        ),
+        _document("document", Document),
+        # Раздел "Для родителей"
+        _document("parent_document", ParentDocument),
+        _event("thematic_meeting_event", ThematicMeetingEvent),
+        _document("etiquette_in_education_document", EtiquetteInEducationDocument),
+        _event("etiquette_in_education_event", EtiquetteInEducationEvent),
+        _document(
+            "professional_learning_trajectory_document",
+            ProfessionalLearningTrajectoryDocument,
+        ),
+        _event(
+            "professional_learning_trajectory_event",
+            ProfessionalLearningTrajectoryEvent,
+        ),
+        # Раздел "Управляющим советам"
+        _document("soviet_support_document", SovietSupportDocument),
+        _event("soviet_support_event", SovietSupportEvent),
+        _news("soviet_news", SovietNews),
+        _document("learning_document", LearningDocument),
+        _event("learning_event", LearningEvent),
+        _news("learning_news", LearningNews),
+        _document("online_conference_regulation", OnlineConferenceRegulation),
+        _news("online_conference_news", OnlineConferenceNews),
+        _news("podcast_news", PodcastNews),
+        _news("project_news", ProjectNews),
+        _document("competition_document", CompetitionDocument),
+        _news("journal_news", JournalNews),
+        # Раздел "Образовательным организациям"
+        _document("organization_support_document", OrganizationSupportDocument),
+        _event("organization_support_event", OrganizationSupportEvent),
+        _news("organization_news", OrganizationNews),
+        _document(
+            "organization_educational_program_document",
+            OrganizationEducationalProgramDocument,
+        ),
+        _event(
+            "organization_thematic_meeting_event",
+            OrganizationThematicMeetingEvent,
+        ),
+        _document(
+            "organization_etiquette_in_education_document",
+            OrganizationEtiquetteInEducationDocument,
+        ),
+        _event(
+            "organization_etiquette_in_education_event",
+            OrganizationEtiquetteInEducationEvent,
+        ),
+        _document(
+            "organization_professional_learning_trajectory_document",
+            OrganizationProfessionalLearningTrajectoryDocument,
+        ),
+        _event(
+            "organization_professional_learning_trajectory_event",
+            OrganizationProfessionalLearningTrajectoryEvent,
+        ),
+    )
+}
@@ -12,8 +12,17 @@ from cleanup_tokens import setup_cleanup_tokens
 from core.config import settings
 from core.db_helper import db_helper
 from core.models import Base
-from api import router as api_router
+from api import router as api_router, JSON_ONLY_PREFIXES, BATCH_UPLOAD_PATHS
+from core.middleware.body_size import BodySizeLimitMiddleware
 from core.admin.service import AdminService
+from core.file.process_pool import shutdown_process_pool
+from core.file.storage import storage
+from core.search.prefix_index import prefix_index
+from core.search.cache import search_cache
+from core.email.service import email_service
+from core.email.worker import email_outbox_worker
+from core.email.newsletter import newsletter_engine
+from api.search.repository import prewarm_search_cache
 
 
 @asynccontextmanager
@@ -27,6 +36,24 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     async with db_helper.session_factory() as session:  # Создаем администратора
         await AdminService.create_admin(session=session)
 
+    # Строим индекс подсказок поиска в памяти
+    async with db_helper.session_factory() as session:
+        await prefix_index.build(session)
+
+    # Прогреваем кеш поиска популярными запросами прошлого запуска
+    prewarm_task = asyncio.create_task(
+        prewarm_search_cache(
+            search_cache.load_top_queries(settings.search.top_queries_path)
+        )
+    )
+
+    # Компилируем шаблоны писем до первых отправок
+    email_service.compile_templates()
+
+    # Запускаем отправку писем из очереди
+    email_outbox_worker.start()
+    newsletter_engine.start()
+
     # Запускаем cron на очистку таблицы с токенами
     cleanup_tokens_task = asyncio.create_task(setup_cleanup_tokens())
     yield
@@ -37,6 +64,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except asyncio.CancelledError:
         pass
 
+    await email_outbox_worker.stop()
+    await newsletter_engine.stop()
+
+    # Сохраняем популярные запросы для прогрева кеша при следующем запуске
+    prewarm_task.cancel()
+    search_cache.save_top_queries(settings.search.top_queries_path)
+
+    # Останавливаем пул процессов обработки файлов и закрываем соединения с хранилищем
+    shutdown_process_pool()
+    await storage.close()
+
 
 app = FastAPI(
     lifespan=lifespan,
@@ -51,6 +89,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Отклоняем слишком большие запросы до разбора multipart и сохранения файлов
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    default_limit=settings.file.max_file_size + settings.file.multipart_overhead_size,
+    route_limits={
+        **{
+            f"{settings.api.prefix}{prefix}": settings.file.max_json_body_size
+            for prefix in JSON_ONLY_PREFIXES
+        },
+        **{
+            f"{settings.api.prefix}{path}": (
+                settings.file.max_file_size * settings.file.max_batch_files
+                + settings.file.multipart_overhead_size
+            )
+            for path in BATCH_UPLOAD_PATHS
+        },
+    },
+)
+
 app.include_router(router=api_router, prefix=settings.api.prefix)
 
 
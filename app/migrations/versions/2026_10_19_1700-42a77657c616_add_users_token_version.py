@@ -0,0 +1,46 @@
+"""add users token_version
+
+Revision ID: 42a77657c616
+Revises:
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "42a77657c616"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_column(table_name: str, column_name: str) -> bool | None:
+    """Есть ли колонка в таблице (None - таблицы еще нет, ее создаст приложение)"""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table_name):
+        return None
+    return column_name in {
+        column["name"] for column in inspector.get_columns(table_name)
+    }
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if _has_column("users", "token_version") is False:
+        op.add_column(
+            "users",
+            sa.Column(
+                "token_version", sa.Integer(), server_default="0", nullable=False
+            ),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _has_column("users", "token_version"):
+        op.drop_column("users", "token_version")
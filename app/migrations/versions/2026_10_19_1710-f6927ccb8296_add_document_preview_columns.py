@@ -0,0 +1,72 @@
+"""add document preview columns
+
+Revision ID: f6927ccb8296
+Revises: 42a77657c616
+Create Date: 2026-10-19 17:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f6927ccb8296"
+down_revision: Union[str, Sequence[str], None] = "42a77657c616"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Таблицы документов с миниатюрой, количеством страниц, размером и текстом файла
+DOCUMENT_TABLES = (
+    "competition_documents",
+    "documents",
+    "etiquette_in_education_documents",
+    "learning_documents",
+    "online_conference_regulations",
+    "organization_educational_program_documents",
+    "organization_etiquette_in_education_documents",
+    "organization_professional_learning_trajectory_documents",
+    "organization_support_documents",
+    "parent_documents",
+    "professional_learning_trajectory_documents",
+    "soviet_support_documents",
+)
+
+
+def get_columns() -> list[sa.Column]:
+    return [
+        sa.Column("thumbnail_url", sa.Text(), nullable=True),
+        sa.Column("page_count", sa.Integer(), nullable=True),
+        sa.Column("file_size", sa.BigInteger(), nullable=True),
+        sa.Column("content_text", sa.Text(), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    for table_name in DOCUMENT_TABLES:
+        # Новые таблицы создаются приложением сразу со всеми колонками
+        if not inspector.has_table(table_name):
+            continue
+
+        existing = {column["name"] for column in inspector.get_columns(table_name)}
+        for column in get_columns():
+            if column.name not in existing:
+                op.add_column(table_name, column)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    for table_name in DOCUMENT_TABLES:
+        if not inspector.has_table(table_name):
+            continue
+
+        existing = {column["name"] for column in inspector.get_columns(table_name)}
+        for column in get_columns():
+            if column.name in existing:
+                op.drop_column(table_name, column.name)
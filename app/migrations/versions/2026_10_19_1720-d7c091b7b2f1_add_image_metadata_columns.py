@@ -0,0 +1,95 @@
+"""add image metadata columns
+
+Revision ID: d7c091b7b2f1
+Revises: f6927ccb8296
+Create Date: 2026-10-19 17:20:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d7c091b7b2f1"
+down_revision: Union[str, Sequence[str], None] = "f6927ccb8296"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Таблицы с изображениями, для которых хранятся размеры, цвет и миниатюра
+IMAGE_TABLES = (
+    "banners",
+    "etiquette_in_education_contacts",
+    "etiquette_in_education_events",
+    "events",
+    "journal_news",
+    "learning_contacts",
+    "learning_events",
+    "learning_news",
+    "news",
+    "online_conference_contacts",
+    "online_conference_news",
+    "online_conference_participants",
+    "organization_etiquette_in_education_contacts",
+    "organization_etiquette_in_education_events",
+    "organization_leaders",
+    "organization_news",
+    "organization_professional_learning_trajectory_events",
+    "organization_professional_learning_trajectory_participants",
+    "organization_support_events",
+    "organization_thematic_meeting_contacts",
+    "organization_thematic_meeting_events",
+    "organization_thematic_meeting_participants",
+    "partners",
+    "podcast_contacts",
+    "podcast_news",
+    "professional_learning_trajectory_events",
+    "professional_learning_trajectory_participants",
+    "project_news",
+    "projects",
+    "soviet_leaders",
+    "soviet_news",
+    "soviet_support_events",
+    "thematic_meeting_contacts",
+    "thematic_meeting_events",
+    "thematic_meeting_participants",
+)
+
+
+def get_columns() -> list[sa.Column]:
+    return [
+        sa.Column("image_width", sa.Integer(), nullable=True),
+        sa.Column("image_height", sa.Integer(), nullable=True),
+        sa.Column("image_color", sa.String(length=7), nullable=True),
+        sa.Column("image_placeholder", sa.Text(), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    for table_name in IMAGE_TABLES:
+        # Новые таблицы создаются приложением сразу со всеми колонками
+        if not inspector.has_table(table_name):
+            continue
+
+        existing = {column["name"] for column in inspector.get_columns(table_name)}
+        for column in get_columns():
+            if column.name not in existing:
+                op.add_column(table_name, column)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    for table_name in IMAGE_TABLES:
+        if not inspector.has_table(table_name):
+            continue
+
+        existing = {column["name"] for column in inspector.get_columns(table_name)}
+        for column in get_columns():
+            if column.name in existing:
+                op.drop_column(table_name, column.name)
@@ -0,0 +1,172 @@
+"""add search vectors
+
+Revision ID: 2b96e32204f1
+Revises: d7c091b7b2f1
+Create Date: 2026-10-19 17:30:00.000000
+
+"""
+
+import hashlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2b96e32204f1"
+down_revision: Union[str, Sequence[str], None] = "d7c091b7b2f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_CONFIG = "russian"
+
+# Функции выражения сгенерированной колонки (см. core.models.mixins.search)
+SEARCH_TEXT_FUNCTIONS = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    """
+    CREATE OR REPLACE FUNCTION search_text(value text) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE
+    AS $$ SELECT translate(coalesce(value, ''), 'ёЁ', 'еЕ') $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION search_text(value text[]) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE
+    AS $$ SELECT translate(coalesce(array_to_string(value, ' '), ''), 'ёЁ', 'еЕ') $$
+    """,
+)
+
+DOCUMENT_FIELDS = {"title": "A", "content_text": "D"}
+EVENT_FIELDS = {"title": "A", "description": "C", "location": "D"}
+SECTION_NEWS_FIELDS = {"title": "A", "subtitle": "B", "description": "C"}
+
+# Поля полнотекстового поиска таблиц и их веса
+SEARCH_TABLES = {
+    "news": {"title": "A", "keywords": "B", "min_text": "C"},
+    "projects": {
+        "title": "A",
+        "keywords": "B",
+        "theme": "B",
+        "category": "B",
+        "min_text": "C",
+    },
+    "events": EVENT_FIELDS,
+    "partners": {"partner_name": "A"},
+    "managers": {"full_name": "A", "position": "B"},
+    "competition_documents": DOCUMENT_FIELDS,
+    "documents": DOCUMENT_FIELDS,
+    "etiquette_in_education_documents": DOCUMENT_FIELDS,
+    "learning_documents": DOCUMENT_FIELDS,
+    "online_conference_regulations": DOCUMENT_FIELDS,
+    "organization_educational_program_documents": DOCUMENT_FIELDS,
+    "organization_etiquette_in_education_documents": DOCUMENT_FIELDS,
+    "organization_professional_learning_trajectory_documents": DOCUMENT_FIELDS,
+    "organization_support_documents": DOCUMENT_FIELDS,
+    "parent_documents": DOCUMENT_FIELDS,
+    "professional_learning_trajectory_documents": DOCUMENT_FIELDS,
+    "soviet_support_documents": DOCUMENT_FIELDS,
+    "etiquette_in_education_events": EVENT_FIELDS,
+    "learning_events": EVENT_FIELDS,
+    "organization_etiquette_in_education_events": EVENT_FIELDS,
+    "organization_professional_learning_trajectory_events": EVENT_FIELDS,
+    "organization_support_events": EVENT_FIELDS,
+    "organization_thematic_meeting_events": EVENT_FIELDS,
+    "professional_learning_trajectory_events": EVENT_FIELDS,
+    "soviet_support_events": EVENT_FIELDS,
+    "thematic_meeting_events": EVENT_FIELDS,
+    "journal_news": SECTION_NEWS_FIELDS,
+    "learning_news": SECTION_NEWS_FIELDS,
+    "online_conference_news": SECTION_NEWS_FIELDS,
+    "organization_news": SECTION_NEWS_FIELDS,
+    "podcast_news": SECTION_NEWS_FIELDS,
+    "project_news": SECTION_NEWS_FIELDS,
+    "soviet_news": SECTION_NEWS_FIELDS,
+}
+
+MAX_IDENTIFIER_LENGTH = 63
+
+
+def get_index_name(table_name: str, suffix: str) -> str:
+    name = f"ix_{table_name}_{suffix}"
+    if len(name) <= MAX_IDENTIFIER_LENGTH:
+        return name
+
+    table_hash = hashlib.md5(table_name.encode()).hexdigest()[:8]
+    prefix_length = MAX_IDENTIFIER_LENGTH - len(suffix) - len(table_hash) - 5
+    return f"ix_{table_name[:prefix_length]}_{table_hash}_{suffix}"
+
+
+def build_search_vector_expression(search_fields: dict[str, str]) -> str:
+    return " || ".join(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', search_text({field})), '{weight}')"
+        for field, weight in search_fields.items()
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for statement in SEARCH_TEXT_FUNCTIONS:
+        op.execute(statement)
+
+    inspector = sa.inspect(op.get_bind())
+    for table_name, search_fields in SEARCH_TABLES.items():
+        # Новые таблицы создаются приложением сразу с колонкой и индексами
+        if not inspector.has_table(table_name):
+            continue
+
+        columns = {column["name"] for column in inspector.get_columns(table_name)}
+        if "search_vector" not in columns:
+            op.add_column(
+                table_name,
+                sa.Column(
+                    "search_vector",
+                    postgresql.TSVECTOR(),
+                    sa.Computed(
+                        build_search_vector_expression(search_fields),
+                        persisted=True,
+                    ),
+                ),
+            )
+
+        indexes = {index["name"] for index in inspector.get_indexes(table_name)}
+        index_name = get_index_name(table_name, "search_vector")
+        if index_name not in indexes:
+            op.create_index(
+                index_name,
+                table_name,
+                ["search_vector"],
+                postgresql_using="gin",
+            )
+
+        # Триграммные индексы заголовков для подсказок
+        for field, weight in search_fields.items():
+            index_name = get_index_name(table_name, f"{field}_trgm")
+            if weight == "A" and index_name not in indexes:
+                op.create_index(
+                    index_name,
+                    table_name,
+                    [field],
+                    postgresql_using="gin",
+                    postgresql_ops={field: "gin_trgm_ops"},
+                )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    for table_name, search_fields in SEARCH_TABLES.items():
+        if not inspector.has_table(table_name):
+            continue
+
+        indexes = {index["name"] for index in inspector.get_indexes(table_name)}
+        for field, weight in search_fields.items():
+            index_name = get_index_name(table_name, f"{field}_trgm")
+            if weight == "A" and index_name in indexes:
+                op.drop_index(index_name, table_name=table_name)
+
+        # Индекс по колонке удаляется вместе с ней
+        columns = {column["name"] for column in inspector.get_columns(table_name)}
+        if "search_vector" in columns:
+            op.drop_column(table_name, "search_vector")
@@ -0,0 +1,56 @@
+"""add keywords indexes
+
+Revision ID: 820bcb07e5f7
+Revises: 2b96e32204f1
+Create Date: 2026-10-19 17:40:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "820bcb07e5f7"
+down_revision: Union[str, Sequence[str], None] = "2b96e32204f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# GIN индексы для фильтрации по ключевым словам (оператор @>)
+KEYWORDS_INDEXES = {
+    "ix_news_keywords": "news",
+    "ix_projects_keywords": "projects",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    for index_name, table_name in KEYWORDS_INDEXES.items():
+        # Новые таблицы создаются приложением сразу с индексом
+        if not inspector.has_table(table_name):
+            continue
+
+        indexes = {index["name"] for index in inspector.get_indexes(table_name)}
+        if index_name not in indexes:
+            op.create_index(
+                index_name,
+                table_name,
+                ["keywords"],
+                postgresql_using="gin",
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    for index_name, table_name in KEYWORDS_INDEXES.items():
+        if not inspector.has_table(table_name):
+            continue
+
+        indexes = {index["name"] for index in inspector.get_indexes(table_name)}
+        if index_name in indexes:
+            op.drop_index(index_name, table_name=table_name)
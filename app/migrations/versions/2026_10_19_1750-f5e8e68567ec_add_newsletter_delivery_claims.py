@@ -0,0 +1,67 @@
+"""add newsletter delivery claims
+
+Revision ID: f5e8e68567ec
+Revises: 820bcb07e5f7
+Create Date: 2026-10-19 17:50:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f5e8e68567ec"
+down_revision: Union[str, Sequence[str], None] = "820bcb07e5f7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+
+    # Новые таблицы создаются приложением сразу с колонкой и индексом
+    if inspector.has_table("newsletter_deliveries"):
+        columns = {
+            column["name"] for column in inspector.get_columns("newsletter_deliveries")
+        }
+        if "claimed_at" not in columns:
+            op.add_column(
+                "newsletter_deliveries",
+                sa.Column(
+                    "claimed_at",
+                    sa.DateTime(timezone=True),
+                    server_default=sa.func.now(),
+                    nullable=False,
+                ),
+            )
+
+    # Рассылка читает подписчиков типа новостей страницами по (type_id, id)
+    if inspector.has_table("subscribers"):
+        indexes = {index["name"] for index in inspector.get_indexes("subscribers")}
+        if "ix_subscribers_type_id_id" not in indexes:
+            op.create_index(
+                "ix_subscribers_type_id_id",
+                "subscribers",
+                ["type_id", "id"],
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+
+    if inspector.has_table("subscribers"):
+        indexes = {index["name"] for index in inspector.get_indexes("subscribers")}
+        if "ix_subscribers_type_id_id" in indexes:
+            op.drop_index("ix_subscribers_type_id_id", table_name="subscribers")
+
+    if inspector.has_table("newsletter_deliveries"):
+        columns = {
+            column["name"] for column in inspector.get_columns("newsletter_deliveries")
+        }
+        if "claimed_at" in columns:
+            op.drop_column("newsletter_deliveries", "claimed_at")
@@ -0,0 +1,72 @@
+"""add search keywords ref_count
+
+Revision ID: 3e17b4b757eb
+Revises: f5e8e68567ec
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3e17b4b757eb"
+down_revision: Union[str, Sequence[str], None] = "f5e8e68567ec"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Количество новостей и активных проектов с каждым ключевым словом.
+# Нормализация повторяет normalize_search_text (для точного пересчета
+# по правилам приложения есть rebuild_search_keywords.py)
+RECOUNT_REF_COUNT = """
+WITH item_keywords AS (
+    SELECT id, unnest(keywords) AS keyword FROM news
+    UNION ALL
+    SELECT id, unnest(keywords) FROM projects WHERE is_active
+),
+used AS (
+    SELECT DISTINCT id, btrim(regexp_replace(
+        replace(lower(keyword), 'ё', 'е'), '\\s+', ' ', 'g'
+    )) AS keyword
+    FROM item_keywords
+)
+UPDATE searchkeywords
+SET ref_count = counts.ref_count
+FROM (SELECT keyword, count(*) AS ref_count FROM used GROUP BY keyword) AS counts
+WHERE searchkeywords.keyword = counts.keyword
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    # Новая таблица создается приложением сразу с колонкой
+    if not inspector.has_table("searchkeywords"):
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("searchkeywords")}
+    if "ref_count" in columns:
+        return
+
+    op.add_column(
+        "searchkeywords",
+        sa.Column("ref_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute(RECOUNT_REF_COUNT)
+    # Слова, которых больше нет ни в одном материале
+    op.execute("DELETE FROM searchkeywords WHERE ref_count <= 0")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("searchkeywords"):
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("searchkeywords")}
+    if "ref_count" in columns:
+        op.drop_column("searchkeywords", "ref_count")
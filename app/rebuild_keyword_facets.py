@@ -0,0 +1,38 @@
+import asyncio
+from collections import Counter
+
+from sqlalchemy import select, delete, func
+
+from core.db_helper import db_helper
+from core.models import KeywordFacet
+from core.models.keyword_facet import FACET_SCOPES, apply_facet_deltas, get_facet_keys
+
+
+async def rebuild_keyword_facets() -> int:
+    """Пересчет счетчиков ключевых слов по всем новостям и проектам"""
+    async with db_helper.engine.begin() as conn:
+        await conn.execute(delete(KeywordFacet))
+
+        counts = Counter()
+        for model, (_, scopes) in FACET_SCOPES.items():
+            fields = ("keywords", *scopes)
+            rows = await conn.execute(
+                select(*(getattr(model, field) for field in fields))
+            )
+            for row in rows:
+                counts.update(get_facet_keys(model, dict(zip(fields, row))))
+
+        await conn.run_sync(apply_facet_deltas, counts)
+        return await conn.scalar(select(func.count()).select_from(KeywordFacet))
+
+
+async def main():
+    try:
+        facets_count = await rebuild_keyword_facets()
+        print(f"Счетчиков ключевых слов: {facets_count}")
+    finally:
+        await db_helper.engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,43 @@
+import asyncio
+from datetime import date
+
+from sqlalchemy import select, delete, func
+
+from core.db_helper import db_helper
+from core.models import News, Project, SearchKeyword
+from core.models.search_keyword import sync_search_keywords
+
+
+async def rebuild_search_keywords() -> int:
+    """
+    Пересоздание справочника ключевых слов для подсказок по всем новостям и проектам
+
+    Нужно для уже существующих данных и для удаления слов, которые больше
+    не используются ни в одном материале
+    """
+    async with db_helper.engine.begin() as conn:
+        await conn.execute(delete(SearchKeyword))
+
+        news_rows = await conn.execute(select(News.keywords, News.news_date))
+        for keywords, news_date in news_rows:
+            await conn.run_sync(sync_search_keywords, keywords, news_date)
+
+        project_rows = await conn.execute(
+            select(Project.keywords).where(Project.is_active.is_(True))
+        )
+        for (keywords,) in project_rows:
+            await conn.run_sync(sync_search_keywords, keywords, date.today())
+
+        return await conn.scalar(select(func.count()).select_from(SearchKeyword))
+
+
+async def main():
+    try:
+        keywords_count = await rebuild_search_keywords()
+        print(f"Ключевых слов в справочнике подсказок: {keywords_count}")
+    finally:
+        await db_helper.engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
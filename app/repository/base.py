@@ -3,6 +3,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeMeta
 
 from core.models.mixins.id import IdMixin
+from core.models.mixins.search import SEARCH_CONFIG
+from core.search.prefix_index import prefix_index
+from core.search.normalize import normalize_search_text
+from core.search.cache import search_cache
 
 
 class BaseRepository:
@@ -28,8 +32,23 @@ class BaseRepository:
 
         await self.session.commit()
         await self.session.refresh(obj)
+        self._after_write([obj])
         return obj
 
+    async def create_many(self, items: list[dict]) -> list:
+        """
+        Создание нескольких объектов в одной транзакции
+
+        :param items: Список значений полей для каждого объекта
+        :return: Список созданных объектов
+        """
+        objs = [self.model(**item) for item in items]
+        self.session.add_all(objs)
+
+        await self.session.commit()
+        self._after_write(objs)
+        return objs
+
     async def update(self, obj_id: str, **kwargs) -> object:
         obj = await self.get_by_id(obj_id)
         if obj:
@@ -39,6 +58,7 @@ class BaseRepository:
 
             await self.session.commit()
             await self.session.refresh(obj)
+            self._after_write([obj])
         return obj
 
     async def delete(self, obj_id: str) -> bool:
@@ -46,9 +66,16 @@ class BaseRepository:
         if obj:
             await self.session.delete(obj)
             await self.session.commit()
+            self._after_write([obj], deleted=True)
             return True
         return False
 
+    def _after_write(self, objs: list, deleted: bool = False):
+        """Обновление поисковых структур в памяти после изменения данных"""
+        prefix_index.on_write(self.model, objs, deleted=deleted)
+        if hasattr(self.model, "search_vector"):
+            search_cache.invalidate()
+
     async def find_one(self, **args):
         stmt = select(self.model)
         for key, value in args.items():
@@ -65,6 +92,23 @@ class BaseRepository:
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def find_by_keywords(self, keywords: list[str], **args) -> list:
+        """
+        Объекты, у которых есть все указанные ключевые слова
+
+        Условие keywords @> ARRAY[...] использует GIN индекс по ключевым словам
+
+        :param keywords: Ключевые слова
+        :param args: Дополнительные условия на равенство полей
+        :return: Список найденных объектов
+        """
+        stmt = select(self.model).where(self.model.keywords.contains(keywords))
+        for key, value in args.items():
+            if hasattr(self.model, key):
+                stmt = stmt.where(getattr(self.model, key) == value)
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
     async def get_all_active(self) -> list:
         if hasattr(self.model, "is_active"):
             stmt = select(self.model).where(self.model.is_active.is_(True))
@@ -84,6 +128,32 @@ class BaseRepository:
         if not query or not search_fields:
             return []
 
+        stmt = self._build_search_stmt(query, search_fields)
+        if stmt is None:
+            return []
+
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    def _build_search_stmt(self, query: str, search_fields: list[str]):
+        """
+        Запрос поиска по модели
+
+        Для моделей с полнотекстовым индексом (search_vector) используется
+        websearch_to_tsquery с ранжированием по ts_rank_cd, для остальных -
+        регистронезависимый поиск подстроки по указанным полям
+        """
+        if hasattr(self.model, "search_vector"):
+            # Вектор строится из текста с "ё", замененной на "е", запрос приводится так же
+            ts_query = func.websearch_to_tsquery(
+                SEARCH_CONFIG, normalize_search_text(query)
+            )
+            return (
+                select(self.model)
+                .where(self.model.search_vector.bool_op("@@")(ts_query))
+                .order_by(func.ts_rank_cd(self.model.search_vector, ts_query).desc())
+            )
+
         # Создаем условие поиска по всем указанным полям
         conditions = []
         for field_name in search_fields:
@@ -94,12 +164,10 @@ class BaseRepository:
                     conditions.append(field.ilike(f"%{query}%"))
 
         if not conditions:
-            return []
+            return None
 
         # Объединяем условия через OR
-        stmt = select(self.model).where(or_(*conditions))
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+        return select(self.model).where(or_(*conditions))
 
     async def filter_by(self, **filters) -> list:
         """
@@ -156,24 +224,13 @@ class BaseRepository:
             # Если нет запроса или полей для поиска, возвращаем все объекты с пагинацией
             return await self.paginate(page, size)
 
-        # Создаем условие поиска по всем указанным полям
-        conditions = []
-        for field_name in search_fields:
-            if hasattr(self.model, field_name):
-                field = getattr(self.model, field_name)
-                # Для текстовых полей используем ilike (регистронезависимый поиск)
-                if hasattr(field, "ilike"):
-                    conditions.append(field.ilike(f"%{query}%"))
-
-        if not conditions:
+        stmt = self._build_search_stmt(query, search_fields)
+        if stmt is None:
             # Если нет условий поиска, возвращаем все объекты с пагинацией
             return await self.paginate(page, size)
 
-        # Объединяем условия через OR
-        stmt = select(self.model).where(or_(*conditions))
-
         # Получаем общее количество объектов
-        count_stmt = select(func.count()).select_from(stmt.subquery())
+        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
         count_result = await self.session.execute(count_stmt)
         total = count_result.scalar_one()
 
@@ -0,0 +1,126 @@
+import os
+import socket
+import tempfile
+import uuid
+from pathlib import Path
+
+import pytest
+from aiosmtpd.controller import Controller
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from moto.server import ThreadedMotoServer
+
+# Настройки читаются при импорте приложения, поэтому окружение задается
+# до импорта модулей: значения берутся из .env.example, а ключи JWT и папка
+# загрузок создаются во временной папке
+ENV_EXAMPLE_PATH = Path(__file__).parent.parent.parent / ".env.example"
+TEST_DIR = Path(tempfile.mkdtemp(prefix="eskro-tests-"))
+
+
+def load_env_example():
+    for line in ENV_EXAMPLE_PATH.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        os.environ.setdefault(key, value.strip('"'))
+
+
+def create_jwt_keys() -> tuple[Path, Path]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_key_path = TEST_DIR / "jwt-private.pem"
+    public_key_path = TEST_DIR / "jwt-public.pem"
+    private_key_path.write_bytes(
+        private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+    )
+    public_key_path.write_bytes(
+        private_key.public_key().public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+    )
+    return private_key_path, public_key_path
+
+
+private_key_path, public_key_path = create_jwt_keys()
+os.environ["AUTH__PRIVATE_KEY_PATH"] = str(private_key_path)
+os.environ["AUTH__PUBLIC_KEY_PATH"] = str(public_key_path)
+os.environ["FILE__UPLOADS_DIR"] = str(TEST_DIR / "uploads")
+os.environ["DB__ECHO"] = "false"
+load_env_example()
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class RecordingSMTPHandler:
+    """Обработчик локального SMTP сервера, сохраняющий принятые письма"""
+
+    def __init__(self):
+        self.envelopes = []
+        # Получатели, письмо которым сервер один раз отклонит временной ошибкой
+        self.temporary_failures: set[str] = set()
+
+    async def handle_DATA(self, server, session, envelope):
+        for recipient in envelope.rcpt_tos:
+            if recipient in self.temporary_failures:
+                self.temporary_failures.discard(recipient)
+                return "451 Temporary local problem, try again later"
+
+        self.envelopes.append(envelope)
+        return "250 Message accepted for delivery"
+
+
+@pytest.fixture
+def smtp_sink():
+    """Локальный SMTP сервер (aiosmtpd), принимающий письма без отправки"""
+    handler = RecordingSMTPHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=get_free_port())
+    controller.start()
+    yield controller
+    controller.stop()
+
+
+@pytest.fixture(scope="session")
+def s3_server():
+    """Локальный S3 сервер (moto), адрес передается как s3_endpoint_url"""
+    port = get_free_port()
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=port, verbose=False)
+    server.start()
+    yield f"http://127.0.0.1:{port}"
+    server.stop()
+
+
+@pytest.fixture
+async def s3_storage(s3_server):
+    """S3 хранилище с отдельным пустым бакетом на локальном сервере"""
+    # Модули приложения импортируются после настройки окружения выше
+    from core.config import StorageConfig
+    from core.file.storage import S3StorageBackend
+
+    config = StorageConfig(
+        backend="s3",
+        s3_endpoint_url=s3_server,
+        s3_bucket=f"test-{uuid.uuid4().hex}",
+        s3_access_key="test",
+        s3_secret_key="test",
+        # Минимальный размер части multipart загрузки в S3
+        s3_part_size=5 * 1024 * 1024,
+    )
+    backend = S3StorageBackend(config)
+    client = await backend._get_client()
+    await client.create_bucket(Bucket=config.s3_bucket)
+    yield backend
+    await backend.close()
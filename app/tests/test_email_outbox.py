@@ -0,0 +1,136 @@
+import email
+import socket
+import uuid
+from datetime import datetime, timezone
+from email.policy import default as default_policy
+
+import pytest
+from fastapi_mail import ConnectionConfig, FastMail
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.email.outbox import TOKEN_LINKS_KEY, build_email_context
+from core.email.service import EmailService, email_service
+from core.email.worker import EmailOutboxWorker
+from core.models import EmailOutbox
+from security.utils import decode_jwt
+
+
+class InMemoryOutboxWorker(EmailOutboxWorker):
+    """Воркер с очередью в памяти вместо таблицы email_outbox"""
+
+    def __init__(self, emails: list[EmailOutbox]):
+        super().__init__()
+        self.emails = emails
+        self.results = {}
+
+    async def _claim_batch(self) -> list[EmailOutbox]:
+        emails, self.emails = self.emails, []
+        for outbox_email in emails:
+            outbox_email.attempts += 1
+        return emails
+
+    async def _save_results(self, results):
+        for outbox_email, error in results:
+            self.results[outbox_email.recipient] = error
+
+
+def make_fast_mail(hostname: str, port: int) -> FastMail:
+    return FastMail(
+        ConnectionConfig(
+            MAIL_USERNAME="",
+            MAIL_PASSWORD="",
+            MAIL_FROM=settings.email.mail_from,
+            MAIL_PORT=port,
+            MAIL_SERVER=hostname,
+            MAIL_STARTTLS=False,
+            MAIL_SSL_TLS=False,
+            USE_CREDENTIALS=False,
+            VALIDATE_CERTS=False,
+        )
+    )
+
+
+@pytest.fixture
+def sink_mail(smtp_sink, monkeypatch):
+    monkeypatch.setattr(
+        EmailService, "fast_mail", make_fast_mail(smtp_sink.hostname, smtp_sink.port)
+    )
+    return smtp_sink.handler
+
+
+def queue_password_email(recipient: str, user_id: uuid.UUID) -> EmailOutbox:
+    session = AsyncSession()
+    outbox_email = email_service.queue_changing_password_url(
+        session=session,
+        email=recipient,
+        user_id=user_id,
+    )
+    outbox_email.attempts = 0
+    outbox_email.next_attempt_at = datetime.now(timezone.utc)
+    return outbox_email
+
+
+def get_html(envelope) -> str:
+    message = email.message_from_bytes(envelope.content, policy=default_policy)
+    return message.get_body(preferencelist=("html",)).get_content()
+
+
+def test_token_is_not_stored_in_outbox():
+    user_id = uuid.uuid4()
+    outbox_email = queue_password_email("user@example.com", user_id)
+
+    link = outbox_email.context[TOKEN_LINKS_KEY]["changing_password_url"]
+    assert link["payload"] == {"sub": str(user_id), "email": "user@example.com"}
+    assert "token=" not in str(outbox_email.context)
+
+
+def test_token_is_signed_when_email_is_built():
+    user_id = uuid.uuid4()
+    outbox_email = queue_password_email("user@example.com", user_id)
+
+    context = build_email_context(outbox_email.context)
+
+    url = context["changing_password_url"]
+    assert url.startswith(f"{settings.frontend.changing_password_url}/?token=")
+    payload = decode_jwt(token=url.split("token=", 1)[1])
+    assert payload["sub"] == str(user_id)
+    assert TOKEN_LINKS_KEY not in context
+
+
+@pytest.mark.anyio
+async def test_worker_sends_batch_to_smtp_server(sink_mail):
+    emails = [
+        queue_password_email(f"user{index}@example.com", uuid.uuid4())
+        for index in range(3)
+    ]
+    worker = InMemoryOutboxWorker(emails)
+
+    processed = await worker.process_batch()
+
+    assert processed == 3
+    assert worker.results == {outbox_email.recipient: None for outbox_email in emails}
+    assert sorted(envelope.rcpt_tos[0] for envelope in sink_mail.envelopes) == [
+        "user0@example.com",
+        "user1@example.com",
+        "user2@example.com",
+    ]
+    for envelope in sink_mail.envelopes:
+        assert f"{settings.frontend.changing_password_url}/?token=" in get_html(
+            envelope
+        )
+
+
+@pytest.mark.anyio
+async def test_worker_records_error_when_smtp_server_is_down(monkeypatch):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    monkeypatch.setattr(EmailService, "fast_mail", make_fast_mail("127.0.0.1", port))
+    worker = InMemoryOutboxWorker(
+        [queue_password_email("user@example.com", uuid.uuid4())]
+    )
+
+    await worker.process_batch()
+
+    assert worker.results["user@example.com"] is not None
@@ -0,0 +1,43 @@
+import pytest
+from fastapi import HTTPException
+
+from api.email_templates.schemas import EmailTemplateUpdate
+from core.email.template_service import EmailTemplateService
+
+TEMPLATE = """{% extends "base.html" %} {% block style %}
+<style>
+  .title { color: blue; }
+</style>
+{% endblock %} {% block body %}
+<h1 class="title">{{ title }}</h1>
+{% endblock %}
+"""
+
+
+@pytest.fixture
+def template_service(tmp_path) -> EmailTemplateService:
+    (tmp_path / "mailing.html").write_text(TEMPLATE, encoding="utf-8")
+    return EmailTemplateService(tmp_path)
+
+
+@pytest.mark.anyio
+async def test_update_template(template_service):
+    await template_service.update_template_content(
+        EmailTemplateUpdate(body="<p>{{ text }}</p>"), "mailing.html"
+    )
+
+    content = (template_service.templates_dir / "mailing.html").read_text("utf-8")
+    assert "<p>{{ text }}</p>" in content
+
+
+@pytest.mark.anyio
+async def test_template_with_syntax_error_is_not_saved(template_service):
+    with pytest.raises(HTTPException) as exc_info:
+        await template_service.update_template_content(
+            EmailTemplateUpdate(body="<p>{% if text %}{{ text }}</p>"),
+            "mailing.html",
+        )
+
+    assert exc_info.value.status_code == 400
+    content = (template_service.templates_dir / "mailing.html").read_text("utf-8")
+    assert content == TEMPLATE
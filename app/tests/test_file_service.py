@@ -0,0 +1,54 @@
+import io
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from PIL import Image
+from starlette.datastructures import Headers
+
+from core.file.service import file_service, PARTICIPANTS_IMAGES_FOLDER
+
+
+def make_image_upload(image_format: str, content_type: str) -> UploadFile:
+    buffer = io.BytesIO()
+    Image.new("RGB", (8, 8), "red").save(buffer, format=image_format)
+    buffer.seek(0)
+    return UploadFile(
+        file=buffer,
+        filename=f"photo.{image_format.lower()}",
+        headers=Headers({"content-type": content_type}),
+    )
+
+
+@pytest.mark.anyio
+async def test_participant_batch_folder_accepts_images(tmp_path):
+    # Пакетная загрузка участников сохраняет фотографии в папку изображений
+    allowed_types = file_service._get_allowed_types(PARTICIPANTS_IMAGES_FOLDER)
+    uploads = [
+        make_image_upload("JPEG", "image/jpeg"),
+        make_image_upload("PNG", "image/png"),
+    ]
+
+    for index, upload_file in enumerate(uploads):
+        streamed_file = await file_service._write_file_stream(
+            upload_file=upload_file,
+            path=tmp_path / f"{index}.part",
+            allowed_types=allowed_types,
+        )
+        assert streamed_file.content_type == upload_file.content_type
+
+
+@pytest.mark.anyio
+async def test_content_not_matching_declared_type_is_rejected(tmp_path):
+    upload_file = UploadFile(
+        file=io.BytesIO(b"<html><script>alert(1)</script></html>"),
+        filename="photo.png",
+        headers=Headers({"content-type": "image/png"}),
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await file_service._write_file_stream(
+            upload_file=upload_file,
+            path=tmp_path / "photo.part",
+            allowed_types=None,
+        )
+    assert exc_info.value.status_code == 400
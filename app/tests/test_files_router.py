@@ -0,0 +1,137 @@
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from api.files.router import router, _offload_response
+from core.config import settings
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    app.include_router(router, prefix="/files")
+    return TestClient(app)
+
+
+@pytest.fixture
+def upload(request):
+    """Файл в папке загрузок: (путь относительно папки, содержимое)"""
+    relative_path, content = request.param
+    path = settings.file.uploads_dir / relative_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    yield relative_path
+    path.unlink()
+
+
+@pytest.mark.parametrize(
+    "upload",
+    [("images/test/drawing.svg", b'<svg xmlns="http://www.w3.org/2000/svg"/>')],
+    indirect=True,
+)
+def test_svg_is_served_as_sandboxed_attachment(client, upload):
+    response = client.get(f"/files/{upload}/")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/svg+xml"
+    assert response.headers["content-disposition"].startswith("attachment;")
+    assert response.headers["content-security-policy"] == "sandbox"
+
+
+@pytest.mark.parametrize(
+    "upload",
+    [("documents/test/report.pdf", b"%PDF-1.4\n%%EOF\n")],
+    indirect=True,
+)
+def test_pdf_is_served_inline(client, upload):
+    response = client.get(f"/files/{upload}/")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.headers["content-disposition"].startswith("inline;")
+    assert "content-security-policy" not in response.headers
+
+
+@pytest.mark.parametrize(
+    "upload",
+    [("images/test/photo.png", b"\x89PNG\r\n\x1a\n")],
+    indirect=True,
+)
+def test_original_instead_of_missing_variant_is_not_immutable(client, upload):
+    response = client.get(f"/files/{upload}/", params={"w": 320})
+    assert response.headers["cache-control"] == "public, max-age=300"
+
+    response = client.get(f"/files/{upload}/")
+    assert "immutable" in response.headers["cache-control"]
+
+
+@pytest.mark.parametrize(
+    "upload",
+    [("images/test/icon.svg", b'<svg xmlns="http://www.w3.org/2000/svg"/>')],
+    indirect=True,
+)
+def test_vary_lists_all_negotiated_headers(client, upload):
+    response = client.get(f"/files/{upload}/", params={"w": 320})
+    assert response.headers["vary"] == "Accept, Accept-Encoding"
+
+
+@pytest.mark.parametrize(
+    "upload",
+    [("documents/test/report.pdf", b"%PDF-1.4\n%%EOF\n")],
+    indirect=True,
+)
+def test_x_accel_redirect_offload(client, upload, monkeypatch):
+    monkeypatch.setattr(settings.file, "offload_mode", "x-accel-redirect")
+
+    response = client.get(f"/files/{upload}/")
+
+    assert response.status_code == 200
+    assert response.content == b""
+    assert response.headers["x-accel-redirect"] == (
+        f"{settings.file.offload_internal_prefix}{upload}"
+    )
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.headers["content-disposition"] == 'inline; filename="report.pdf"'
+
+
+def test_x_accel_redirect_path_is_resolved(monkeypatch):
+    monkeypatch.setattr(settings.file, "offload_mode", "x-accel-redirect")
+
+    response = _offload_response(
+        settings.file.uploads_dir / "images" / ".." / "documents" / "report.pdf",
+        media_type="application/pdf",
+        content_disposition_type="inline",
+        headers={},
+    )
+
+    assert response.headers["x-accel-redirect"] == (
+        f"{settings.file.offload_internal_prefix}documents/report.pdf"
+    )
+
+
+def test_x_accel_redirect_rejects_path_outside_uploads(monkeypatch):
+    monkeypatch.setattr(settings.file, "offload_mode", "x-accel-redirect")
+
+    with pytest.raises(HTTPException) as exc_info:
+        _offload_response(
+            settings.file.uploads_dir / ".." / "secret.txt",
+            media_type="text/plain",
+            content_disposition_type="attachment",
+            headers={},
+        )
+    assert exc_info.value.status_code == 400
+
+
+def test_file_deleted_by_another_process_is_not_found(client):
+    # Метаданные файла остаются в кеше, если файл удален другим процессом
+    relative_path = "documents/test/removed.pdf"
+    path = settings.file.uploads_dir / relative_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"%PDF-1.4\n%%EOF\n")
+    assert client.get(f"/files/{relative_path}/").status_code == 200
+
+    path.unlink()
+    response = client.get(f"/files/{relative_path}/")
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "File not found"}
@@ -0,0 +1,15 @@
+from core.file.mime import detect_media_type
+
+
+def test_detects_type_by_signature():
+    assert detect_media_type(b"\x89PNG\r\n\x1a\n...", "image/jpeg") == "image/png"
+
+
+def test_declared_type_without_signature_is_used():
+    assert detect_media_type(b"plain text", "text/plain") == "text/plain"
+
+
+def test_declared_type_with_missing_signature_is_rejected():
+    html = b"<html><script>alert(1)</script></html>"
+    assert detect_media_type(html, "image/png") is None
+    assert detect_media_type(html, "application/pdf; charset=binary") is None
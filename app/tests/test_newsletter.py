@@ -0,0 +1,171 @@
+import email
+import uuid
+from datetime import datetime, timedelta, timezone
+from email.policy import default as default_policy
+from types import SimpleNamespace
+
+import pytest
+
+from core.config import settings
+from core.email.newsletter import NewsletterEngine, MailingInterrupted
+from core.models.newsletter import (
+    DELIVERY_CLAIMED,
+    DELIVERY_SENT,
+    DELIVERY_UNKNOWN,
+    get_news_mailing_values,
+)
+
+
+class InMemoryNewsletterEngine(NewsletterEngine):
+    """Движок рассылки с подписчиками и отметками в памяти вместо базы"""
+
+    def __init__(self, subscribers: list[tuple[uuid.UUID, str]]):
+        super().__init__()
+        self.chunk_size = 2
+        self.rate_limit = 0
+        self.subscribers = sorted(subscribers)
+        # subscriber_id -> [статус, время отметки]
+        self.deliveries: dict[uuid.UUID, list] = {}
+        self.finished = False
+
+    async def _mark_unknown_deliveries(self, mailing, claimed_before) -> int:
+        count = 0
+        for delivery in self.deliveries.values():
+            if delivery[0] == DELIVERY_CLAIMED and delivery[1] < claimed_before:
+                delivery[0] = DELIVERY_UNKNOWN
+                count += 1
+        return count
+
+    async def _read_chunk(self, mailing, last_subscriber_id) -> list:
+        return [
+            subscriber
+            for subscriber in self.subscribers
+            if last_subscriber_id is None or subscriber[0] > last_subscriber_id
+        ][: self.chunk_size]
+
+    async def _claim_deliveries(self, mailing, subscriber_ids) -> set[uuid.UUID]:
+        claimed = set()
+        for subscriber_id in subscriber_ids:
+            if subscriber_id not in self.deliveries:
+                self.deliveries[subscriber_id] = [
+                    DELIVERY_CLAIMED,
+                    datetime.now(timezone.utc),
+                ]
+                claimed.add(subscriber_id)
+        return claimed
+
+    async def _save_chunk_results(
+        self, mailing, by_status, retry_ids, checkpoint_subscriber_id
+    ):
+        for status, subscriber_ids in by_status.items():
+            for subscriber_id in subscriber_ids:
+                self.deliveries[subscriber_id][0] = status
+        for subscriber_id in retry_ids:
+            del self.deliveries[subscriber_id]
+        if checkpoint_subscriber_id is not None:
+            mailing.checkpoint_subscriber_id = checkpoint_subscriber_id
+
+    async def _postpone(self, mailing):
+        pass
+
+    async def _finish(self, mailing):
+        self.finished = True
+
+
+@pytest.fixture
+def newsletter_smtp(smtp_sink, monkeypatch):
+    for name, value in dict(
+        server=smtp_sink.hostname,
+        port=smtp_sink.port,
+        starttls=False,
+        ssl_tls=False,
+        use_credentials=False,
+    ).items():
+        monkeypatch.setattr(settings.email, name, value)
+    return smtp_sink.handler
+
+
+def make_mailing() -> SimpleNamespace:
+    news = SimpleNamespace(
+        type_id=uuid.uuid4(),
+        title="Итоги конкурса",
+        min_text="Объявлены победители",
+        news_url="https://example.com/news/1",
+    )
+    return SimpleNamespace(
+        id=uuid.uuid4(), checkpoint_subscriber_id=None, **get_news_mailing_values(news)
+    )
+
+
+def make_subscribers(count: int) -> list[tuple[uuid.UUID, str]]:
+    """Подписчики по порядку id, как их читает рассылка"""
+    return sorted((uuid.uuid4(), f"user{index}@example.com") for index in range(count))
+
+
+def get_recipients(handler) -> list[str]:
+    return sorted(
+        recipient for envelope in handler.envelopes for recipient in envelope.rcpt_tos
+    )
+
+
+@pytest.mark.anyio
+async def test_mailing_is_sent_to_every_subscriber(newsletter_smtp):
+    subscribers = make_subscribers(5)
+    engine = InMemoryNewsletterEngine(subscribers)
+
+    report = await engine.run_mailing(make_mailing())
+
+    assert report.sent_count == 5
+    assert report.failed_count == 0
+    assert report.emails_per_second > 0
+    assert engine.finished
+    assert get_recipients(newsletter_smtp) == sorted(
+        address for _, address in subscribers
+    )
+    # Адрес подставляется в отрендеренный один раз шаблон для каждого письма
+    for envelope in newsletter_smtp.envelopes:
+        message = email.message_from_bytes(envelope.content, policy=default_policy)
+        assert envelope.rcpt_tos[0] in message.get_content()
+
+
+@pytest.mark.anyio
+async def test_interrupted_mailing_resumes_without_duplicates(newsletter_smtp):
+    subscribers = make_subscribers(5)
+    engine = InMemoryNewsletterEngine(subscribers)
+    mailing = make_mailing()
+    # Письмо третьему подписчику (вторая пачка) сервер временно не принимает
+    newsletter_smtp.temporary_failures.add(subscribers[2][1])
+
+    with pytest.raises(MailingInterrupted):
+        await engine.run_mailing(mailing)
+
+    assert mailing.checkpoint_subscriber_id == subscribers[1][0]
+    assert not engine.finished
+
+    await engine.run_mailing(mailing)
+
+    assert engine.finished
+    # Каждый подписчик получил письмо ровно один раз
+    assert get_recipients(newsletter_smtp) == sorted(
+        address for _, address in subscribers
+    )
+    assert all(status == DELIVERY_SENT for status, _ in engine.deliveries.values())
+
+
+@pytest.mark.anyio
+async def test_claim_of_crashed_run_is_not_resent(newsletter_smtp):
+    subscribers = make_subscribers(3)
+    engine = InMemoryNewsletterEngine(subscribers)
+    # Прежний процесс отметил подписчика и упал до сохранения результата
+    engine.deliveries[subscribers[0][0]] = [
+        DELIVERY_CLAIMED,
+        datetime.now(timezone.utc) - timedelta(minutes=10),
+    ]
+
+    report = await engine.run_mailing(make_mailing())
+
+    assert report.sent_count == 2
+    assert get_recipients(newsletter_smtp) == sorted(
+        address for _, address in subscribers[1:]
+    )
+    assert engine.deliveries[subscribers[0][0]][0] == DELIVERY_UNKNOWN
@@ -0,0 +1,46 @@
+import uuid
+from datetime import date
+from types import SimpleNamespace
+
+from core.models import Project
+from core.search.prefix_index import PrefixIndex
+
+
+def make_project(title: str, is_active: bool = True) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        title=title,
+        keywords=[],
+        created_at=date.today(),
+        is_active=is_active,
+    )
+
+
+def make_index() -> PrefixIndex:
+    return PrefixIndex(max_entries=1000, max_title_words=8, scan_limit=200)
+
+
+def test_inactive_items_are_not_indexed():
+    index = make_index()
+    index.load(
+        {
+            Project: [
+                make_project("Школа наставников"),
+                make_project("Школа вожатых", is_active=False),
+            ]
+        }
+    )
+
+    assert index.suggest("школа", 10) == ["Школа наставников"]
+
+
+def test_deactivated_item_is_removed_from_index():
+    project = make_project("Школа наставников")
+    index = make_index()
+    index.load({Project: [project]})
+
+    project.is_active = False
+    index.on_write(Project, [project])
+
+    assert index.suggest("школа", 10) == []
+    assert len(index) == 0
@@ -0,0 +1,99 @@
+from urllib.parse import urlparse
+
+import aiohttp
+import pytest
+
+from core.file.storage import IMMUTABLE_CACHE_CONTROL
+
+
+async def read_object(storage, key: str) -> bytes:
+    return b"".join([chunk async for chunk in storage.open(key)])
+
+
+async def list_keys(storage) -> list[str]:
+    client = await storage._get_client()
+    response = await client.list_objects_v2(Bucket=storage.config.s3_bucket)
+    return [item["Key"] for item in response.get("Contents", [])]
+
+
+@pytest.mark.anyio
+async def test_small_file_is_put_in_one_request(s3_storage, tmp_path):
+    source_path = tmp_path / "photo.png"
+    source_path.write_bytes(b"\x89PNG\r\n\x1a\n")
+
+    await s3_storage.save("images/photo.png", source_path, "image/png")
+
+    client = await s3_storage._get_client()
+    head = await client.head_object(
+        Bucket=s3_storage.config.s3_bucket, Key="images/photo.png"
+    )
+    assert head["ContentType"] == "image/png"
+    assert head["CacheControl"] == IMMUTABLE_CACHE_CONTROL
+    assert await read_object(s3_storage, "images/photo.png") == b"\x89PNG\r\n\x1a\n"
+
+
+@pytest.mark.anyio
+async def test_large_file_is_uploaded_in_parts(s3_storage, tmp_path):
+    content = bytes(range(256)) * (11 * 1024 * 1024 // 256)
+    source_path = tmp_path / "report.pdf"
+    source_path.write_bytes(content)
+
+    await s3_storage.save("documents/report.pdf", source_path, "application/pdf")
+
+    client = await s3_storage._get_client()
+    head = await client.head_object(
+        Bucket=s3_storage.config.s3_bucket, Key="documents/report.pdf"
+    )
+    # ETag составного объекта заканчивается количеством частей
+    assert head["ETag"].strip('"').endswith("-3")
+    assert await read_object(s3_storage, "documents/report.pdf") == content
+
+
+@pytest.mark.anyio
+async def test_failed_multipart_upload_is_aborted(s3_storage, tmp_path, monkeypatch):
+    source_path = tmp_path / "report.pdf"
+    source_path.write_bytes(b"\0" * (11 * 1024 * 1024))
+
+    client = await s3_storage._get_client()
+    upload_part = client.upload_part
+
+    async def failing_upload_part(**kwargs):
+        if kwargs["PartNumber"] == 2:
+            raise ConnectionError("connection reset")
+        return await upload_part(**kwargs)
+
+    monkeypatch.setattr(client, "upload_part", failing_upload_part)
+
+    with pytest.raises(ConnectionError):
+        await s3_storage.save("documents/report.pdf", source_path)
+
+    uploads = await client.list_multipart_uploads(Bucket=s3_storage.config.s3_bucket)
+    assert uploads.get("Uploads", []) == []
+    assert await list_keys(s3_storage) == []
+
+
+@pytest.mark.anyio
+async def test_delete_removes_object_and_ignores_missing(s3_storage, tmp_path):
+    source_path = tmp_path / "photo.png"
+    source_path.write_bytes(b"\x89PNG\r\n\x1a\n")
+    await s3_storage.save("images/photo.png", source_path)
+
+    await s3_storage.delete("images/photo.png")
+    await s3_storage.delete("images/photo.png")
+
+    assert await list_keys(s3_storage) == []
+
+
+@pytest.mark.anyio
+async def test_presigned_url_downloads_file(s3_storage, tmp_path):
+    source_path = tmp_path / "photo.png"
+    source_path.write_bytes(b"\x89PNG\r\n\x1a\n")
+    await s3_storage.save("images/photo.png", source_path, "image/png")
+
+    url = await s3_storage.get_url("images/photo.png")
+
+    assert urlparse(url).path == f"/{s3_storage.config.s3_bucket}/images/photo.png"
+    async with aiohttp.ClientSession() as http_session:
+        async with http_session.get(url) as response:
+            assert response.status == 200
+            assert await response.read() == b"\x89PNG\r\n\x1a\n"